@@ -1,13 +1,18 @@
 # walkup_all_in_one.py
 # One-file, minimal: download (yt-dlp) + play (VLC) from ./songs/
-# Now with CSV import: ./data/batters.csv  -> auto-download + rename to first_last.mp3
+# Now with CSV import: ./data/batters.csv  -> auto-download + rename to first_last.<ext>
+# Audio keeps YouTube's own format (m4a as is, opus remuxed; AUDIO_CODEC="mp3" converts)
+# Repeat searches come from ./songs/.cache instead of YouTube
+# ./songs is indexed in memory and kept current by a file watcher
+# yt-dlp / VLC load lazily; --no-splash skips the banner, --startup-profile times startup
 #
 # Setup (once):
 #   pip install yt-dlp python-vlc
 #   sudo apt install ffmpeg   # (or brew install ffmpeg / dnf / pacman)
 #   Install VLC app (native), not just Flatpak/Snap if python-vlc can't find libvlc.
 
-import os, time, sys, re, csv
+import os, time, sys, re, csv, uuid, json, shutil, hashlib, threading, struct
+_T0 = time.perf_counter()  # reference point for --startup-profile
 
 BANNER = r"""
         /$$   /$$                     /$$       /$$                    
@@ -71,37 +76,263 @@ SONG_DIR = os.path.join(BASE, "songs")
 DATA_DIR = os.path.join(BASE, "data")
 CSV_BATTERS = os.path.join(DATA_DIR, "batters.csv")
 os.makedirs(SONG_DIR, exist_ok=True)
-EXTS = {".mp3", ".m4a", ".wav", ".flac", ".ogg"}
+EXTS = {".mp3", ".m4a", ".opus", ".wav", ".flac", ".ogg"}
+# "best" keeps the downloaded audio stream (no re-encode); "mp3" converts
+AUDIO_CODEC = "best"
+CACHE_DIR = os.path.join(SONG_DIR, ".cache")   # query -> audio download cache
+CACHE_MAX_MB = 512
+
+# Imports with simple guidance. yt-dlp and VLC are slow to load, so they are
+# only imported when first needed (yt-dlp on download, VLC in the background).
+YoutubeDL = None
+vlc = None
+_import_lock = threading.Lock()
+_loaded = set()
+
+def load_yt_dlp():
+    global YoutubeDL
+    with _import_lock:
+        if "yt_dlp" not in _loaded:
+            _loaded.add("yt_dlp")
+            try:
+                from yt_dlp import YoutubeDL
+            except Exception:
+                YoutubeDL = None
+    if YoutubeDL is None:
+        # every download that needs it says why it can't run
+        print("[!] yt-dlp not installed. Run: pip install yt-dlp")
+    return YoutubeDL
+
+def load_vlc():
+    global vlc
+    with _import_lock:
+        if "vlc" not in _loaded:
+            _loaded.add("vlc")
+            try:
+                import vlc
+            except Exception:
+                vlc = None
+    return vlc
+
+def start_vlc_player():
+    """Create the VLC MediaPlayer on a background thread; returns get_player()."""
+    box = {"player": None, "warned": False}
+    ready = threading.Event()
+    def work():
+        try:
+            if load_vlc(): box["player"] = vlc.MediaPlayer()
+        except Exception as e:
+            print("[!] VLC init failed:", e)
+        finally:
+            startup_marks.append(("libvlc ready", time.perf_counter())); ready.set()
+    threading.Thread(target=work, daemon=True).start()
+    def get_player():
+        ready.wait()
+        if box["player"] is None and not box["warned"]:
+            box["warned"] = True
+            print("[!] python-vlc not installed. Run: pip install python-vlc")
+        return box["player"]
+    return get_player
+
+startup_marks: list[tuple[str, float]] = []
+
+def startup_report():
+    print(f"\n[startup] time to first prompt: {(time.perf_counter() - _T0) * 1000:.1f} ms")
+    prev = _T0
+    for label, t in sorted(startup_marks, key=lambda m: m[1]):
+        print(f"    {label:<18} +{(t - prev) * 1000:7.1f} ms"); prev = t
 
-# Imports with simple guidance
-try:
-    from yt_dlp import YoutubeDL
-except Exception:
-    print("[!] yt-dlp not installed. Run: pip install yt-dlp")
-    YoutubeDL = None
 
-try:
-    import vlc
-except Exception:
-    print("[!] python-vlc not installed. Run: pip install python-vlc")
-    vlc = None
+# ---------- helpers ----------
+class SongLibrary:
+    """
+    In-memory index of the audio files in songs/.
 
+    The folder is scanned once; after that listing, existence and free-name
+    questions are answered from memory. It stays current via inotify on
+    Linux (or by polling the folder's mtime elsewhere), and code that
+    renames/creates files calls sync() so the index is right at once.
+    """
+
+    # inotify event bits (see <sys/inotify.h>)
+    _IN_CLOSE_WRITE = 0x008
+    _IN_MOVED_FROM = 0x040
+    _IN_MOVED_TO = 0x080
+    _IN_CREATE = 0x100
+    _IN_DELETE = 0x200
+
+    def __init__(self, folder: str, exts: set[str], poll_interval: float = 1.0):
+        self.folder = folder
+        self.exts = exts
+        self.poll_interval = poll_interval
+        self._files: dict[str, float] = {}   # name -> mtime
+        self._lower: set[str] = set()
+        self._sorted: list[str] | None = None
+        self._next: dict[str, int] = {}      # name -> next _N suffix to try
+        self._scanned = False
+        self._watching = False
+        self._lock = threading.Lock()
+
+    def _wanted(self, name: str) -> bool:
+        return not name.startswith(".") and os.path.splitext(name)[1].lower() in self.exts
+
+    def _ensure_scanned(self):
+        if not self._scanned:
+            self.rescan()
+
+    def rescan(self):
+        files = {}
+        with os.scandir(self.folder) as it:
+            for entry in it:
+                if self._wanted(entry.name) and entry.is_file():
+                    files[entry.name] = entry.stat().st_mtime
+        with self._lock:
+            self._files = files
+            self._lower = {n.lower() for n in files}
+            self._sorted = None
+            self._scanned = True
+
+    def sync(self, *paths: str):
+        """Re-check specific files (after we renamed/created/deleted them)."""
+        self._ensure_scanned()
+        for path in paths:
+            if path and os.path.dirname(os.path.abspath(path)) == self.folder:
+                self._update(os.path.basename(path))
+
+    def _update(self, name: str):
+        if not self._wanted(name):
+            return
+        try:
+            mtime = os.stat(os.path.join(self.folder, name)).st_mtime
+        except OSError:
+            mtime = None
+        with self._lock:
+            if mtime is None:
+                if self._files.pop(name, None) is not None:
+                    self._lower.discard(name.lower())
+                    self._sorted = None
+            else:
+                if name not in self._files:
+                    self._lower.add(name.lower())
+                    self._sorted = None
+                self._files[name] = mtime
+
+    def list(self) -> list[str]:
+        """Audio file names, sorted case-insensitively (cached between changes)."""
+        self._ensure_scanned()
+        with self._lock:
+            if self._sorted is None:
+                self._sorted = sorted(self._files, key=str.lower)
+            return list(self._sorted)
+
+    def exists(self, name: str) -> bool:
+        self._ensure_scanned()
+        with self._lock:
+            return name in self._files
+
+    def claim(self, name: str) -> str:
+        """
+        Reserve a free file name in the folder and return its full path.
+
+        Tries name, name_1, name_2, ... starting from a per-name counter, so
+        repeated names don't re-probe from _1, and creates an empty
+        placeholder with O_EXCL so nobody else can take the same name.
+        Move the real file over it with os.replace(), or release() it.
+        """
+        self._ensure_scanned()
+        root, ext = os.path.splitext(name)
+        key = name.lower()
+        with self._lock:
+            i = self._next.get(key, 0)
+            while True:
+                candidate = name if i == 0 else f"{root}_{i}{ext}"
+                i += 1
+                if candidate.lower() in self._lower:
+                    continue
+                path = os.path.join(self.folder, candidate)
+                try:
+                    fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                except FileExistsError:
+                    continue
+                os.close(fd)
+                self._next[key] = i
+                self._files[candidate] = time.time()
+                self._lower.add(candidate.lower())
+                self._sorted = None
+                return path
+
+    def release(self, path: str):
+        """Give back a claimed name that was never filled in."""
+        try:
+            if os.path.getsize(path) == 0:
+                os.remove(path)
+        except OSError:
+            pass
+        self.sync(path)
+
+    def start_watching(self):
+        """Keep the index current in a background thread (inotify or polling)."""
+        if self._watching:
+            return
+        self._ensure_scanned()
+        self._watching = True
+        fd = self._inotify_fd()
+        if fd is not None:
+            threading.Thread(target=self._inotify_loop, args=(fd,), daemon=True).start()
+        else:
+            threading.Thread(target=self._poll_loop, daemon=True).start()
+
+    def _inotify_fd(self) -> int | None:
+        if not sys.platform.startswith("linux"):
+            return None
+        try:
+            import ctypes
+            libc = ctypes.CDLL(None, use_errno=True)
+            fd = libc.inotify_init1(0)
+            if fd < 0:
+                return None
+            mask = (self._IN_CLOSE_WRITE | self._IN_MOVED_FROM | self._IN_MOVED_TO
+                    | self._IN_CREATE | self._IN_DELETE)
+            if libc.inotify_add_watch(fd, self.folder.encode(), mask) < 0:
+                os.close(fd)
+                return None
+            return fd
+        except (OSError, AttributeError):
+            return None
+
+    def _inotify_loop(self, fd: int):
+        header = struct.Struct("iIII")
+        while True:
+            try:
+                buf = os.read(fd, 64 * 1024)
+            except OSError:
+                self._poll_loop()
+                return
+            pos = 0
+            while pos + header.size <= len(buf):
+                _wd, _mask, _cookie, length = header.unpack_from(buf, pos)
+                raw = buf[pos + header.size:pos + header.size + length]
+                pos += header.size + length
+                name = raw.split(b"\0", 1)[0].decode(errors="surrogateescape")
+                if name:
+                    self._update(name)
+
+    def _poll_loop(self):
+        last = None
+        while True:
+            try:
+                mtime = os.stat(self.folder).st_mtime_ns
+            except OSError:
+                mtime = None
+            if last is not None and mtime != last:
+                self.rescan()
+            last = mtime
+            time.sleep(self.poll_interval)
+
+song_library = SongLibrary(SONG_DIR, EXTS)
 
-# ---------- helpers ----------
 def list_songs():
-    files = [f for f in os.listdir(SONG_DIR) if os.path.splitext(f)[1].lower() in EXTS]
-    files.sort(key=str.lower)
-    return files
-
-def newest_mp3(dirpath: str) -> str | None:
-    mp3s = [
-        os.path.join(dirpath, f)
-        for f in os.listdir(dirpath)
-        if f.lower().endswith(".mp3")
-    ]
-    if not mp3s:
-        return None
-    return max(mp3s, key=lambda p: os.path.getmtime(p))
+    return song_library.list()
 
 def sanitize_player_name(name: str) -> str:
     """
@@ -113,188 +344,403 @@ def sanitize_player_name(name: str) -> str:
     name = re.sub(r"_+", "_", name).strip("_")
     return name or "player"
 
-def unique_path(path: str) -> str:
-    """If 'path' exists, append _1, _2, ... to make it unique."""
-    if not os.path.exists(path):
-        return path
-    root, ext = os.path.splitext(path)
-    i = 1
-    while True:
-        candidate = f"{root}_{i}{ext}"
-        if not os.path.exists(candidate):
-            return candidate
-        i += 1
-
 def build_query(song: str, artist: str) -> str:
     # Bias toward official audio
     parts = [song.strip(), artist.strip(), "audio"]
     return " ".join([p for p in parts if p])
 
-def download_song(query: str) -> str | None:
+# ---------- download cache ----------
+def normalize_query(query: str) -> str:
+    """'Hotel California  - Eagles' -> 'hotel california eagles' (cache key)."""
+    text = re.sub(r"[\W_]+", " ", query.lower())
+    return " ".join(text.split())
+
+def file_sha256(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+def link_or_copy(src: str, dst: str):
+    """Hardlink src to dst (no extra disk space); copy if links aren't supported."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+class DownloadCache:
     """
-    Search YouTube (first result) and download audio as MP3 into SONG_DIR.
-    Returns the final file path (mp3) or None on failure.
+    Remembers what a search query already downloaded.
+
+    songs/.cache/index.json maps a normalized query to the YouTube video ID
+    and a content-hashed copy of the audio in songs/.cache/. A hit is
+    hardlinked back into songs/ instead of searching/downloading again.
+    The cache stays under max_bytes by dropping least recently used files.
     """
-    if YoutubeDL is None:
-        print("[x] yt-dlp missing. pip install yt-dlp")
-        return None
 
-    before_snapshot = {f: os.path.getmtime(os.path.join(SONG_DIR, f))
-                       for f in os.listdir(SONG_DIR)}
+    def __init__(self, cache_dir: str, max_bytes: int):
+        self.cache_dir = cache_dir
+        self.index_path = os.path.join(cache_dir, "index.json")
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception:
+            data = {}   # missing or corrupt index: start empty
+        if not isinstance(data, dict):
+            data = {}
+        self.queries: dict[str, dict] = data.get("queries", {})
+        self.files: dict[str, dict] = data.get("files", {})
+
+    def checkout(self, query: str, dest_dir: str) -> str | None:
+        """Link the cached audio for query into dest_dir; None on a miss."""
+        key = normalize_query(query)
+        with self._lock:
+            entry = self.queries.get(key)
+            if not entry:
+                return None
+            cached = os.path.join(self.cache_dir, entry["file"])
+            if not os.path.exists(cached):
+                # somebody cleaned the folder by hand
+                self.queries.pop(key, None)
+                self.files.pop(entry["file"], None)
+                self._save()
+                return None
+            ext = os.path.splitext(cached)[1]
+            title = sanitize_player_name(entry.get("title", "")) or "song"
+            target = os.path.join(dest_dir, f"{title}.{uuid.uuid4().hex[:8]}{ext}")
+            try:
+                link_or_copy(cached, target)
+            except OSError as e:
+                print("[!] Cache read failed, downloading instead:", e)
+                return None
+            meta = self.files.setdefault(entry["file"], {"size": os.path.getsize(cached)})
+            meta["used"] = time.time()
+            self._save()
+            return target
+
+    def store(self, query: str, path: str, info: dict | None):
+        """Add a finished download to the cache (content-hashed, deduplicated)."""
+        try:
+            digest = file_sha256(path)
+        except OSError:
+            return
+        fname = digest[:24] + os.path.splitext(path)[1].lower()
+        cached = os.path.join(self.cache_dir, fname)
+        with self._lock:
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                if not os.path.exists(cached):
+                    link_or_copy(path, cached)
+            except OSError as e:
+                print("[!] Could not add download to cache:", e)
+                return
+            info = info or {}
+            self.queries[normalize_query(query)] = {
+                "id": info.get("id"),
+                "title": info.get("title", ""),
+                "file": fname,
+            }
+            self.files[fname] = {"size": os.path.getsize(cached), "used": time.time()}
+            self._evict()
+            self._save()
+
+    def _evict(self):
+        total = sum(f.get("size", 0) for f in self.files.values())
+        for fname in sorted(self.files, key=lambda n: self.files[n].get("used", 0)):
+            if total <= self.max_bytes:
+                break
+            total -= self.files.pop(fname).get("size", 0)
+            try:
+                os.remove(os.path.join(self.cache_dir, fname))
+            except OSError:
+                pass
+            for key in [k for k, e in self.queries.items() if e.get("file") == fname]:
+                del self.queries[key]
+
+    def _save(self):
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(self.index_path, "w", encoding="utf-8") as f:
+                json.dump({"queries": self.queries, "files": self.files}, f, indent=2)
+        except Exception as e:
+            print("[x] Failed to save download cache index:", e)
+
+download_cache = DownloadCache(CACHE_DIR, CACHE_MAX_MB * 1024 * 1024)
+
+# ---------- download ----------
+def job_outtmpl(dest_dir: str) -> str:
+    """Output template unique to one download, so files never collide."""
+    token = uuid.uuid4().hex[:8]
+    return os.path.join(dest_dir, f"%(title)s.{token}.%(ext)s")
+
+def first_entry(info: dict | None) -> dict | None:
+    """ytsearch results come back as a playlist; return the single video."""
+    if info and info.get("entries") is not None:
+        return next((e for e in info["entries"] if e), None)
+    return info
+
+def downloaded_path(info: dict | None, hooked: list[str]) -> str | None:
+    """
+    Final audio file of a download, from the post-processor hook or the
+    info dict yt-dlp returned.
+    """
+    for path in reversed(hooked):
+        if path and os.path.exists(path):
+            return path
+    info = first_entry(info)
+    if not info:
+        return None
+    candidates = [d.get("filepath") for d in info.get("requested_downloads") or []]
+    candidates.append(info.get("filepath"))
+    for path in candidates:
+        if path and os.path.exists(path):
+            return path
+    return None
 
-    opts = {
-        "format": "bestaudio/best",
+def ydl_options(outtmpl: str, postprocessor_hooks: list) -> dict:
+    return {
+        "format": "bestaudio/best" if AUDIO_CODEC == "mp3" else "bestaudio[ext=m4a]/bestaudio/best",
         "noplaylist": True,
         "default_search": "ytsearch1",            # first search result
-        "outtmpl": os.path.join(SONG_DIR, "%(title)s.%(ext)s"),
+        "outtmpl": outtmpl,
         "postprocessors": [{
             "key": "FFmpegExtractAudio",
-            "preferredcodec": "mp3",
+            "preferredcodec": AUDIO_CODEC,           # "best": copy/remux only
             "preferredquality": "192",
         }],
+        "postprocessor_hooks": postprocessor_hooks,
         "quiet": False,
         "no_warnings": True,
     }
 
+class DownloadSession:
+    """
+    One YoutubeDL for a whole CSV import instead of one per row, so options,
+    extractors and HTTP connections are set up once. fetch() points it at
+    each job's output template and hook; close() (or `with`) ends it.
+    """
+    def __init__(self):
+        self._ydl = None
+        self._hooks: list = []
+
+    def fetch(self, query: str, outtmpl: str, postprocessor_hooks: list) -> dict | None:
+        if self._ydl is None:
+            def on_post(d):
+                for hook in self._hooks:   # whichever job is running
+                    hook(d)
+            self._ydl = YoutubeDL(ydl_options(outtmpl, [on_post]))
+        # yt-dlp keeps the parsed template as a dict (outtmpl_dict before 2022.11)
+        templates = getattr(self._ydl, "outtmpl_dict", None) or self._ydl.params["outtmpl"]
+        templates["default"] = outtmpl
+        self._hooks = postprocessor_hooks
+        try:
+            return self._ydl.extract_info(query, download=True)
+        finally:
+            self._hooks = []
+
+    def close(self):
+        if self._ydl is not None:
+            self._ydl.__exit__(None, None, None)   # same as leaving `with YoutubeDL(...)`
+            self._ydl = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def download_song(query: str, session: DownloadSession | None = None) -> str | None:
+    """
+    Search YouTube (first result) and download its audio into SONG_DIR,
+    keeping the native format unless AUDIO_CODEC says "mp3".
+    Returns the final file path (.m4a/.opus/.mp3...) or None on failure.
+    Queries downloaded before are linked from the download cache instead.
+    A batch passes its DownloadSession to reuse one YoutubeDL.
+    """
+    cached = download_cache.checkout(query, SONG_DIR)
+    if cached:
+        song_library.sync(cached)
+        print(f"\n[cache] {query} -> {os.path.basename(cached)}")
+        return cached
+
+    if load_yt_dlp() is None:
+        return None
+
+    hooked: list[str] = []
+
+    def on_postprocess(d):
+        if d.get("status") == "finished":
+            hooked.append(d.get("info_dict", {}).get("filepath"))
+
     print(f"\n[yt-dlp] Searching + downloading: {query}")
     try:
-        with YoutubeDL(opts) as ydl:
-            ydl.download([query])
+        if session:
+            info = session.fetch(query, job_outtmpl(SONG_DIR), [on_postprocess])
+        else:
+            with YoutubeDL(ydl_options(job_outtmpl(SONG_DIR), [on_postprocess])) as ydl:
+                info = ydl.extract_info(query, download=True)
     except Exception as e:
         print("[x] yt-dlp error:", e)
         return None
 
-    # Try to detect a newly-created mp3
-    after_files = set(os.listdir(SONG_DIR))
-    new_candidates = [f for f in after_files if f.lower().endswith(".mp3") and f not in before_snapshot]
-    if new_candidates:
-        full_paths = [os.path.join(SONG_DIR, f) for f in new_candidates]
-        newest = max(full_paths, key=lambda p: os.path.getmtime(p))
-        print(f"[✓] Saved: {newest}")
-        return newest
-
-    # Fallback: newest mp3 overall
-    newest = newest_mp3(SONG_DIR)
-    if newest:
-        print(f"[✓] Saved (newest): {newest}")
-        return newest
-
-    print("[x] Download finished but mp3 not found. Check the 'songs' folder.")
+    # yt-dlp tells us exactly which file it wrote
+    path = downloaded_path(info, hooked)
+    if path:
+        download_cache.store(query, path, first_entry(info))
+        song_library.sync(path)
+        print(f"[✓] Saved: {path}")
+        return path
+
+    print("[x] Download finished but yt-dlp reported no audio file.")
     return None
 
 def rename_to_player(downloaded_path: str, first: str, last: str) -> str | None:
     """
-    Rename downloaded file to 'first_last.mp3' (unique if collision).
+    Rename downloaded file to 'first_last.<ext>' (same extension, unique if collision).
     Returns the final path or None on failure.
     """
     if not downloaded_path or not os.path.exists(downloaded_path):
         return None
     base = sanitize_player_name(f"{first} {last}")
-    target = os.path.join(SONG_DIR, base + ".mp3")
-    target = unique_path(target)
+    ext = os.path.splitext(downloaded_path)[1].lower() or ".mp3"
+    target = song_library.claim(base + ext)
     try:
-        os.rename(downloaded_path, target)
+        os.replace(downloaded_path, target)
+        song_library.sync(downloaded_path, target)
         print(f"[✓] Renamed to: {os.path.basename(target)}")
         return target
     except Exception as e:
+        song_library.release(target)
+        print("[x] Rename failed:", e)
+        return None
+
+def strip_job_token(downloaded_path: str) -> str | None:
+    """
+    Rename 'title.<token>.<ext>' (job_outtmpl / DownloadCache.checkout) back
+    to 'title.<ext>' (unique if collision).
+    Returns the final path or None on failure.
+    """
+    root, ext = os.path.splitext(os.path.basename(downloaded_path))
+    title = re.sub(r"\.[0-9a-f]{8}$", "", root)
+    if title == root:
+        return downloaded_path
+    target = song_library.claim((title or "song") + ext)
+    try:
+        os.replace(downloaded_path, target)
+        song_library.sync(downloaded_path, target)
+        print(f"[✓] Kept as: {os.path.basename(target)}")
+        return target
+    except Exception as e:
+        song_library.release(target)
         print("[x] Rename failed:", e)
         return None
 
 def rename_downloaded_file_interactive(downloaded_path: str):
     """
     Interactive rename for the manual 'd' command.
+    Enter keeps the video title, minus the download token.
     """
     if not downloaded_path or not os.path.exists(downloaded_path):
         return
     resp = input("Enter player name to rename file (First Last) or press Enter to skip: ").strip()
     if not resp:
-        return
+        return strip_job_token(downloaded_path)
     return rename_to_player(downloaded_path, resp.split()[0], " ".join(resp.split()[1:]) or "")
 
 # ---------- CSV import ----------
-def read_batters_csv(csv_path: str) -> list[dict]:
+def read_batters_csv(csv_path: str):
     """
-    Load rows from CSV. Header names are case-insensitive; accepted headers:
+    Yield rows from CSV one at a time (nothing is loaded up front).
+    Header names are case-insensitive; accepted headers:
     First Name, Last Name, Song, Artist, Start time
     """
-    rows = []
     if not os.path.exists(csv_path):
         print(f"[x] CSV not found: {csv_path}")
-        return rows
+        return
     with open(csv_path, "r", newline="", encoding="utf-8-sig") as f:
         reader = csv.DictReader(f)
         # normalize keys
         for raw in reader:
             norm = { (k or "").strip().lower(): (v or "").strip() for k, v in raw.items() }
-            rows.append({
+            yield {
                 "first":   norm.get("first name", ""),
                 "last":    norm.get("last name", ""),
                 "song":    norm.get("song", ""),
                 "artist":  norm.get("artist", ""),
                 "start":   norm.get("start time", ""),  # not used during download
-            })
-    return rows
+            }
 
 def file_already_present(first: str, last: str) -> str | None:
     """
-    Return full path to first_last.mp3 if present, else None.
+    Return full path to first_last.<ext> (any audio extension) if present, else None.
     """
     base = sanitize_player_name(f"{first} {last}")
-    candidate = os.path.join(SONG_DIR, base + ".mp3")
-    return candidate if os.path.exists(candidate) else None
+    for ext in sorted(EXTS):
+        if song_library.exists(base + ext):
+            return os.path.join(SONG_DIR, base + ext)
+    return None
 
 def import_from_csv(csv_path: str, overwrite: bool = False):
     """
-    For each row: build query, download, and rename to first_last.mp3.
-    Skips existing unless overwrite=True.
+    For each row: build query, download, and rename to first_last.<ext>.
+    Skips existing unless overwrite=True. Every row downloads through
+    one DownloadSession.
     """
-    rows = read_batters_csv(csv_path)
-    if not rows:
-        print("[i] No rows found to import.")
-        return
-
-    print(f"\n[i] Importing {len(rows)} player(s) from: {csv_path}")
+    print(f"\n[i] Importing player(s) from: {csv_path}")
     success, skipped, failed = 0, 0, 0
 
-    for r in rows:
-        first, last, song, artist = r["first"], r["last"], r["song"], r["artist"]
-        if not (first and last and song):
-            print(f"  - Skipping (incomplete row): {r}")
-            skipped += 1
-            continue
-
-        existing = file_already_present(first, last)
-        if existing and not overwrite:
-            print(f"  - Exists, skipping: {os.path.basename(existing)}")
-            skipped += 1
-            continue
-
-        query = build_query(song, artist)
-        print(f"  - {first} {last}: {song} — {artist}")
-        path = download_song(query)
-        if not path:
-            print("    [x] Download failed.")
-            failed += 1
-            continue
-
-        if rename_to_player(path, first, last):
-            success += 1
-        else:
-            failed += 1
+    with DownloadSession() as session:
+        for r in read_batters_csv(csv_path):   # streamed, one row at a time
+            first, last, song, artist = r["first"], r["last"], r["song"], r["artist"]
+            if not (first and last and song):
+                print(f"  - Skipping (incomplete row): {r}")
+                skipped += 1
+                continue
+
+            existing = file_already_present(first, last)
+            if existing and not overwrite:
+                print(f"  - Exists, skipping: {os.path.basename(existing)}")
+                skipped += 1
+                continue
+
+            query = build_query(song, artist)
+            print(f"  - {first} {last}: {song} — {artist}")
+            path = download_song(query, session)
+            if not path:
+                print("    [x] Download failed.")
+                failed += 1
+                continue
+
+            if rename_to_player(path, first, last):
+                success += 1
+            else:
+                failed += 1
 
+    if not (success or skipped or failed):
+        print("[i] No rows found to import.")
+        return
     print(f"\n[i] Import complete. Success: {success}  Skipped: {skipped}  Failed: {failed}")
 
 # ---------- main ----------
 def main():
-    os.system("cls" if os.name == "nt" else "clear")
-    print(BANNER)
-    player = vlc.MediaPlayer() if vlc else None
+    profile = "--startup-profile" in sys.argv[1:]
+    startup_marks.append(("modules imported", time.perf_counter()))
+    get_player = start_vlc_player()  # libvlc starts while we draw the menu
+    if "--no-splash" not in sys.argv[1:]:
+        os.system("cls" if os.name == "nt" else "clear")
+        print(BANNER)
+    song_library.start_watching()
+    startup_marks.append(("songs indexed", time.perf_counter()))
+    if profile: startup_report()
 
     # Auto-detect CSV at startup
     if os.path.exists(CSV_BATTERS):
         ans = input(f"\nFound CSV: data/batters.csv  → Import now? [y/N]: ").strip().lower()
         if ans == "y":
-            ow = input("Overwrite existing first_last.mp3 if present? [y/N]: ").strip().lower() == "y"
+            ow = input("Re-download players whose first_last song exists? [y/N]: ").strip().lower() == "y"
             import_from_csv(CSV_BATTERS, overwrite=ow)
 
     while True:
@@ -314,6 +760,7 @@ def main():
 
         if not cmd:
             continue
+        player = get_player()
 
         low = cmd.lower()
 
@@ -360,7 +807,7 @@ def main():
             if not os.path.exists(CSV_BATTERS):
                 print("[x] CSV not found at ./data/batters.csv")
             else:
-                ow = input("Overwrite existing first_last.mp3 if present? [y/N]: ").strip().lower() == "y"
+                ow = input("Re-download players whose first_last song exists? [y/N]: ").strip().lower() == "y"
                 import_from_csv(CSV_BATTERS, overwrite=ow)
             continue
 
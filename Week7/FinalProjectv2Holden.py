@@ -2,12 +2,49 @@
 # Features:
 # - Plays local audio files with VLC from ./songs
 # - Downloads new songs from YouTube via yt-dlp
-# - Stores players with jersey number, name, song file, and start time in players.json
-# - Remembers volume and start times across runs via config.json / players.json
-# - Clean terminal UI: splash screen, clears each loop, shows "Now Playing"
+# - Stores players with jersey number, name, song file, and start time in players.db
+#   (SQLite, versioned schema; an old players.json is migrated into it once)
+# - Remembers volume and start times across runs via config.json / players.db
+# - Clean terminal UI: splash screen, shows "Now Playing"; each redraw only
+#   rewrites the rows that changed (ANSI codes, no cls/clear shell)
+#   (--no-splash skips the banner, --startup-profile times startup; yt-dlp and
+#   VLC load lazily / in the background so the menu comes up fast)
+# - Downloads, batch imports and clip renders run in the background, so
+#   playback commands (jersey, p, s, v) answer at once even mid-import
+# - Walk-up clips are pre-cut at each start time, normalized and faded (songs/.clips)
+# - songs/ is indexed once and kept current by a file watcher (no rescans per redraw)
+# - Next few players' songs are preloaded (config.json "preload") so they start instantly
+# - Several teams in one players.db ('t' switches; jerseys only need to be
+#   unique within a team)
+# - Lineup mode: set the batting order once ('o', or data/lineup.csv), then Enter
+#   plays each batter in turn, wrapping to the top of the order
 # - NEW: Batch import from data/batters.csv (First,Last,Song,Artist,StartSeconds,Jersey)
+# - Batch import downloads several rows at once (config.json "import_workers")
+#   and streams the CSV; per-row checkpoints let an interrupted import resume
+#   (each worker reuses one yt-dlp instance for the whole import)
+# - Imports are planned first: every row is looked up (metadata only, in
+#   parallel) and the matches shown before any audio is downloaded
+#   (config.json "import_mode": "review", "auto" or "direct"); the top
+#   "search_results" hits are ranked (title/artist match, length, official
+#   channels) and cached in songs/.cache/search.json
+# - Live download progress (speed, ETA, conversion, stalls); per-job timings go
+#   to download_timings.csv
+# - config.json "downloader": "local" swaps yt-dlp for fixture files in
+#   data/fixtures with synthetic latency/bandwidth (offline benchmarking)
+# - config.json "download_mode": "segment" fetches only each player's walk-up
+#   window (start .. start + "segment_seconds", default clip_seconds)
+# - Songs keep the format YouTube serves (m4a as is, opus remuxed) instead of
+#   being re-encoded to MP3; config.json "audio_format": "mp3" brings that back
 
-import os, sys, time, json, re, csv
+import os, sys, time, json, re, csv, threading, uuid, hashlib, shutil, subprocess, struct
+import argparse, bisect, itertools, queue, sqlite3, unicodedata
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+# Reference point for --startup-profile (right after the stdlib imports)
+_T0 = time.perf_counter()
 
 BANNER = r"""
                                                   @@@@@@@@@@@@@@@@@@                                  
@@ -51,36 +88,315 @@ BASE = os.path.dirname(os.path.abspath(__file__))
 os.chdir(BASE)
 
 SONG_DIR = os.path.join(BASE, "songs")
+REGISTRY_DB = os.path.join(BASE, "players.db")
+# players.json / players.journal are only read once, to migrate an old install
 PLAYERS_FILE = os.path.join(BASE, "players.json")
+JOURNAL_FILE = os.path.join(BASE, "players.journal")
 CONFIG_FILE = os.path.join(BASE, "config.json")
 DATA_DIR = os.path.join(BASE, "data")
 BATTERS_CSV = os.path.join(DATA_DIR, "batters.csv")
+LINEUP_CSV = os.path.join(DATA_DIR, "lineup.csv")
+CACHE_DIR = os.path.join(SONG_DIR, ".cache")
+CLIPS_DIR = os.path.join(SONG_DIR, ".clips")
+LATENCY_LOG = os.path.join(BASE, "play_latency.csv")
+DOWNLOAD_LOG = os.path.join(BASE, "download_timings.csv")
+# what background imports/renders printed while the menu was up
+ACTIVITY_LOG = os.path.join(BASE, "activity.log")
+IMPORT_CHECKPOINT_FILE = os.path.join(DATA_DIR, ".import_checkpoint.jsonl")
+SEARCH_CACHE_FILE = os.path.join(CACHE_DIR, "search.json")
 
 os.makedirs(SONG_DIR, exist_ok=True)
 os.makedirs(DATA_DIR, exist_ok=True)
 
-AUDIO_EXTS = {".mp3", ".m4a", ".wav", ".flac", ".ogg"}
+AUDIO_EXTS = {".mp3", ".m4a", ".opus", ".wav", ".flac", ".ogg"}
+
+# How many yt-dlp downloads/conversions a batch import runs at the same time
+DEFAULT_IMPORT_WORKERS = 4
+
+# Batch import commits the registry every N rows
+IMPORT_COMMIT_EVERY = 25
+
+# players.db schema version (PRAGMA user_version); see MIGRATIONS
+REGISTRY_SCHEMA = 2
+
+# Team used until config.json "team" names another ('t' in the menu)
+DEFAULT_TEAM = "Home"
+
+# Size cap for the query -> audio download cache in songs/.cache
+DEFAULT_CACHE_MB = 512
+
+# Import planning ranks this many search results per row (config.json
+# "search_results"); cached search results are reused for this many days
+DEFAULT_SEARCH_RESULTS = 5
+SEARCH_CACHE_DAYS = 30
+
+# A download with no new bytes for this long is reported as stalled
+STALL_SECONDS = 10
+
+# How often a batch import prints its combined download progress
+PROGRESS_INTERVAL = 3.0
+
+# How many upcoming batters SimplePlayer keeps buffered and ready to play
+DEFAULT_PRELOAD = 3
+
+# How long the splash banner stays up (startup work runs underneath it)
+SPLASH_SECONDS = 2.5
+
+# Rendered walk-up clips: max length and fade-in (seconds)
+DEFAULT_CLIP_SECONDS = 30
+DEFAULT_CLIP_FADE = 1.0
+
+# Keeps output from parallel import jobs from interleaving mid-line
+_print_lock = threading.Lock()
+
+
+# --- Terminal rendering ---
+
+def enable_ansi(stream) -> bool:
+    """True if `stream` is a terminal that understands ANSI escape codes."""
+    if not stream.isatty() or os.environ.get("TERM") == "dumb":
+        return False
+    if os.name != "nt":
+        return True
+    try:
+        # Windows 10+ consoles do VT sequences once asked to
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)
+        mode = ctypes.c_uint32()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+    except (OSError, AttributeError):
+        return False
+
+
+class ActivityLog:
+    """
+    Where background threads' print() output goes while the menu is up.
+
+    Finished lines are appended to `path` with a timestamp and the newest
+    one is handed to `on_line`, so imports and clip renders report on the
+    status line instead of writing over the menu or a half-typed command.
+    Progress bars that redraw with '\\r' only update the status line.
+    """
+
+    def __init__(self, path: str, on_line):
+        self.path = path
+        self._on_line = on_line
+        self._partial: dict[int, str] = {}   # thread ident -> unfinished line
+        self._lock = threading.Lock()
+
+    def write(self, text: str) -> int:
+        ident = threading.get_ident()
+        with self._lock:
+            pieces = re.split(r"(\r|\n)", self._partial.pop(ident, "") + text)
+            if pieces[-1]:
+                self._partial[ident] = pieces[-1]
+        done = [(line.strip(), end) for line, end in zip(pieces[:-1:2], pieces[1::2]) if line.strip()]
+        if not done:
+            return len(text)
+        finished = [line for line, end in done if end == "\n"]
+        if finished:
+            stamp = time.strftime("%H:%M:%S")
+            try:
+                with self._lock, open(self.path, "a", encoding="utf-8") as f:
+                    f.writelines(f"{stamp} {line}\n" for line in finished)
+            except OSError:
+                pass
+        self._on_line(done[-1][0])
+        return len(text)
+
+
+class _WriteTracker:
+    """
+    sys.stdout wrapper that tells the renderer someone else wrote to the
+    screen. With a `background` writer, output from threads other than the
+    main one goes there instead of the terminal.
+    """
+
+    def __init__(self, stream, on_write, background=None):
+        self._stream = stream
+        self._on_write = on_write
+        self._background = background
+
+    def write(self, text):
+        if self._background is not None and threading.current_thread() is not threading.main_thread():
+            return self._background.write(text)
+        if text:
+            self._on_write()
+        return self._stream.write(text)
+
+    def flush(self):
+        if threading.current_thread() is threading.main_thread() or self._background is None:
+            self._stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+class ScreenRenderer:
+    """
+    Draws the menu from a list of lines with ANSI escape codes, instead of
+    forking a shell for cls/clear and reprinting everything.
+
+    The last frame is remembered and the next one only rewrites the rows
+    that changed, plus the prompt row (where the typed command was echoed),
+    then clears whatever is below. Anything else printed in between
+    (submenus, background tasks) goes through a tracking wrapper on
+    sys.stdout and forces one full redraw. Pipes, consoles without VT
+    support and frames taller than the terminal get a plain full print.
+    """
+
+    def __init__(self, stream=None):
+        self.out = stream or sys.stdout
+        self.ansi = enable_ansi(self.out)
+        self.size: os.terminal_size | None = None   # fixed size (tests/benchmark)
+        self._frame: list[str] | None = None
+        self._tracking = False
+
+    def track_stdout(self, background=None):
+        """
+        Route print() through a wrapper so outside output invalidates the
+        frame; `background` (an ActivityLog) takes other threads' output.
+        """
+        if not self._tracking:
+            self._tracking = True
+            sys.stdout = _WriteTracker(self.out, self.invalidate, background)
+
+    def invalidate(self):
+        self._frame = None
+
+    def clear(self):
+        if self.ansi:
+            self.out.write("\033[H\033[2J")
+            self.out.flush()
+        self._frame = None
+
+    def render(self, lines: list[str], keep_prompt: bool = False):
+        """
+        Show `lines`; the last one is the prompt and the cursor stays at its end.
+
+        keep_prompt=True is for updates nobody pressed Enter for (background
+        activity): the prompt row and the cursor are left alone, so a
+        half-typed command stays on screen. Without ANSI such updates are
+        skipped rather than reprinting the whole menu.
+        """
+        if not self.ansi:
+            if keep_prompt:
+                return
+            self.out.write("\n" + "\n".join(lines))
+            self.out.flush()
+            return
+        cols, rows = self.size or shutil.get_terminal_size()
+        lines = [text[:cols - 1] for text in lines]
+        # +1: the Enter after a command moves the cursor down a row
+        fits = len(lines) + 1 < rows
+        old = self._frame
+        if keep_prompt and old is not None and fits and len(old) == len(lines):
+            # save the cursor, rewrite changed rows above the prompt, restore it
+            buf = ["\0337"]
+            for i, text in enumerate(lines[:-1]):
+                if old[i] != text:
+                    buf.append(f"\033[{i + 1};1H{text}\033[K")
+            buf.append("\0338")
+            self.out.write("".join(buf))
+            self.out.flush()
+            self._frame = lines[:-1] + old[-1:]
+            return
+        if old is None or not fits:
+            buf = ["\033[H\033[2J", "\n".join(lines)]
+        else:
+            buf = []
+            last = len(lines) - 1
+            for i, text in enumerate(lines):
+                if i == last or i >= len(old) or old[i] != text:
+                    buf.append(f"\033[{i + 1};1H{text}\033[K")
+            buf.append("\033[J")
+        self.out.write("".join(buf))
+        self.out.flush()
+        self._frame = lines if fits else None
+
+
+screen = ScreenRenderer()
 
 
 def clear_screen():
-    os.system("cls" if os.name == "nt" else "clear")
+    screen.clear()
 
 
 # --- Imports with extra safety/guidance ---
+# yt_dlp (hundreds of extractor modules) and vlc (libvlc plugin scan) are
+# the slowest things this script loads, so neither is imported until it is
+# first needed: yt_dlp on the first download, vlc on SimplePlayer's
+# background thread while the menu is already up.
 
 YoutubeDL = None
-try:
-    from yt_dlp import YoutubeDL as _YDL
-    YoutubeDL = _YDL
-except BaseException:
-    YoutubeDL = None
-
 vlc = None
-try:
-    import vlc as _vlc
-    vlc = _vlc
-except BaseException:
-    vlc = None
+_import_lock = threading.Lock()
+_yt_dlp_loaded = False
+_vlc_loaded = False
+
+
+def load_yt_dlp():
+    """Import yt_dlp on first use; returns the YoutubeDL class or None."""
+    global YoutubeDL, _yt_dlp_loaded
+    with _import_lock:
+        if not _yt_dlp_loaded:
+            _yt_dlp_loaded = True
+            try:
+                from yt_dlp import YoutubeDL as _YDL
+                YoutubeDL = _YDL
+            except BaseException:
+                YoutubeDL = None
+    return YoutubeDL
+
+
+def load_vlc():
+    """Import python-vlc on first use; returns the module or None."""
+    global vlc, _vlc_loaded
+    with _import_lock:
+        if not _vlc_loaded:
+            _vlc_loaded = True
+            try:
+                import vlc as _vlc
+                vlc = _vlc
+            except BaseException:
+                vlc = None
+    return vlc
+
+
+class StartupProfile:
+    """
+    Timestamps from process start to the first menu prompt, printed under
+    the menu when run with --startup-profile. Marks from background work
+    (e.g. libvlc init) are included if they landed before the prompt.
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.marks: list[tuple[str, float]] = []
+        self._reported = False
+
+    def mark(self, label: str):
+        if self.enabled:
+            self.marks.append((label, time.perf_counter()))
+
+    def report_lines(self) -> list[str]:
+        """The report as lines for the menu frame (only the first time)."""
+        if not self.enabled or self._reported:
+            return []
+        self._reported = True
+        now = time.perf_counter()
+        lines = ["", f"[Startup] time to first prompt: {(now - _T0) * 1000:.1f} ms"]
+        prev = _T0
+        for label, t in sorted(self.marks, key=lambda m: m[1]):
+            lines.append(f"    {label:<22} +{(t - prev) * 1000:7.1f} ms  (at {(t - _T0) * 1000:.1f} ms)")
+            prev = t
+        return lines
+
+
+startup = StartupProfile()
 
 
 # --- Helpers: filesystem / names ---
@@ -94,26 +410,198 @@ def sanitize_player_name(name: str) -> str:
     return name or "player"
 
 
-def unique_path(path: str) -> str:
-    """If path exists, append _1, _2, ... until it's unique."""
-    if not os.path.exists(path):
-        return path
-    root, ext = os.path.splitext(path)
-    i = 1
-    while True:
-        candidate = f"{root}_{i}{ext}"
-        if not os.path.exists(candidate):
-            return candidate
-        i += 1
+def player_file_name(name: str, path: str) -> str:
+    """'First Last' + downloaded path -> 'first_last.<ext>', keeping the file's real extension."""
+    ext = os.path.splitext(path)[1].lower()
+    return sanitize_player_name(name) + (ext or ".mp3")
+
+
+class SongLibrary:
+    """
+    In-memory index of the audio files in songs/.
+
+    The folder is scanned once; after that the song list and free names
+    are answered from memory. It stays current via inotify on Linux (or by
+    polling the folder's mtime elsewhere), and code that renames/creates
+    files calls sync() so the index is right at once.
+    """
+
+    # inotify event bits (see <sys/inotify.h>)
+    _IN_CLOSE_WRITE = 0x008
+    _IN_MOVED_FROM = 0x040
+    _IN_MOVED_TO = 0x080
+    _IN_CREATE = 0x100
+    _IN_DELETE = 0x200
+
+    def __init__(self, folder: str, exts: set[str], poll_interval: float = 1.0):
+        self.folder = folder
+        self.exts = exts
+        self.poll_interval = poll_interval
+        self._files: dict[str, float] = {}   # name -> mtime
+        self._lower: set[str] = set()
+        self._sorted: list[str] | None = None
+        self._next: dict[str, int] = {}      # name -> next _N suffix to try
+        self._scanned = False
+        self._watching = False
+        self._lock = threading.Lock()
+
+    def _wanted(self, name: str) -> bool:
+        return not name.startswith(".") and os.path.splitext(name)[1].lower() in self.exts
+
+    def _ensure_scanned(self):
+        if not self._scanned:
+            self.rescan()
+
+    def rescan(self):
+        files = {}
+        with os.scandir(self.folder) as it:
+            for entry in it:
+                if self._wanted(entry.name) and entry.is_file():
+                    files[entry.name] = entry.stat().st_mtime
+        with self._lock:
+            self._files = files
+            self._lower = {n.lower() for n in files}
+            self._sorted = None
+            self._scanned = True
+
+    def sync(self, *paths: str):
+        """Re-check specific files (after we renamed/created/deleted them)."""
+        self._ensure_scanned()
+        for path in paths:
+            if path and os.path.dirname(os.path.abspath(path)) == self.folder:
+                self._update(os.path.basename(path))
+
+    def _update(self, name: str):
+        if not self._wanted(name):
+            return
+        try:
+            mtime = os.stat(os.path.join(self.folder, name)).st_mtime
+        except OSError:
+            mtime = None
+        with self._lock:
+            if mtime is None:
+                if self._files.pop(name, None) is not None:
+                    self._lower.discard(name.lower())
+                    self._sorted = None
+            else:
+                if name not in self._files:
+                    self._lower.add(name.lower())
+                    self._sorted = None
+                self._files[name] = mtime
+
+    def list(self) -> list[str]:
+        """Audio file names, sorted case-insensitively (cached between changes)."""
+        self._ensure_scanned()
+        with self._lock:
+            if self._sorted is None:
+                self._sorted = sorted(self._files, key=str.lower)
+            return list(self._sorted)
+
+    def claim(self, name: str) -> str:
+        """
+        Reserve a free file name in the folder and return its full path.
+
+        Tries name, name_1, name_2, ... starting from a per-name counter, so
+        repeated names don't re-probe from _1, and creates an empty
+        placeholder with O_EXCL so nobody else can take the same name.
+        Move the real file over it with os.replace(), or release() it.
+        """
+        self._ensure_scanned()
+        root, ext = os.path.splitext(name)
+        key = name.lower()
+        with self._lock:
+            i = self._next.get(key, 0)
+            while True:
+                candidate = name if i == 0 else f"{root}_{i}{ext}"
+                i += 1
+                if candidate.lower() in self._lower:
+                    continue
+                path = os.path.join(self.folder, candidate)
+                try:
+                    fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                except FileExistsError:
+                    continue
+                os.close(fd)
+                self._next[key] = i
+                self._files[candidate] = time.time()
+                self._lower.add(candidate.lower())
+                self._sorted = None
+                return path
+
+    def release(self, path: str):
+        """Give back a claimed name that was never filled in."""
+        try:
+            if os.path.getsize(path) == 0:
+                os.remove(path)
+        except OSError:
+            pass
+        self.sync(path)
+
+    def start_watching(self):
+        """Keep the index current in a background thread (inotify or polling)."""
+        if self._watching:
+            return
+        self._ensure_scanned()
+        self._watching = True
+        fd = self._inotify_fd()
+        if fd is not None:
+            threading.Thread(target=self._inotify_loop, args=(fd,), daemon=True).start()
+        else:
+            threading.Thread(target=self._poll_loop, daemon=True).start()
+
+    def _inotify_fd(self) -> int | None:
+        if not sys.platform.startswith("linux"):
+            return None
+        try:
+            import ctypes
+            libc = ctypes.CDLL(None, use_errno=True)
+            fd = libc.inotify_init1(0)
+            if fd < 0:
+                return None
+            mask = (self._IN_CLOSE_WRITE | self._IN_MOVED_FROM | self._IN_MOVED_TO
+                    | self._IN_CREATE | self._IN_DELETE)
+            if libc.inotify_add_watch(fd, self.folder.encode(), mask) < 0:
+                os.close(fd)
+                return None
+            return fd
+        except (OSError, AttributeError):
+            return None
+
+    def _inotify_loop(self, fd: int):
+        header = struct.Struct("iIII")
+        while True:
+            try:
+                buf = os.read(fd, 64 * 1024)
+            except OSError:
+                self._poll_loop()
+                return
+            pos = 0
+            while pos + header.size <= len(buf):
+                _wd, _mask, _cookie, length = header.unpack_from(buf, pos)
+                raw = buf[pos + header.size:pos + header.size + length]
+                pos += header.size + length
+                name = raw.split(b"\0", 1)[0].decode(errors="surrogateescape")
+                if name:
+                    self._update(name)
+
+    def _poll_loop(self):
+        last = None
+        while True:
+            try:
+                mtime = os.stat(self.folder).st_mtime_ns
+            except OSError:
+                mtime = None
+            if last is not None and mtime != last:
+                self.rescan()
+            last = mtime
+            time.sleep(self.poll_interval)
+
+
+song_library = SongLibrary(SONG_DIR, AUDIO_EXTS)
 
 
 def list_audio_files():
-    files = [
-        f for f in os.listdir(SONG_DIR)
-        if os.path.splitext(f)[1].lower() in AUDIO_EXTS
-    ]
-    files.sort(key=str.lower)
-    return files
+    return song_library.list()
 
 
 # --- JSON persistence ---
@@ -137,9 +625,11 @@ def save_json(path: str, data):
         print(f"[x] Failed to save {os.path.basename(path)}: {e}")
 
 
-def load_players():
-    """Return dict jersey -> player dict."""
-    data = load_json(PLAYERS_FILE, {})
+def players_from_data(data, skipped: list | None = None) -> dict[int, dict]:
+    """
+    Turn loaded players.json data (either format) into jersey -> record.
+    Entries that can't be read are appended to `skipped` (if given).
+    """
     players: dict[int, dict] = {}
     if isinstance(data, dict):
         # assume already jersey->record
@@ -148,8 +638,11 @@ def load_players():
                 jersey = int(k)
                 if isinstance(v, dict):
                     players[jersey] = v
+                    continue
             except ValueError:
-                continue
+                pass
+            if skipped is not None:
+                skipped.append(k)
     elif isinstance(data, list):
         # older format maybe list of dicts
         for rec in data:
@@ -157,15 +650,533 @@ def load_players():
                 try:
                     j = int(rec["jersey"])
                     players[j] = rec
-                except (ValueError, TypeError):
                     continue
+                except (ValueError, TypeError):
+                    pass
+            if skipped is not None:
+                skipped.append(rec)
     return players
 
 
+@dataclass(slots=True)
+class Player:
+    """One registry row. slots=True: no per-record __dict__, so a big roster stays small."""
+
+    jersey: int
+    name: str
+    file: str
+    start: int = 0
+
+    @classmethod
+    def from_record(cls, jersey: int, rec: dict) -> "Player":
+        """From a players.json style record; raises ValueError/TypeError if unusable."""
+        if not isinstance(rec, dict):
+            raise TypeError(f"player {jersey} is not a record")
+        try:
+            start = int(rec.get("start") or 0)
+        except (ValueError, TypeError):
+            start = 0
+        return cls(int(jersey), str(rec.get("name") or ""), str(rec.get("file") or ""), start)
+
+    def to_record(self) -> dict:
+        return {"jersey": self.jersey, "name": self.name, "file": self.file, "start": self.start}
+
+
+def read_json_registry(snapshot_path: str, journal_path: str) -> tuple[dict[int, dict], list]:
+    """
+    The roster an old install left behind: players.json in either shape,
+    with any players.journal lines replayed on top. Returns (players,
+    skipped entries).
+    """
+    skipped: list = []
+    players = players_from_data(load_json(snapshot_path, {}), skipped)
+    try:
+        with open(journal_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    break  # torn write from a crash; later lines can't be trusted
+                for op in entry.get("ops", []):
+                    jersey = int(op["jersey"])
+                    if op.get("op") == "del":
+                        players.pop(jersey, None)
+                    else:
+                        players[jersey] = op["rec"]
+    except FileNotFoundError:
+        pass
+    return players, skipped
+
+
+class PlayerStore:
+    """
+    The player registry in players.db (SQLite, WAL mode).
+
+    The file's schema version lives in PRAGMA user_version and opening it
+    runs any MIGRATIONS it is missing. Step 1 creates the players table
+    and, on an install that still has players.json (jersey-keyed dict or
+    the old list, plus players.journal), copies the roster in once and
+    renames those files to *.migrated; entries that can't be read are
+    reported instead of silently dropped. Step 2 makes it multi-team:
+    teams, songs, players keyed by (team, jersey) and per-team lineups.
+
+    The store works on one team at a time (`team`, switched with
+    use_team), so the rest of the script still sees a jersey -> record
+    dict. Loading is a single SELECT, one fixed-shape row per player. A
+    save diffs the roster against the committed rows (kept as compact
+    Player objects) and writes only the changed ones in one SQLite
+    transaction with executemany, so a crash leaves the last commit
+    intact. The SQL is fixed strings with ? parameters, which sqlite3
+    compiles once per connection and reuses.
+
+    Wrap many mutations in `with player_store.transaction():` to commit
+    them together. Transactions are per thread, so a save from the menu
+    isn't held back by a background import's open one. Code that touches
+    the shared players dict while an import may be registering rows holds
+    `player_store.lock`.
+
+    Subscribers (see subscribe) get rebuild(players) after every load and
+    apply(ops) with the put/del ops of every commit, so indexes over the
+    roster stay current without rescanning it.
+    """
+
+    SQL_LOAD = ("SELECT p.jersey, p.name, COALESCE(s.file, ''), p.start FROM players p "
+                "LEFT JOIN songs s ON s.id = p.song_id WHERE p.team_id = ?")
+    SQL_SONG = "INSERT INTO songs (file) VALUES (?) ON CONFLICT(file) DO NOTHING"
+    SQL_UPSERT = ("INSERT INTO players (team_id, jersey, name, song_id, start) "
+                  "VALUES (?, ?, ?, (SELECT id FROM songs WHERE file = ?), ?) "
+                  "ON CONFLICT(team_id, jersey) DO UPDATE SET name = excluded.name, "
+                  "song_id = excluded.song_id, start = excluded.start")
+    SQL_DELETE = "DELETE FROM players WHERE team_id = ? AND jersey = ?"
+    SQL_FIND = ("SELECT t.name, p.jersey, p.name FROM players p JOIN teams t ON t.id = p.team_id "
+                "WHERE p.name LIKE ? ESCAPE '\\' AND p.team_id != ? ORDER BY p.name LIMIT ?")
+
+    def __init__(self, db_path: str, legacy_json: str | None = None, legacy_journal: str | None = None,
+                 team: str = DEFAULT_TEAM):
+        self.db_path = db_path
+        self.legacy_json = legacy_json
+        self.legacy_journal = legacy_journal
+        self.team = team
+        self._team_id: int | None = None
+        self._lineup: list[int] | None = None
+        self._conn: sqlite3.Connection | None = None
+        self._committed: dict[int, Player] = {}
+        self._tx = threading.local()
+        self._subscribers: list = []
+        self.lock = threading.RLock()
+
+    def subscribe(self, subscriber):
+        """Register an object with rebuild(players) and apply(ops) methods."""
+        self._subscribers.append(subscriber)
+        subscriber.rebuild({j: p.to_record() for j, p in self._committed.items()})
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA foreign_keys=ON")
+            self._conn = conn
+            self._migrate()
+        return self._conn
+
+    @property
+    def team_id(self) -> int:
+        """Row id of the current team, created on first use."""
+        if self._team_id is None:
+            conn = self.conn
+            conn.execute("INSERT INTO teams (name) VALUES (?) ON CONFLICT(name) DO NOTHING", (self.team,))
+            # names match case-insensitively; keep the spelling the team was created with
+            self._team_id, self.team = conn.execute(
+                "SELECT id, name FROM teams WHERE name = ?", (self.team,)).fetchone()
+        return self._team_id
+
+    def use_team(self, name: str) -> dict[int, dict]:
+        """Switch to (or create) team `name` and return its roster."""
+        with self.lock:
+            self.team = name.strip() or DEFAULT_TEAM
+            self._team_id = None
+            self._lineup = None
+            return self.load()
+
+    def teams(self) -> list[tuple[str, int]]:
+        """(team name, player count) for every team."""
+        with self.lock:
+            return self.conn.execute(
+                "SELECT t.name, COUNT(p.jersey) FROM teams t LEFT JOIN players p ON p.team_id = t.id "
+                "GROUP BY t.id ORDER BY t.name").fetchall()
+
+    def songs(self) -> list[tuple[str, int]]:
+        """(file, start) of every player on every team."""
+        with self.lock:
+            return self.conn.execute(
+                "SELECT DISTINCT s.file, p.start FROM players p JOIN songs s ON s.id = p.song_id").fetchall()
+
+    def find_elsewhere(self, name: str, limit: int = 5) -> list[tuple[str, int, str]]:
+        """(team, jersey, name) on other teams whose name starts with `name` (name index)."""
+        prefix = re.sub(r"([%_\\])", r"\\\1", name.strip())
+        if not prefix:
+            return []
+        with self.lock:
+            return self.conn.execute(self.SQL_FIND, (prefix + "%", self.team_id, limit)).fetchall()
+
+    def load_lineup(self) -> tuple[list[int], int]:
+        """The current team's batting order and the spot due up."""
+        with self.lock:
+            conn = self.conn
+            order = [j for (j,) in conn.execute(
+                "SELECT jersey FROM lineups WHERE team_id = ? ORDER BY spot", (self.team_id,))]
+            pos = conn.execute("SELECT lineup_pos FROM teams WHERE id = ?", (self.team_id,)).fetchone()[0]
+            self._lineup = order
+            return order, pos
+
+    def save_lineup(self, order: list[int], pos: int):
+        """Store the batting order (rows rewritten only when it changed) and spot."""
+        with self.lock:
+            try:
+                with self._write() as conn:
+                    if order != self._lineup:
+                        conn.execute("DELETE FROM lineups WHERE team_id = ?", (self.team_id,))
+                        conn.executemany("INSERT INTO lineups (team_id, spot, jersey) VALUES (?, ?, ?)",
+                                         [(self.team_id, i, j) for i, j in enumerate(order)])
+                    conn.execute("UPDATE teams SET lineup_pos = ? WHERE id = ?", (pos, self.team_id))
+            except sqlite3.Error as e:
+                print(f"[x] Failed to save lineup: {e}")
+                return
+            self._lineup = list(order)
+
+    def _migrate(self):
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version > REGISTRY_SCHEMA:
+            raise RuntimeError(f"{os.path.basename(self.db_path)} is schema v{version}; "
+                               f"this script only knows up to v{REGISTRY_SCHEMA}")
+        for target in range(version + 1, REGISTRY_SCHEMA + 1):
+            with self._write():
+                MIGRATIONS[target](self)
+                self._conn.execute(f"PRAGMA user_version={target}")
+
+    @contextmanager
+    def _write(self):
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield self._conn
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
+    def load(self) -> dict[int, dict]:
+        with self.lock:
+            rows = self.conn.execute(self.SQL_LOAD, (self.team_id,)).fetchall()
+            self._committed = {row[0]: Player(*row) for row in rows}
+            players = {j: p.to_record() for j, p in self._committed.items()}
+            for sub in self._subscribers:
+                sub.rebuild(players)
+            return players
+
+    def save(self, players: dict[int, dict]):
+        if getattr(self._tx, "depth", 0):
+            self._tx.pending = players
+            return
+        self._commit(players)
+
+    @contextmanager
+    def transaction(self):
+        """Collect every save inside the block into one atomic commit."""
+        tx = self._tx
+        tx.depth = getattr(tx, "depth", 0) + 1
+        try:
+            yield
+        except BaseException:
+            tx.depth -= 1
+            if tx.depth == 0:
+                # changes stay in memory; the next save picks them up
+                tx.pending = None
+            raise
+        tx.depth -= 1
+        if tx.depth == 0:
+            players, tx.pending = getattr(tx, "pending", None), None
+            if players is not None:
+                self._commit(players)
+
+    def _commit(self, players: dict[int, dict]):
+        with self.lock:
+            self._commit_locked(players)
+
+    def _commit_locked(self, players: dict[int, dict]):
+        changed: dict[int, Player] = {}
+        for jersey, rec in players.items():
+            try:
+                row = Player.from_record(jersey, rec)
+            except (ValueError, TypeError) as e:
+                print(f"[!] Not saving player {jersey}: {e}")
+                continue
+            if self._committed.get(row.jersey) != row:
+                changed[row.jersey] = row
+        gone = [j for j in self._committed if j not in players]
+        if not changed and not gone:
+            return
+        team_id = self.team_id
+        try:
+            with self._write() as conn:
+                conn.executemany(self.SQL_SONG, [(p.file,) for p in changed.values()])
+                conn.executemany(self.SQL_UPSERT, [(team_id, p.jersey, p.name, p.file, p.start)
+                                                   for p in changed.values()])
+                conn.executemany(self.SQL_DELETE, [(team_id, j) for j in gone])
+        except sqlite3.Error as e:
+            print(f"[x] Failed to save {os.path.basename(self.db_path)}: {e}")
+            return
+        self._committed.update(changed)
+        for jersey in gone:
+            del self._committed[jersey]
+        ops = [{"op": "put", "jersey": j, "rec": p.to_record()} for j, p in changed.items()]
+        ops += [{"op": "del", "jersey": j} for j in gone]
+        for sub in self._subscribers:
+            sub.apply(ops)
+
+    def compact(self):
+        """Drop songs no player uses any more and fold the WAL back into players.db."""
+        with self.lock:
+            try:
+                with self._write() as conn:
+                    conn.execute("DELETE FROM songs WHERE id NOT IN "
+                                 "(SELECT song_id FROM players WHERE song_id IS NOT NULL)")
+                self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            except sqlite3.Error as e:
+                print(f"[x] Failed to save {os.path.basename(self.db_path)}: {e}")
+
+    def close(self):
+        """Checkpoint and close the database (called on quit)."""
+        with self.lock:
+            if self._conn is not None:
+                self.compact()
+                self._conn.close()
+                self._conn = None
+                self._team_id = None
+
+
+def _registry_v1(store: PlayerStore):
+    """players table; copies an old players.json (+ journal) in once."""
+    conn = store._conn
+    conn.execute(
+        "CREATE TABLE players ("
+        " jersey INTEGER PRIMARY KEY,"
+        " name TEXT NOT NULL,"
+        " file TEXT NOT NULL,"
+        " start INTEGER NOT NULL DEFAULT 0)")
+    legacy = [p for p in (store.legacy_json, store.legacy_journal) if p and os.path.exists(p)]
+    if not legacy:
+        return
+    players, skipped = read_json_registry(store.legacy_json or "", store.legacy_journal or "")
+    rows = []
+    for jersey, rec in players.items():
+        try:
+            rows.append(Player.from_record(jersey, rec))
+        except (ValueError, TypeError):
+            skipped.append(rec)
+    conn.executemany("INSERT INTO players (jersey, name, file, start) VALUES (?, ?, ?, ?)",
+                     [(p.jersey, p.name, p.file, p.start) for p in rows])
+    for path in legacy:
+        os.replace(path, path + ".migrated")
+    print(f"[Registry] Moved {len(rows)} player(s) from {os.path.basename(legacy[0])} "
+          f"into {os.path.basename(store.db_path)}.")
+    if skipped:
+        print(f"[!] {len(skipped)} unreadable entr{'y' if len(skipped) == 1 else 'ies'} "
+              f"left out (still in {os.path.basename(legacy[0])}.migrated):")
+        for entry in skipped[:10]:
+            print("    ", repr(entry)[:70])
+
+
+def _registry_v2(store: PlayerStore):
+    """Multi-team: teams, songs and lineups; v1 players move to DEFAULT_TEAM."""
+    conn = store._conn
+    conn.execute("ALTER TABLE players RENAME TO players_v1")
+    conn.execute(
+        "CREATE TABLE teams ("
+        " id INTEGER PRIMARY KEY,"
+        " name TEXT NOT NULL UNIQUE COLLATE NOCASE,"
+        " lineup_pos INTEGER NOT NULL DEFAULT 0)")
+    conn.execute(
+        "CREATE TABLE songs ("
+        " id INTEGER PRIMARY KEY,"
+        " file TEXT NOT NULL UNIQUE)")
+    conn.execute(
+        "CREATE TABLE players ("
+        " team_id INTEGER NOT NULL REFERENCES teams(id) ON DELETE CASCADE,"
+        " jersey INTEGER NOT NULL,"
+        " name TEXT NOT NULL COLLATE NOCASE,"
+        " song_id INTEGER REFERENCES songs(id),"
+        " start INTEGER NOT NULL DEFAULT 0,"
+        " PRIMARY KEY (team_id, jersey))")
+    conn.execute("CREATE INDEX players_by_name ON players (name)")
+    conn.execute(
+        "CREATE TABLE lineups ("
+        " team_id INTEGER NOT NULL REFERENCES teams(id) ON DELETE CASCADE,"
+        " spot INTEGER NOT NULL,"
+        " jersey INTEGER NOT NULL,"
+        " PRIMARY KEY (team_id, spot))")
+    conn.execute("INSERT INTO teams (name) VALUES (?)", (DEFAULT_TEAM,))
+    conn.execute("INSERT INTO songs (file) SELECT DISTINCT file FROM players_v1")
+    conn.execute(
+        "INSERT INTO players (team_id, jersey, name, song_id, start) "
+        "SELECT t.id, v.jersey, v.name, s.id, v.start FROM players_v1 v "
+        "JOIN teams t ON t.name = ? JOIN songs s ON s.file = v.file", (DEFAULT_TEAM,))
+    conn.execute("DROP TABLE players_v1")
+
+
+# PRAGMA user_version -> step that upgrades the file to it
+MIGRATIONS = {
+    1: _registry_v1,
+    2: _registry_v2,
+}
+
+
+player_store = PlayerStore(REGISTRY_DB, PLAYERS_FILE, JOURNAL_FILE)
+
+
+# --- Player lookup index ---
+
+def normalize_name(name: str) -> str:
+    """'  José  O'Neil-Smith ' -> 'jose o neil smith' (accents and punctuation dropped)."""
+    text = unicodedata.normalize("NFKD", name)
+    text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    return normalize_query(text)
+
+
+def name_trigrams(name: str) -> set[str]:
+    """3-letter chunks of each word, padded so word starts weigh more."""
+    grams = set()
+    for word in name.split():
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+class PlayerIndex:
+    """
+    In-memory lookup of players by jersey or (part of a) name, so "holden",
+    "hol", "clay hol" or a typo like "holdne" finds the player without
+    walking the roster.
+
+    Three structures, all keyed by the normalized name:
+      - exact: full name and each name word -> jerseys
+      - words: sorted (word, jersey) pairs, for prefix search with bisect
+      - trigrams: 3-letter chunk -> jerseys, for fuzzy matches
+    It subscribes to player_store, which hands it only the changed records
+    after each commit.
+    """
+
+    def __init__(self):
+        self._names: dict[int, str] = {}
+        self._gram_counts: dict[int, int] = {}
+        self._exact: dict[str, set[int]] = {}
+        self._words: list[tuple[str, int]] = []
+        self._trigrams: dict[str, set[int]] = {}
+
+    def rebuild(self, players: dict[int, dict]):
+        self.__init__()
+        for jersey, rec in players.items():
+            self.put(jersey, rec)
+
+    def apply(self, ops: list[dict]):
+        for op in ops:
+            if op.get("op") == "del":
+                self.remove(int(op["jersey"]))
+            else:
+                self.put(int(op["jersey"]), op["rec"])
+
+    def put(self, jersey: int, rec: dict):
+        self.remove(jersey)
+        name = normalize_name(rec.get("name", ""))
+        self._names[jersey] = name
+        for key in {name, *name.split()}:
+            self._exact.setdefault(key, set()).add(jersey)
+        for word in set(name.split()):
+            bisect.insort(self._words, (word, jersey))
+        grams = name_trigrams(name)
+        self._gram_counts[jersey] = len(grams)
+        for gram in grams:
+            self._trigrams.setdefault(gram, set()).add(jersey)
+
+    def remove(self, jersey: int):
+        name = self._names.pop(jersey, None)
+        if name is None:
+            return
+        self._gram_counts.pop(jersey, None)
+        for key in {name, *name.split()}:
+            self._discard(self._exact, key, jersey)
+        for word in set(name.split()):
+            i = bisect.bisect_left(self._words, (word, jersey))
+            if i < len(self._words) and self._words[i] == (word, jersey):
+                del self._words[i]
+        for gram in name_trigrams(name):
+            self._discard(self._trigrams, gram, jersey)
+
+    @staticmethod
+    def _discard(table: dict[str, set[int]], key: str, jersey: int):
+        hits = table.get(key)
+        if hits is not None:
+            hits.discard(jersey)
+            if not hits:
+                del table[key]
+
+    def _prefixed(self, prefix: str) -> set[int]:
+        hits = set()
+        i = bisect.bisect_left(self._words, (prefix, -1))
+        while i < len(self._words) and self._words[i][0].startswith(prefix):
+            hits.add(self._words[i][1])
+            i += 1
+        return hits
+
+    def search(self, query: str, limit: int = 5) -> list[int]:
+        """
+        Jerseys matching query, best first: jersey number, exact full name,
+        every word an exact name word, every word a name-word prefix, then
+        fuzzy (trigram) matches.
+        """
+        q = normalize_name(query)
+        if not q:
+            return []
+        if q.isdigit():
+            return [int(q)] if int(q) in self._names else []
+        if q in self._exact and " " in q:
+            return sorted(self._exact[q])[:limit]
+        words = q.split()
+        for lookup in (lambda w: self._exact.get(w, set()), self._prefixed):
+            hits = set.intersection(*(set(lookup(w)) for w in words))
+            if hits:
+                return sorted(hits, key=lambda j: (self._names[j], j))[:limit]
+        return self._fuzzy(q, limit)
+
+    def _fuzzy(self, q: str, limit: int) -> list[int]:
+        grams = name_trigrams(q)
+        shared: dict[int, int] = {}
+        for gram in grams:
+            for jersey in self._trigrams.get(gram, ()):
+                shared[jersey] = shared.get(jersey, 0) + 1
+        scored = []
+        for jersey, n in shared.items():
+            # how much of the query was found, ties broken by overall overlap
+            found = n / len(grams)
+            overlap = n / (len(grams) + self._gram_counts[jersey] - n)
+            if found >= 0.4:
+                scored.append((-found, -overlap, jersey))
+        return [jersey for *_score, jersey in sorted(scored)[:limit]]
+
+
+player_index = PlayerIndex()
+player_store.subscribe(player_index)
+
+
+def load_players():
+    """Return dict jersey -> player dict."""
+    return player_store.load()
+
+
 def save_players(players: dict[int, dict]):
-    # store as jersey-string -> record mapping
-    data = {str(j): rec for j, rec in players.items()}
-    save_json(PLAYERS_FILE, data)
+    # only the changed rows are written
+    player_store.save(players)
 
 
 def load_config():
@@ -174,6 +1185,30 @@ def load_config():
         cfg = {}
     if "volume" not in cfg:
         cfg["volume"] = 80
+    if "import_workers" not in cfg:
+        cfg["import_workers"] = DEFAULT_IMPORT_WORKERS
+    if "cache_max_mb" not in cfg:
+        cfg["cache_max_mb"] = DEFAULT_CACHE_MB
+    if "preload" not in cfg:
+        cfg["preload"] = DEFAULT_PRELOAD
+    if "clip_seconds" not in cfg:
+        cfg["clip_seconds"] = DEFAULT_CLIP_SECONDS
+    if "clip_fade" not in cfg:
+        cfg["clip_fade"] = DEFAULT_CLIP_FADE
+    if "splash" not in cfg:
+        cfg["splash"] = True
+    if "downloader" not in cfg:
+        cfg["downloader"] = "yt-dlp"
+    if "team" not in cfg:
+        cfg["team"] = DEFAULT_TEAM
+    if "download_mode" not in cfg:
+        cfg["download_mode"] = "full"
+    if "audio_format" not in cfg:
+        cfg["audio_format"] = "native"
+    if "import_mode" not in cfg:
+        cfg["import_mode"] = "review"
+    if "search_results" not in cfg:
+        cfg["search_results"] = DEFAULT_SEARCH_RESULTS
     return cfg
 
 
@@ -181,126 +1216,1375 @@ def save_config(cfg: dict):
     save_json(CONFIG_FILE, cfg)
 
 
-# --- yt-dlp download ---
+# --- Download cache ---
+
+def normalize_query(query: str) -> str:
+    """'Hotel California  - Eagles' -> 'hotel california eagles' (cache key)."""
+    text = re.sub(r"[\W_]+", " ", query.lower())
+    return " ".join(text.split())
 
-def newest_mp3(dirpath: str) -> str | None:
-    mp3s = [
-        os.path.join(dirpath, f)
-        for f in os.listdir(dirpath)
-        if f.lower().endswith(".mp3")
-    ]
-    if not mp3s:
-        return None
-    return max(mp3s, key=lambda p: os.path.getmtime(p))
 
+def file_sha256(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
 
-def download_song(query: str) -> str | None:
+
+def link_or_copy(src: str, dst: str):
+    """Hardlink src to dst (no extra disk space); copy if links aren't supported."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+class DownloadCache:
     """
-    Search YouTube (first result) and download audio as MP3 into SONG_DIR.
-    Returns final mp3 path or None.
+    Remembers what a search query already downloaded.
+
+    songs/.cache/index.json maps a normalized query to the YouTube video ID
+    and a content-hashed copy of the audio in songs/.cache/. A hit is
+    hardlinked back into songs/ instead of searching/downloading again.
+    The cache stays under max_bytes by dropping least recently used files.
     """
-    if YoutubeDL is None:
-        print("[x] yt-dlp not installed. Run: pip install yt-dlp")
-        return None
 
-    before = set(os.listdir(SONG_DIR))
-
-    bar = "[..........]"
-    print("\n[Download] Searching + downloading:", query)
-    print(bar, "Downloading...", end="", flush=True)
-
-    ydl_opts = {
-        "format": "bestaudio/best",
-        "noplaylist": True,
-        "default_search": "ytsearch1",
-        "outtmpl": os.path.join(SONG_DIR, "%(title)s.%(ext)s"),
-        "postprocessors": [{
-            "key": "FFmpegExtractAudio",
-            "preferredcodec": "mp3",
-            "preferredquality": "192",
-        }],
-        "quiet": True,
-        "no_warnings": True,
-    }
+    def __init__(self, cache_dir: str, max_bytes: int):
+        self.cache_dir = cache_dir
+        self.index_path = os.path.join(cache_dir, "index.json")
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        data = load_json(self.index_path, {})
+        if not isinstance(data, dict):
+            data = {}
+        self.queries: dict[str, dict] = data.get("queries", {})
+        self.files: dict[str, dict] = data.get("files", {})
 
-    try:
-        with YoutubeDL(ydl_opts) as ydl:
-            ydl.download([query])
-    except Exception as e:
-        print("\n[x] yt-dlp error:", e)
-        return None
+    def checkout(self, query: str, dest_dir: str) -> str | None:
+        """Link the cached audio for query into dest_dir; None on a miss."""
+        key = normalize_query(query)
+        with self._lock:
+            entry = self.queries.get(key)
+            if not entry:
+                return None
+            cached = os.path.join(self.cache_dir, entry["file"])
+            if not os.path.exists(cached):
+                # somebody cleaned the folder by hand
+                self.queries.pop(key, None)
+                self.files.pop(entry["file"], None)
+                self._save()
+                return None
+            ext = os.path.splitext(cached)[1]
+            title = sanitize_player_name(entry.get("title", "")) or "song"
+            target = os.path.join(dest_dir, f"{title}.{uuid.uuid4().hex[:8]}{ext}")
+            try:
+                link_or_copy(cached, target)
+            except OSError as e:
+                print("[!] Cache read failed, downloading instead:", e)
+                return None
+            meta = self.files.setdefault(entry["file"], {"size": os.path.getsize(cached)})
+            meta["used"] = time.time()
+            self._save()
+            return target
 
-    after = set(os.listdir(SONG_DIR))
-    new_files = [f for f in after - before if f.lower().endswith(".mp3")]
-    if new_files:
-        full = [os.path.join(SONG_DIR, f) for f in new_files]
-        newest = max(full, key=lambda p: os.path.getmtime(p))
-        print("\r[##########] Download complete!")
-        print(f"[✓] Saved: {os.path.basename(newest)}")
-        return newest
-
-    newest = newest_mp3(SONG_DIR)
-    if newest:
-        print("\r[##########] Download finished (picked newest mp3).")
-        print(f"[✓] Saved: {os.path.basename(newest)}")
-        return newest
-
-    print("\n[x] Download finished but mp3 not found. Check songs folder.")
-    return None
+    def store(self, query: str, path: str, info: dict | None):
+        """Add a finished download to the cache (content-hashed, deduplicated)."""
+        try:
+            digest = file_sha256(path)
+        except OSError:
+            return
+        fname = digest[:24] + os.path.splitext(path)[1].lower()
+        cached = os.path.join(self.cache_dir, fname)
+        with self._lock:
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                if not os.path.exists(cached):
+                    link_or_copy(path, cached)
+            except OSError as e:
+                print("[!] Could not add download to cache:", e)
+                return
+            info = info or {}
+            self.queries[normalize_query(query)] = {
+                "id": info.get("id"),
+                "title": info.get("title", ""),
+                "file": fname,
+            }
+            self.files[fname] = {"size": os.path.getsize(cached), "used": time.time()}
+            self._evict()
+            self._save()
 
+    def _evict(self):
+        total = sum(f.get("size", 0) for f in self.files.values())
+        for fname in sorted(self.files, key=lambda n: self.files[n].get("used", 0)):
+            if total <= self.max_bytes:
+                break
+            total -= self.files.pop(fname).get("size", 0)
+            try:
+                os.remove(os.path.join(self.cache_dir, fname))
+            except OSError:
+                pass
+            for key in [k for k, e in self.queries.items() if e.get("file") == fname]:
+                del self.queries[key]
 
-# --- Player registry helpers ---
+    def _save(self):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        save_json(self.index_path, {"queries": self.queries, "files": self.files})
 
-def prompt_int(prompt: str, allow_blank: bool = False) -> int | None:
-    while True:
-        text = input(prompt).strip()
-        if allow_blank and text == "":
-            return None
-        if text.isdigit():
-            return int(text)
-        print("Please enter a whole number.")
+
+download_cache = DownloadCache(CACHE_DIR, DEFAULT_CACHE_MB * 1024 * 1024)
 
 
-def add_player_from_file(path: str, players: dict[int, dict]) -> dict[int, dict]:
+class SearchCache:
     """
-    Interactive version: ask for jersey, name, start time, and rename file to first_last.mp3.
+    Search results (metadata only: id, title, duration, channel, url) by
+    normalized query, in songs/.cache/search.json.
+
+    Import planning looks here before searching, so importing the same CSV
+    again, resuming, or re-ranking rows after the scoring changes needs no
+    network. An entry is searched again once it is older than max_age
+    seconds, or when it holds fewer results than are wanted now.
     """
-    if not path or not os.path.exists(path):
-        print("[x] File not found for player setup.")
-        return players
 
-    print("\nSet up player for this song.")
-    name = input("Player name (First Last): ").strip()
-    if not name:
-        print("[!] Skipping player setup.")
-        return players
+    def __init__(self, path: str, max_age: float):
+        self.path = path
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        data = load_json(path, {})
+        self.entries: dict[str, dict] = data if isinstance(data, dict) else {}
 
-    jersey = prompt_int("Jersey number: ")
-    start = prompt_int("Start time in seconds (0 for start of song): ")
-    if start is None:
-        start = 0
+    def get(self, query: str, limit: int) -> list[dict] | None:
+        with self._lock:
+            entry = self.entries.get(normalize_query(query))
+        if not entry or time.time() - entry.get("time", 0) > self.max_age:
+            return None
+        results = entry.get("results") or []
+        if entry.get("limit", 0) < limit and len(results) >= entry.get("limit", 0):
+            return None   # asked for fewer last time and YouTube may have more
+        return results[:limit]
 
-    safe = sanitize_player_name(name)
-    target = os.path.join(SONG_DIR, safe + ".mp3")
-    target = unique_path(target)
+    def put(self, query: str, limit: int, results: list[dict]):
+        with self._lock:
+            self.entries[normalize_query(query)] = {"time": time.time(), "limit": limit,
+                                                    "results": results}
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            save_json(self.path, self.entries)
 
-    try:
-        os.rename(path, target)
-        filename = os.path.basename(target)
-        print(f"[✓] Renamed to {filename}")
-    except Exception as e:
-        print("[x] Rename failed, keeping original filename:", e)
-        filename = os.path.basename(path)
 
-    players[jersey] = {
-        "jersey": jersey,
-        "name": name,
-        "file": filename,
-        "start": int(start),
+search_cache = SearchCache(SEARCH_CACHE_FILE, SEARCH_CACHE_DAYS * 86400)
+
+
+# --- Search result ranking ---
+# The first search hit is often the wrong recording for a walk-up: a live
+# version, a 10-hour loop, a music video with a long intro. Import planning
+# scores the top few results instead and takes the best one.
+
+# Title words that usually mean another version, unless the CSV asks for it
+OFF_VERSION_WORDS = {"live", "cover", "karaoke", "remix", "instrumental", "acoustic", "reaction",
+                     "loop", "hour", "hours", "nightcore", "slowed", "sped", "8d", "tutorial", "lesson"}
+
+# A match scoring below this is flagged with "?" in the import plan
+LOW_MATCH_SCORE = 45
+
+
+def rank_candidates(song: str, artist: str, candidates: list[dict]) -> list[dict]:
+    """
+    Score search results for a song/artist, best first. Each result comes
+    back as a copy with "score" (higher is better) and "why" (the penalties
+    and bonuses that applied, for the plan display).
+
+    Title words matching the song count most, then the artist in the title
+    or channel; a length outside 1-10 minutes, off-version words (live,
+    remix, loop...) and music videos cost points; "- Topic" / VEVO /
+    artist-named channels and "official audio" earn them. Ties keep
+    YouTube's order.
+    """
+    song_words = set(normalize_query(song).split())
+    artist_words = set(normalize_query(artist).split())
+    ranked = []
+    for cand in candidates:
+        title = normalize_query(cand.get("title") or "")
+        title_words = set(title.split())
+        channel = cand.get("channel") or ""
+        channel_words = set(normalize_query(channel).split())
+        score, why = 0.0, []
+
+        if song_words:
+            score += 40 * len(song_words & title_words) / len(song_words)
+        if artist_words:
+            score += 25 * len(artist_words & (title_words | channel_words)) / len(artist_words)
+
+        duration = cand.get("duration")
+        if duration:
+            if duration < 60 or duration > 600:
+                score -= 40
+                why.append(f"length {fmt_eta(duration)}")
+            elif 90 <= duration <= 420:
+                score += 10
+
+        extra = sorted((title_words - song_words - artist_words) & OFF_VERSION_WORDS)
+        if extra:
+            score -= 15 * len(extra)
+            why.append(", ".join(extra))
+
+        if channel.endswith(" - Topic"):
+            score += 20
+            why.append("topic channel")
+        elif "vevo" in channel.lower():
+            score += 10
+            why.append("VEVO")
+        elif artist_words and artist_words <= channel_words:
+            score += 15
+            why.append("artist's channel")
+        if "official audio" in title:
+            score += 10
+        elif "official video" in title or "music video" in title:
+            score -= 5
+            why.append("music video")
+
+        ranked.append({**cand, "score": round(score, 1), "why": why})
+    ranked.sort(key=lambda c: -c["score"])
+    return ranked
+
+
+# --- Download progress ---
+
+def fmt_bytes(n: float | None) -> str:
+    if not n:
+        return "0 B"
+    for unit in ("B", "KB", "MB", "GB"):
+        if n < 1024 or unit == "GB":
+            return f"{n:.0f} {unit}" if unit == "B" else f"{n:.1f} {unit}"
+        n /= 1024
+    return f"{n:.1f} GB"
+
+
+def fmt_eta(seconds: float | None) -> str:
+    if seconds is None:
+        return "--:--"
+    seconds = int(seconds)
+    return f"{seconds // 60}:{seconds % 60:02d}"
+
+
+class DownloadProgress:
+    """
+    Live state of every download job, fed by yt-dlp's progress_hooks
+    (bytes, speed, ETA) and postprocessor_hooks (conversion phase).
+
+    A single download draws its own bar from it; a batch import prints one
+    combined line for all concurrent jobs every PROGRESS_INTERVAL seconds.
+    A job that gets no new bytes for STALL_SECONDS is flagged as stalled,
+    so a dead download is easy to tell from a slow one. When a job ends its
+    timings (queue wait, download, conversion, total) are appended to
+    download_timings.csv.
+    """
+
+    def __init__(self, log_path: str = DOWNLOAD_LOG):
+        self.log_path = log_path
+        self._jobs: dict[str, dict] = {}
+        self._lock = threading.Lock()
+        self.completed = 0
+        self.failed = 0
+
+    def start(self, label: str, query: str, queued: bool = False) -> str:
+        """Register a job and return its key (queued=True: not running yet)."""
+        key = uuid.uuid4().hex[:8]
+        now = time.time()
+        with self._lock:
+            self._jobs[key] = {
+                "label": label,
+                "query": query,
+                "phase": "queued" if queued else "searching",
+                "created": now,
+                "started": None if queued else now,
+                "last_data": now,
+                "bytes": 0,
+                "total": None,
+                "speed": None,
+                "eta": None,
+                "dl_start": None,
+                "dl_end": None,
+                "pp_start": None,
+                "pp_end": None,
+                "postprocessor": None,
+            }
+        return key
+
+    def begin(self, key: str):
+        """A queued job got a worker."""
+        now = time.time()
+        with self._lock:
+            job = self._jobs.get(key)
+            if job and job["started"] is None:
+                job.update(phase="searching", started=now, last_data=now)
+
+    def hooks(self, key: str, draw: bool = False):
+        """(progress_hook, postprocessor_hook) for one job's yt-dlp options."""
+        last_draw = [0.0]
+
+        def redraw(force: bool = False):
+            now = time.perf_counter()
+            if draw and (force or now - last_draw[0] >= 0.1):
+                last_draw[0] = now
+                print("\r" + self.line(key).ljust(72), end="", flush=True)
+
+        def on_progress(d):
+            self._on_progress(key, d)
+            redraw(d.get("status") == "finished")
+
+        def on_postprocess(d):
+            self._on_postprocess(key, d)
+            redraw(True)
+
+        return on_progress, on_postprocess
+
+    def _on_progress(self, key: str, d: dict):
+        now = time.time()
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is None:
+                return
+            status = d.get("status")
+            got = d.get("downloaded_bytes") or 0
+            if status == "downloading":
+                if job["dl_start"] is None:
+                    job["dl_start"] = now
+                job["phase"] = "downloading"
+                if got > job["bytes"]:
+                    job["last_data"] = now
+                job["bytes"] = got
+                job["total"] = d.get("total_bytes") or d.get("total_bytes_estimate") or job["total"]
+                job["speed"] = d.get("speed")
+                job["eta"] = d.get("eta")
+            elif status == "finished":
+                job["dl_end"] = now
+                job["last_data"] = now
+                job["bytes"] = d.get("total_bytes") or got or job["bytes"]
+                job["total"] = job["bytes"]
+                job["speed"] = None
+                job["eta"] = 0
+
+    def _on_postprocess(self, key: str, d: dict):
+        now = time.time()
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is None:
+                return
+            job["last_data"] = now
+            if d.get("status") == "started":
+                if job["pp_start"] is None:
+                    job["pp_start"] = now
+                job["phase"] = "converting"
+                job["postprocessor"] = d.get("postprocessor")
+            elif d.get("status") == "finished":
+                job["pp_end"] = now
+
+    def line(self, key: str) -> str:
+        """One job's status, e.g. '[####......]  42%  1.2 MB/s  ETA 0:04'."""
+        with self._lock:
+            job = dict(self._jobs.get(key) or {})
+        if not job:
+            return ""
+        if job["phase"] == "converting":
+            return f"[##########] Converting ({job['postprocessor'] or 'ffmpeg'})..."
+        if job["phase"] in ("queued", "searching"):
+            return f"[..........] {job['phase'].capitalize()}..."
+        total = job["total"]
+        frac = min(1.0, job["bytes"] / total) if total else 0.0
+        bar = "#" * int(frac * 10)
+        speed = f"{fmt_bytes(job['speed'])}/s" if job["speed"] else "--"
+        text = f"[{bar:.<10}] {frac * 100:3.0f}%  {fmt_bytes(job['bytes'])}"
+        if total:
+            text += f"/{fmt_bytes(total)}"
+        return f"{text}  {speed}  ETA {fmt_eta(job['eta'])}"
+
+    def summary(self) -> str:
+        """Combined line for all jobs: counts, total speed, ETA, stalls."""
+        now = time.time()
+        with self._lock:
+            jobs = [dict(j) for j in self._jobs.values()]
+        running = [j for j in jobs if j["phase"] != "queued"]
+        downloading = [j for j in running if j["phase"] == "downloading"]
+        speed = sum(j["speed"] or 0 for j in downloading)
+        left = sum(max(0, (j["total"] or 0) - j["bytes"]) for j in downloading)
+        eta = left / speed if speed else None
+        parts = [
+            f"{len(running)} running",
+            f"{len(jobs) - len(running)} queued",
+            f"{sum(1 for j in running if j['phase'] == 'converting')} converting",
+            f"{fmt_bytes(speed)}/s",
+            f"ETA {fmt_eta(eta)}",
+            f"done {self.completed}",
+        ]
+        if self.failed:
+            parts.append(f"failed {self.failed}")
+        stalled = [j["label"] for j in running
+                   if j["phase"] != "converting" and now - j["last_data"] > STALL_SECONDS]
+        if stalled:
+            parts.append("STALLED: " + ", ".join(stalled))
+        return " | ".join(parts)
+
+    def finish(self, key: str, status: str, path: str | None = None):
+        """Close a job (status: ok, cache, failed, cancelled) and log its timings."""
+        now = time.time()
+        with self._lock:
+            job = self._jobs.pop(key, None)
+            if job is None:
+                return
+            if status in ("ok", "cache"):
+                self.completed += 1
+            elif status == "failed":
+                self.failed += 1
+
+        def span(a, b):
+            return f"{job[b] - job[a]:.2f}" if job[a] and job[b] else ""
+
+        job["end"] = now
+        dl_secs = (job["dl_end"] or 0) - (job["dl_start"] or 0)
+        avg = job["bytes"] / dl_secs if job["dl_start"] and dl_secs > 0 else 0
+        try:
+            new_file = not os.path.exists(self.log_path)
+            with open(self.log_path, "a", encoding="utf-8", newline="") as f:
+                w = csv.writer(f)
+                if new_file:
+                    w.writerow(["time", "label", "query", "status", "queued_s", "search_s",
+                                "download_s", "convert_s", "total_s", "bytes", "avg_bytes_per_s",
+                                "file"])
+                w.writerow([
+                    time.strftime("%Y-%m-%d %H:%M:%S"), job["label"], job["query"], status,
+                    span("created", "started"), span("started", "dl_start"),
+                    span("dl_start", "dl_end"), span("pp_start", "pp_end"),
+                    span("created", "end"), job["bytes"], f"{avg:.0f}",
+                    os.path.basename(path) if path else "",
+                ])
+        except OSError:
+            pass
+
+    @contextmanager
+    def reporting(self, interval: float = PROGRESS_INTERVAL):
+        """Print summary() every `interval` seconds while jobs are running."""
+        stop = threading.Event()
+
+        def loop():
+            while not stop.wait(interval):
+                with self._lock:
+                    busy = bool(self._jobs)
+                if busy:
+                    with _print_lock:
+                        print("[Progress]", self.summary())
+
+        t = threading.Thread(target=loop, daemon=True)
+        t.start()
+        try:
+            yield self
+        finally:
+            stop.set()
+            t.join()
+
+
+download_progress = DownloadProgress()
+
+
+# --- yt-dlp download ---
+
+def job_outtmpl(dest_dir: str, job_id: str | None = None) -> str:
+    """
+    Output template unique to one download job, so two jobs (even for the
+    same video) can never write or claim the same file. A checkpointed
+    import passes a stable job_id so a retry finds its old .part file.
+    """
+    token = job_id or uuid.uuid4().hex[:8]
+    return os.path.join(dest_dir, f"%(title)s.{token}.%(ext)s")
+
+
+def first_entry(info: dict | None) -> dict | None:
+    """ytsearch results come back as a playlist; return the single video."""
+    if info and info.get("entries") is not None:
+        return next((e for e in info["entries"] if e), None)
+    return info
+
+
+def downloaded_path(info: dict | None, hooked: list[str]) -> str | None:
+    """
+    Work out the final audio file of a download from what yt-dlp reported:
+    the post-processor hook path first, then the info dict.
+    """
+    for path in reversed(hooked):
+        if path and os.path.exists(path):
+            return path
+    info = first_entry(info)
+    if not info:
+        return None
+    candidates = [d.get("filepath") for d in info.get("requested_downloads") or []]
+    candidates.append(info.get("filepath"))
+    for path in candidates:
+        if path and os.path.exists(path):
+            return path
+    return None
+
+
+# --- Download backends ---
+# download_song talks to a backend through three calls: available(),
+# supports_sections() and fetch(query, outtmpl, progress_hooks,
+# postprocessor_hooks, section=None), which returns a yt-dlp style info
+# dict (or raises). section=(from, to) seconds asks for just that part of
+# the song. YtDlpBackend is the real thing; LocalBackend serves fixture
+# files with synthetic latency/bandwidth so the import pipeline, cache and
+# concurrency can be timed with no network.
+# session() returns a DownloadSession with the same fetch() for a batch to
+# hold for the whole run (see YtDlpSession). search(query, limit) looks a
+# query up without downloading anything and returns candidate dicts (id,
+# title, duration, channel, url); fetch() accepts a candidate's url.
+#
+# audio_format "native" keeps the audio stream YouTube serves: an m4a
+# download is used as is and webm/opus is only remuxed to .opus (no
+# re-encode). "mp3" converts every download to a 192k MP3 like before.
+
+AUDIO_FORMATS = ("native", "mp3")
+
+
+def search_candidate(entry: dict) -> dict:
+    """The fields of a search result that an import plan shows and downloads."""
+    video_id = entry.get("id") or ""
+    url = entry.get("webpage_url") or entry.get("url") or video_id
+    if url == video_id and len(video_id) == 11:
+        url = "https://www.youtube.com/watch?v=" + video_id
+    return {
+        "id": video_id,
+        "title": entry.get("title") or "",
+        "duration": entry.get("duration"),
+        "channel": entry.get("channel") or entry.get("uploader") or "",
+        "url": url,
     }
-    save_players(players)
-    print(f"[✓] Player {name} (# {jersey}) saved.")
-    return players
+
+
+class DownloadSession:
+    """
+    A backend held open for a batch: fetch() and search() take the same
+    arguments as the backend's, so the output path, hooks and section are
+    set per job. This base version just forwards to the backend; use it as
+    a context manager (or call close()) so backends that keep state can
+    release it.
+    """
+
+    def __init__(self, backend):
+        self.backend = backend
+
+    def search(self, query: str, limit: int = 1) -> list[dict]:
+        return self.backend.search(query, limit)
+
+    def fetch(self, query: str, outtmpl: str, progress_hooks: list, postprocessor_hooks: list,
+              section: tuple[int, int] | None = None) -> dict | None:
+        return self.backend.fetch(query, outtmpl, progress_hooks, postprocessor_hooks, section=section)
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class YtDlpSession(DownloadSession):
+    """
+    Keeps one YoutubeDL per worker thread for the whole batch instead of
+    building one per song, so option processing, extractor setup (and the
+    YouTube extractor's cached state) and the HTTP connection pool are
+    paid for once per worker. A YoutubeDL isn't safe to share between
+    threads, hence one each.
+
+    Per job only the output template, download range and hooks change: the
+    instance's own hooks forward to whatever the running job passed in.
+    """
+
+    def __init__(self, backend: "YtDlpBackend"):
+        super().__init__(backend)
+        self._local = threading.local()
+        self._open: list = []
+        self._lock = threading.Lock()
+
+    def _searcher(self):
+        ydl = getattr(self._local, "searcher", None)
+        if ydl is None:
+            ydl = self._local.searcher = YoutubeDL(self.backend.search_options())
+            with self._lock:
+                self._open.append(ydl)
+        return ydl
+
+    def _instance(self):
+        inst = getattr(self._local, "inst", None)
+        if inst is None:
+            job = {"progress": [], "post": []}
+
+            def on_progress(d):
+                for hook in job["progress"]:
+                    hook(d)
+
+            def on_post(d):
+                for hook in job["post"]:
+                    hook(d)
+
+            ydl = YoutubeDL(self.backend.options("%(title)s.%(ext)s", [on_progress], [on_post]))
+            inst = self._local.inst = (ydl, job)
+            with self._lock:
+                self._open.append(ydl)
+        return inst
+
+    def search(self, query: str, limit: int = 1) -> list[dict]:
+        return self.backend.search_with(self._searcher(), query, limit)
+
+    def fetch(self, query: str, outtmpl: str, progress_hooks: list, postprocessor_hooks: list,
+              section: tuple[int, int] | None = None) -> dict | None:
+        ydl, job = self._instance()
+        # yt-dlp keeps the parsed template as a dict (outtmpl_dict before 2022.11)
+        templates = getattr(ydl, "outtmpl_dict", None) or ydl.params["outtmpl"]
+        templates["default"] = outtmpl
+        for key in ("download_ranges", "force_keyframes_at_cuts"):
+            ydl.params.pop(key, None)
+        if section:
+            ydl.params.update(self.backend.section_options(section))
+        job["progress"], job["post"] = progress_hooks, postprocessor_hooks
+        try:
+            return ydl.extract_info(query, download=True)
+        finally:
+            job["progress"], job["post"] = [], []
+
+    def close(self):
+        with self._lock:
+            instances, self._open = self._open, []
+        for ydl in instances:
+            ydl.__exit__(None, None, None)   # same as leaving `with YoutubeDL(...)`
+
+
+class YtDlpBackend:
+    """Search YouTube (first result) and download the audio via yt-dlp."""
+
+    name = "yt-dlp"
+
+    def __init__(self, audio_format: str = "native"):
+        self.audio_format = audio_format if audio_format in AUDIO_FORMATS else "native"
+
+    def available(self) -> bool:
+        if load_yt_dlp() is None:
+            print("[x] yt-dlp not installed. Run: pip install yt-dlp")
+            return False
+        return True
+
+    def supports_sections(self) -> bool:
+        """yt-dlp 2022.10+ can download a time range (download_ranges)."""
+        if load_yt_dlp() is None:
+            return False
+        try:
+            from yt_dlp.utils import download_range_func  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
+    def options(self, outtmpl: str, progress_hooks: list, postprocessor_hooks: list) -> dict:
+        """YoutubeDL options for one download (or a session's instance)."""
+        if self.audio_format == "mp3":
+            fmt, codec = "bestaudio/best", "mp3"
+        else:
+            # "best" copies the stream; yt-dlp skips the step for a file
+            # that is already in its target container (m4a)
+            fmt, codec = "bestaudio[ext=m4a]/bestaudio/best", "best"
+        ydl_opts = {
+            "format": fmt,
+            "noplaylist": True,
+            "default_search": "ytsearch1",
+            "outtmpl": outtmpl,
+            "continuedl": True,
+            "postprocessors": [{
+                "key": "FFmpegExtractAudio",
+                "preferredcodec": codec,
+                "preferredquality": "192",
+            }],
+            "progress_hooks": progress_hooks,
+            "postprocessor_hooks": postprocessor_hooks,
+            "quiet": True,
+            "no_warnings": True,
+            "noprogress": True,
+        }
+        return ydl_opts
+
+    def search_options(self) -> dict:
+        """Metadata-only lookups: flat search results, nothing downloaded."""
+        return {
+            "extract_flat": "in_playlist",
+            "skip_download": True,
+            "quiet": True,
+            "no_warnings": True,
+        }
+
+    def search_with(self, ydl, query: str, limit: int = 1) -> list[dict]:
+        info = ydl.extract_info(f"ytsearch{max(1, limit)}:{query}", download=False)
+        return [search_candidate(e) for e in (info or {}).get("entries") or [] if e]
+
+    def search(self, query: str, limit: int = 1) -> list[dict]:
+        """Top `limit` YouTube results for query (metadata only)."""
+        with YoutubeDL(self.search_options()) as ydl:
+            return self.search_with(ydl, query, limit)
+
+    def section_options(self, section: tuple[int, int]) -> dict:
+        """Extra options that fetch only the walk-up window (via FFmpeg)."""
+        from yt_dlp.utils import download_range_func
+        return {
+            "download_ranges": download_range_func(None, [section]),
+            "force_keyframes_at_cuts": True,
+        }
+
+    def fetch(self, query: str, outtmpl: str, progress_hooks: list, postprocessor_hooks: list,
+              section: tuple[int, int] | None = None) -> dict | None:
+        ydl_opts = self.options(outtmpl, progress_hooks, postprocessor_hooks)
+        if section:
+            ydl_opts.update(self.section_options(section))
+        with YoutubeDL(ydl_opts) as ydl:
+            return ydl.extract_info(query, download=True)
+
+    def session(self) -> YtDlpSession:
+        if load_yt_dlp() is None:
+            return DownloadSession(self)   # fetch() will report the error
+        return YtDlpSession(self)
+
+
+class LocalBackend:
+    """
+    Offline stand-in for yt-dlp: resolves a query to an audio file under
+    `root` and "downloads" it by copying at a synthetic speed.
+
+    A query is looked up in root/catalog.json ({"query": "relative/file"})
+    first, then matched against file names by shared words. Each fetch
+    waits `latency` seconds (the search), copies at `bandwidth` bytes/s
+    (0 = as fast as the disk allows) through a .part file that a retry
+    resumes, then spends `convert_seconds` in a fake conversion step. The
+    same progress/post-processor hooks fire as with yt-dlp. Fixtures are
+    already playable, so with audio_format "native" the conversion step is
+    skipped (the file keeps its extension either way).
+
+    A section fetch copies the matching share of the file's bytes,
+    treating every fixture as `track_seconds` long, and scales the
+    conversion time the same way, so segment imports can be timed too.
+    """
+
+    name = "local"
+    CHUNK = 64 * 1024
+
+    def __init__(self, root: str, latency: float = 0.0, bandwidth: float = 0.0,
+                 convert_seconds: float = 0.0, track_seconds: float = 210.0,
+                 audio_format: str = "native"):
+        self.root = os.path.abspath(root)
+        self.latency = max(0.0, float(latency))
+        self.bandwidth = max(0.0, float(bandwidth))
+        self.convert_seconds = max(0.0, float(convert_seconds))
+        self.track_seconds = max(1.0, float(track_seconds))
+        self.audio_format = audio_format if audio_format in AUDIO_FORMATS else "native"
+        self._index: dict[str, set[str]] | None = None
+        self._catalog: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def available(self) -> bool:
+        if not os.path.isdir(self.root):
+            print(f"[x] Local download library not found: {self.root}")
+            return False
+        return True
+
+    def _load(self):
+        with self._lock:
+            if self._index is not None:
+                return
+            catalog = load_json(os.path.join(self.root, "catalog.json"), {})
+            if isinstance(catalog, dict):
+                self._catalog = {normalize_query(q): f for q, f in catalog.items()}
+            index = {}
+            for dirpath, _dirs, files in os.walk(self.root):
+                for fn in files:
+                    if os.path.splitext(fn)[1].lower() in AUDIO_EXTS:
+                        rel = os.path.relpath(os.path.join(dirpath, fn), self.root)
+                        words = normalize_query(os.path.splitext(fn)[0].replace("_", " "))
+                        index[rel] = set(words.split())
+            self._index = index
+
+    def matches(self, query: str) -> list[str]:
+        """Relative paths of the fixtures matching query, best first."""
+        self._load()
+        key = normalize_query(query)
+        words = set(key.replace("_", " ").split())
+        scored = [(len(words & names), rel) for rel, names in self._index.items()]
+        # most shared words first, shortest name wins a tie
+        found = [rel for score, rel in sorted(scored, key=lambda sr: (-sr[0], len(sr[1]))) if score]
+        if key in self._catalog:
+            rel = self._catalog[key]
+            found = [rel] + [r for r in found if r != rel]
+        return found
+
+    def resolve(self, query: str) -> str | None:
+        """Relative path of the fixture that best matches query (or a search result's url), or None."""
+        if query.startswith("local:"):
+            self._load()
+            rel = query[len("local:"):]
+            return rel if rel in self._index else None
+        found = self.matches(query)
+        return found[0] if found else None
+
+    def supports_sections(self) -> bool:
+        return True
+
+    def search(self, query: str, limit: int = 1) -> list[dict]:
+        """The best `limit` fixtures as search results (same latency as a fetch)."""
+        time.sleep(self.latency)
+        return [{"id": "local:" + rel,
+                 "title": os.path.splitext(os.path.basename(rel))[0].replace("_", " "),
+                 "duration": self.track_seconds, "channel": "local", "url": "local:" + rel}
+                for rel in self.matches(query)[:max(1, limit)]]
+
+    def session(self) -> DownloadSession:
+        # nothing to pool: the fixture index is built once per backend anyway
+        return DownloadSession(self)
+
+    def fetch(self, query: str, outtmpl: str, progress_hooks: list, postprocessor_hooks: list,
+              section: tuple[int, int] | None = None) -> dict | None:
+        time.sleep(self.latency)
+        rel = self.resolve(query)
+        if rel is None:
+            raise LookupError(f"no local match for {query!r}")
+        src = os.path.join(self.root, rel)
+        title, ext = os.path.splitext(os.path.basename(src))
+        path = outtmpl.replace("%(title)s", title).replace("%(ext)s", ext.lstrip("."))
+        part = path + ".part"
+        size = os.path.getsize(src)
+        lo, hi, share = 0, size, 1.0
+        if section:
+            per_sec = size / self.track_seconds
+            lo = min(size, int(section[0] * per_sec))
+            hi = min(size, max(lo, int(section[1] * per_sec)))
+            share = (hi - lo) / size if size else 0.0
+        total = hi - lo
+        done = min(total, os.path.getsize(part)) if os.path.exists(part) else 0
+        t0 = time.perf_counter()
+        sent = 0
+        for hook in progress_hooks:
+            hook({"status": "downloading", "filename": part, "downloaded_bytes": done,
+                  "total_bytes": total, "speed": None, "eta": None})
+        with open(src, "rb") as fin, open(part, "ab") as fout:
+            fin.seek(lo + done)
+            while True:
+                chunk = fin.read(min(self.CHUNK, total - done))
+                if not chunk:
+                    break
+                fout.write(chunk)
+                done += len(chunk)
+                sent += len(chunk)
+                elapsed = time.perf_counter() - t0
+                if self.bandwidth:
+                    ahead = sent / self.bandwidth - elapsed
+                    if ahead > 0:
+                        time.sleep(ahead)
+                        elapsed += ahead
+                speed = sent / elapsed if elapsed > 0 else None
+                for hook in progress_hooks:
+                    hook({
+                        "status": "downloading",
+                        "filename": part,
+                        "downloaded_bytes": done,
+                        "total_bytes": total,
+                        "speed": speed,
+                        "eta": (total - done) / speed if speed else None,
+                    })
+        os.replace(part, path)
+        for hook in progress_hooks:
+            hook({"status": "finished", "filename": path, "downloaded_bytes": total, "total_bytes": total})
+        info = {"id": "local:" + rel, "title": title, "ext": ext.lstrip("."), "filepath": path}
+        for hook in postprocessor_hooks:
+            hook({"status": "started", "postprocessor": "LocalConvert", "info_dict": info})
+        if self.audio_format == "mp3":
+            time.sleep(self.convert_seconds * share)
+        for hook in postprocessor_hooks:
+            hook({"status": "finished", "postprocessor": "LocalConvert", "info_dict": info})
+        return info
+
+
+def make_downloader(cfg: dict):
+    """
+    Backend named by config.json "downloader" ("yt-dlp" or "local"),
+    keeping or converting audio per "audio_format" ("native" or "mp3").
+    """
+    if cfg.get("downloader") == "local":
+        return LocalBackend(
+            cfg.get("local_library", os.path.join(DATA_DIR, "fixtures")),
+            latency=float(cfg.get("local_latency_ms", 0)) / 1000,
+            bandwidth=float(cfg.get("local_bandwidth_kbps", 0)) * 1024,
+            convert_seconds=float(cfg.get("local_convert_ms", 0)) / 1000,
+            track_seconds=float(cfg.get("local_track_seconds", 210)),
+            audio_format=cfg.get("audio_format", "native"),
+        )
+    return YtDlpBackend(cfg.get("audio_format", "native"))
+
+
+downloader = YtDlpBackend()
+
+# Segment mode (config.json "download_mode": "segment"): seconds of song
+# fetched from each player's start time; 0 = download whole songs
+segment_seconds = 0
+
+
+def download_section(start: int | None) -> tuple[int, int] | None:
+    """
+    (from, to) seconds to download for a walk-up starting at `start`, or
+    None for the whole song (segment mode off, or the backend can't cut).
+    A player whose song was cut this way plays it from 0.
+    """
+    if not segment_seconds or not downloader.supports_sections():
+        return None
+    start = max(0, int(start or 0))
+    return start, start + segment_seconds
+
+
+def download_song(
+    query: str,
+    dest_dir: str | None = None,
+    quiet: bool = False,
+    use_cache: bool = True,
+    job_id: str | None = None,
+    progress_key: str | None = None,
+    section: tuple[int, int] | None = None,
+    session: DownloadSession | None = None,
+    target: str | None = None,
+) -> str | None:
+    """
+    Search YouTube (first result) and download its audio into dest_dir
+    (default SONG_DIR).
+    Returns the final audio path or None; its extension is whatever the
+    backend produced (.m4a/.opus natively, .mp3 when converting). The work
+    is done by the current `downloader` backend (yt-dlp unless config.json
+    says otherwise).
+
+    The path comes straight from yt-dlp (no folder scanning), and every call
+    uses its own output name, so parallel downloads stay separate.
+    quiet=True drops the progress bar. A query that was downloaded before
+    is served from the download cache (use_cache=False forces a fetch).
+    job_id pins the output name (see job_outtmpl) so partial downloads resume.
+    Progress goes to download_progress under progress_key (a new job is
+    started if none is given) and the job is finished here either way.
+    section=(from, to) fetches only that window (see download_section); it
+    is cached separately from the full song. A batch passes its
+    DownloadSession as `session` so every row reuses the same downloader.
+    target (a planned import's video URL) is fetched instead of searching
+    for `query`; the cache is still keyed by `query`, so a planned and a
+    direct download of the same song share one entry.
+    """
+    dest_dir = dest_dir or SONG_DIR
+    key = progress_key or download_progress.start(query, query)
+    cache_key = f"{query} [{section[0]}-{section[1]}s]" if section else query
+    if use_cache:
+        cached = download_cache.checkout(cache_key, dest_dir)
+        if cached:
+            song_library.sync(cached)
+            download_progress.finish(key, "cache", cached)
+            if not quiet:
+                print(f"\n[Cache] {query} -> {os.path.basename(cached)}")
+            return cached
+
+    if not downloader.available():
+        download_progress.finish(key, "failed")
+        return None
+
+    download_progress.begin(key)
+    if not quiet:
+        print("\n[Download] Searching + downloading:", query)
+        print(download_progress.line(key), end="", flush=True)
+
+    hooked: list[str] = []
+    on_progress, on_convert = download_progress.hooks(key, draw=not quiet)
+
+    def on_postprocess(d):
+        if d.get("status") == "finished":
+            hooked.append(d.get("info_dict", {}).get("filepath"))
+
+    try:
+        info = (session or downloader).fetch(target or query, job_outtmpl(dest_dir, job_id),
+                                             [on_progress], [on_postprocess, on_convert], section=section)
+    except Exception as e:
+        download_progress.finish(key, "failed")
+        print(f"\n[x] {downloader.name} error:", e)
+        return None
+
+    path = downloaded_path(info, hooked)
+    if path:
+        if use_cache:
+            download_cache.store(cache_key, path, first_entry(info))
+        song_library.sync(path)
+        download_progress.finish(key, "ok", path)
+        if not quiet:
+            print("\r" + "[##########] Download complete!".ljust(72))
+            print(f"[✓] Saved: {os.path.basename(path)}")
+        return path
+
+    download_progress.finish(key, "failed")
+    print("\n[x] Download finished but yt-dlp reported no audio file.")
+    return None
+
+
+# --- Pre-trimmed walk-up clips ---
+
+class ClipCache:
+    """
+    Rendered walk-up clips in songs/.clips/.
+
+    Each clip is the source song cut at the player's start offset, capped at
+    `seconds`, loudness-normalized and faded in (FFmpeg), so playback always
+    starts at 0 with no seek. The clip name hashes the source file's size and
+    mtime, the start offset and the settings: changing any of them simply
+    points at a new name, and prune() removes clips no player on any team
+    uses any more.
+    """
+
+    def __init__(self, clips_dir: str, seconds: int, fade: float):
+        self.clips_dir = clips_dir
+        self.seconds = seconds
+        self.fade = fade
+
+    def path_for(self, src: str, start: int) -> str | None:
+        try:
+            st = os.stat(src)
+        except OSError:
+            return None
+        key = f"{os.path.abspath(src)}|{st.st_size}|{st.st_mtime_ns}|{int(start)}|{self.seconds}|{self.fade}"
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+        base = os.path.splitext(os.path.basename(src))[0]
+        return os.path.join(self.clips_dir, f"{base}.{digest}.mp3")
+
+    def lookup(self, src: str, start: int) -> str | None:
+        """Rendered clip for (src, start), or None if it hasn't been made."""
+        clip = self.path_for(src, start)
+        return clip if clip and os.path.exists(clip) else None
+
+    def remaining(self, src: str, start: int) -> float:
+        """
+        How long the clip for (src, start) runs: `seconds`, or less when the
+        song ends sooner (duration from ffprobe; `seconds` if it can't tell).
+        """
+        try:
+            result = subprocess.run(
+                ["ffprobe", "-v", "error", "-show_entries", "format=duration",
+                 "-of", "default=noprint_wrappers=1:nokey=1", src],
+                capture_output=True, text=True, timeout=30)
+            left = float(result.stdout.strip()) - int(start)
+        except (OSError, subprocess.SubprocessError, ValueError):
+            return float(self.seconds)
+        return min(float(self.seconds), left) if left > 0 else float(self.seconds)
+
+    def render(self, src: str, start: int) -> str | None:
+        clip = self.path_for(src, start)
+        if clip is None:
+            return None
+        if os.path.exists(clip):
+            return clip
+        os.makedirs(self.clips_dir, exist_ok=True)
+        # near the end of a song the clip is shorter; the fade-out has to end with it
+        length = self.remaining(src, start)
+        fade_out = min(2.0, length / 4)
+        filters = ",".join([
+            "loudnorm=I=-14:TP=-1.5:LRA=11",
+            f"afade=t=in:st=0:d={self.fade}",
+            f"afade=t=out:st={length - fade_out:.2f}:d={fade_out:.2f}",
+        ])
+        tmp = clip + ".part.mp3"
+        cmd = [
+            "ffmpeg", "-hide_banner", "-loglevel", "error", "-y",
+            "-ss", str(int(start)), "-i", src, "-t", str(self.seconds),
+            "-af", filters, "-ar", "44100", "-c:a", "libmp3lame", "-q:a", "2",
+            tmp,
+        ]
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+        except (OSError, subprocess.SubprocessError) as e:
+            print(f"[x] Clip render failed for {os.path.basename(src)}: {e}")
+            return None
+        if result.returncode != 0 or not os.path.exists(tmp):
+            print(f"[x] Clip render failed for {os.path.basename(src)}: {result.stderr.strip()}")
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            return None
+        os.replace(tmp, clip)
+        return clip
+
+    def render_players(self, players: dict[int, dict], workers: int = DEFAULT_IMPORT_WORKERS) -> int:
+        """Render any missing clips for the roster and prune stale ones."""
+        # other teams' clips stay, so switching teams doesn't re-render them
+        self.prune(player_store.songs() +
+                   [(p.get("file", ""), int(p.get("start", 0))) for p in players.values()])
+        todo = []
+        for p in players.values():
+            src = os.path.join(SONG_DIR, p.get("file", ""))
+            start = int(p.get("start", 0))
+            if os.path.exists(src) and not self.lookup(src, start):
+                todo.append((src, start))
+        if not todo:
+            return 0
+        if shutil.which("ffmpeg") is None:
+            print("[!] FFmpeg not found; songs will seek to their start time instead.")
+            return 0
+        print(f"[Clips] Rendering {len(todo)} walk-up clip(s)...")
+        rendered = 0
+        with ThreadPoolExecutor(max_workers=max(1, int(workers))) as pool:
+            for clip in pool.map(lambda job: self.render(*job), todo):
+                if clip:
+                    rendered += 1
+        return rendered
+
+    def prune(self, songs: list[tuple[str, int]]):
+        """Delete clips that no longer match any of the (file, start) pairs in `songs`."""
+        if not os.path.isdir(self.clips_dir):
+            return
+        keep = set()
+        for file, start in set(songs):
+            clip = self.path_for(os.path.join(SONG_DIR, file), int(start))
+            if clip:
+                keep.add(os.path.basename(clip))
+        for name in os.listdir(self.clips_dir):
+            if name not in keep:
+                try:
+                    os.remove(os.path.join(self.clips_dir, name))
+                except OSError:
+                    pass
+
+
+clip_cache = ClipCache(CLIPS_DIR, DEFAULT_CLIP_SECONDS, DEFAULT_CLIP_FADE)
+
+
+def play_target(p: dict) -> tuple[str, int]:
+    """(path, start_sec) to hand to the player: the clip at 0 when rendered."""
+    src = os.path.join(SONG_DIR, p.get("file", ""))
+    start = int(p.get("start", 0))
+    clip = clip_cache.lookup(src, start)
+    if clip:
+        return clip, 0
+    return src, start
+
+
+# --- Console input / background tasks ---
+# The menu loop never blocks on a download, import or clip render: those run
+# as BackgroundTasks, stdin is read by ConsoleInput on its own thread, and
+# both post to one event queue the loop waits on. Events are (kind, payload):
+#   ("line", text)                  a line typed at the console
+#   ("eof", None)                   stdin closed
+#   ("done", (name, result, error)) a background task ended
+
+class ConsoleInput:
+    """
+    Reads stdin on a daemon thread and posts every line to `events`.
+    Submenus ask() for their answers through the same queue, so nothing
+    else ever calls input() while the loop is running.
+    """
+
+    def __init__(self, events: queue.Queue):
+        self.events = events
+        self.running = False
+
+    def start(self):
+        if not self.running:
+            self.running = True
+            threading.Thread(target=self._read_loop, daemon=True).start()
+
+    def _read_loop(self):
+        while True:
+            line = sys.stdin.readline()
+            if not line:
+                self.events.put(("eof", None))
+                return
+            self.events.put(("line", line.rstrip("\r\n")))
+
+    def ask(self, prompt: str = "") -> str:
+        """input() replacement: wait for the next line, holding other events back."""
+        print(prompt, end="", flush=True)
+        held = []
+        try:
+            while True:
+                kind, payload = self.events.get()
+                if kind == "line":
+                    return payload
+                if kind == "eof":
+                    held.append((kind, payload))
+                    raise EOFError
+                if kind == "activity":
+                    # only the newest background line is worth showing later
+                    held = [event for event in held if event[0] != "activity"]
+                held.append((kind, payload))
+        finally:
+            for event in held:
+                self.events.put(event)
+
+
+class BackgroundTasks:
+    """
+    Named long-running jobs (download, import, clips) on daemon threads.
+    start() refuses a name that is still running, unless coalesce=True, in
+    which case the job runs once more after the current one ends (used for
+    clip renders, where only the latest roster matters). Each finished run
+    posts ("done", (name, result, error)) to the event queue.
+    """
+
+    def __init__(self, events: queue.Queue):
+        self.events = events
+        self._running: dict[str, threading.Thread] = {}
+        self._again: dict[str, tuple] = {}
+        self._lock = threading.Lock()
+
+    def start(self, name: str, fn, *args, coalesce: bool = False) -> bool:
+        with self._lock:
+            if name in self._running:
+                if coalesce:
+                    self._again[name] = (fn, args)
+                    return True
+                return False
+            t = threading.Thread(target=self._run, args=(name, fn, args), daemon=True)
+            self._running[name] = t
+        t.start()
+        return True
+
+    def _run(self, name: str, fn, args: tuple):
+        while True:
+            result = error = None
+            try:
+                result = fn(*args)
+            except Exception as e:
+                error = e
+            with self._lock:
+                again = self._again.pop(name, None)
+                if again is None:
+                    del self._running[name]
+            self.events.put(("done", (name, result, error)))
+            if again is None:
+                return
+            fn, args = again
+
+    def running(self) -> list[str]:
+        with self._lock:
+            return sorted(self._running)
+
+    def wait(self, *names: str, timeout: float | None = None):
+        """Wait for the named tasks (default: all of them) to end."""
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        while True:
+            with self._lock:
+                threads = [t for n, t in self._running.items() if not names or n in names]
+            if not threads:
+                return
+            left = None if deadline is None else deadline - time.perf_counter()
+            if left is not None and left <= 0:
+                return
+            threads[0].join(left)
+
+
+ui_events: queue.Queue = queue.Queue()
+console = ConsoleInput(ui_events)
+
+
+def ask(prompt: str = "") -> str:
+    """Read a line: through the console thread once the menu loop runs, else input()."""
+    if console.running:
+        return console.ask(prompt)
+    return input(prompt)
+
+
+# --- Player registry helpers ---
+
+def prompt_int(prompt: str, allow_blank: bool = False) -> int | None:
+    while True:
+        text = ask(prompt).strip()
+        if allow_blank and text == "":
+            return None
+        if text.isdigit():
+            return int(text)
+        print("Please enter a whole number.")
+
+
+def pick_player(query: str, players: dict[int, dict], elsewhere: list | None = None) -> int | None:
+    """
+    Jersey for a jersey/name query via player_index; asks if several match.
+    Pass a snapshot of the roster: player_store.lock is only held for the
+    index lookup, never while the question waits for an answer.
+    With no match, players of other teams that match are appended to
+    `elsewhere` (if given, e.g. for the menu's notice) instead of printed.
+    """
+    with player_store.lock:
+        hits = [j for j in player_index.search(query) if j in players]
+    if not hits:
+        found = [f"#{jersey} {name} is on team {team}"
+                 for team, jersey, name in player_store.find_elsewhere(query)]
+        if elsewhere is not None:
+            elsewhere.extend(found)
+            return None
+        print(f"No player matches '{query}'.")
+        for text in found:
+            print(f"    {text} ('t' to switch teams)")
+        return None
+    if len(hits) == 1:
+        return hits[0]
+    print("Several players match:")
+    for i, jersey in enumerate(hits, 1):
+        print(f"  {i}) #{jersey} {players[jersey].get('name', '?')}")
+    idx = prompt_int("Pick one (Enter to cancel): ", allow_blank=True)
+    if idx and 1 <= idx <= len(hits):
+        return hits[idx - 1]
+    return None
+
+
+def no_pick_notice(query: str, elsewhere: list[str]) -> str:
+    """Menu notice for a name that picked nobody, with pick_player's other-team matches."""
+    if elsewhere:
+        return f"No player picked for '{query}': {'; '.join(elsewhere)} ('t' to switch teams)."
+    return f"No player picked for '{query}'."
+
+
+def add_player_from_file(path: str, players: dict[int, dict], start: int | None = None) -> str:
+    """
+    Interactive version: ask for jersey, name, start time, and rename file to
+    first_last.<ext> (the download's own extension).
+    A known start (e.g. 0 for a segment download) skips the start time question.
+    The questions run without player_store.lock; it is taken only to add
+    the player, so a background import isn't held up by the prompts.
+    Returns a one-line result for the menu's notice.
+    """
+    if not path or not os.path.exists(path):
+        return "[x] File not found for player setup."
+
+    print("\nSet up player for this song.")
+    name = ask("Player name (First Last): ").strip()
+    if not name:
+        return "[!] Skipped player setup."
+
+    jersey = prompt_int("Jersey number: ")
+    if start is None:
+        start = prompt_int("Start time in seconds (0 for start of song): ")
+    if start is None:
+        start = 0
+
+    target = song_library.claim(player_file_name(name, path))
+
+    renamed = ""
+    try:
+        os.replace(path, target)
+        filename = os.path.basename(target)
+    except Exception as e:
+        song_library.release(target)
+        filename = os.path.basename(path)
+        renamed = f" (rename failed, kept {filename}: {e})"
+    song_library.sync(path, target)
+
+    with player_store.lock:
+        players[jersey] = {
+            "jersey": jersey,
+            "name": name,
+            "file": filename,
+            "start": int(start),
+        }
+        save_players(players)
+    return f"[✓] Player {name} (# {jersey}) saved as {filename}{renamed}."
 
 
 def add_player_auto_from_file(
@@ -312,64 +2596,260 @@ def add_player_auto_from_file(
 ) -> dict[int, dict]:
     """
     Non-interactive version used by CSV importer.
-    Uses given name/jersey/start and renames file to first_last.mp3.
+    Uses given name/jersey/start and renames file to first_last.<ext>.
     """
     if not path or not os.path.exists(path):
         print("[x] File not found for player setup.")
         return players
 
-    safe = sanitize_player_name(name)
-    target = os.path.join(SONG_DIR, safe + ".mp3")
-    target = unique_path(target)
+    target = song_library.claim(player_file_name(name, path))
 
     try:
-        os.rename(path, target)
+        os.replace(path, target)
         filename = os.path.basename(target)
         print(f"[✓] Renamed to {filename}")
     except Exception as e:
+        song_library.release(target)
         print("[x] Rename failed, keeping original filename:", e)
         filename = os.path.basename(path)
+    song_library.sync(path, target)
+
+    players[jersey] = {
+        "jersey": jersey,
+        "name": name,
+        "file": filename,
+        "start": int(start) if start is not None else 0,
+    }
+    save_players(players)
+    print(f"[✓] Player {name} (# {jersey}) saved.")
+    return players
+
+
+def player_lines(players: dict[int, dict]) -> list[str]:
+    if not players:
+        return ["(No players configured yet. Use 'd' or 'c' to add players.)"]
+    lines = [
+        "Jersey | Player Name           | File                     | Start",
+        "-------+------------------------+--------------------------+------",
+    ]
+    for jersey in sorted(players.keys()):
+        p = players[jersey]
+        name = p.get("name", "?")
+        fname = p.get("file", "?")
+        start = p.get("start", 0)
+        lines.append(f"{jersey:>6} | {name:<22} | {fname:<24} | {start:>4}s")
+    return lines
+
+
+def print_players(players: dict[int, dict]):
+    print("\n".join(player_lines(players)))
+
+
+class PlayerTable:
+    """
+    The roster table lines for the menu, rebuilt only after player_store
+    commits a change (it subscribes like PlayerIndex) instead of on every
+    redraw.
+    """
+
+    def __init__(self):
+        self._lines: list[str] | None = None
+
+    def rebuild(self, players: dict[int, dict]):
+        self._lines = None
+
+    def apply(self, ops: list[dict]):
+        self._lines = None
+
+    def lines(self, players: dict[int, dict]) -> list[str]:
+        if self._lines is None:
+            self._lines = player_lines(players)
+        return self._lines
+
+
+player_table = PlayerTable()
+player_store.subscribe(player_table)
+
+
+def upcoming_players(
+    players: dict[int, dict],
+    after: int | None,
+    count: int,
+) -> list[tuple[str, int]]:
+    """
+    (path, start) for the next `count` players after jersey `after` in
+    roster (jersey) order, wrapping around. Used to pick what to preload.
+    """
+    order = sorted(players.keys())
+    if not order or count <= 0:
+        return []
+    i = order.index(after) + 1 if after in players else 0
+    return [play_target(players[j]) for j in (order[i:] + order[:i])[:count]]
+
+
+class Lineup:
+    """
+    Batting order for lineup mode: jerseys in order plus the spot that is
+    due up. next() hands out that batter and moves on, wrapping back to the
+    leadoff hitter after the last one, so one key walks through every
+    inning. Jerseys no longer on the roster are skipped.
+    """
+
+    def __init__(self, order: list[int] | None = None, pos: int = 0):
+        self.order: list[int] = []
+        for jersey in order or []:
+            if int(jersey) not in self.order:
+                self.order.append(int(jersey))
+        self.pos = int(pos) % len(self.order) if self.order else 0
+
+    @property
+    def active(self) -> bool:
+        return bool(self.order)
+
+    def _rotation(self, players: dict[int, dict]) -> list[int]:
+        rot = self.order[self.pos:] + self.order[:self.pos]
+        return [j for j in rot if j in players]
+
+    def next(self, players: dict[int, dict]) -> int | None:
+        """Batter due up (then advance), or None if nobody in the order is left."""
+        for _ in range(len(self.order)):
+            jersey = self.order[self.pos]
+            self.pos = (self.pos + 1) % len(self.order)
+            if jersey in players:
+                return jersey
+        return None
+
+    def upcoming(self, players: dict[int, dict], count: int) -> list[int]:
+        """The next `count` batters due up, without advancing."""
+        return self._rotation(players)[:max(0, count)]
+
+    def jump_past(self, jersey: int):
+        """A batter was played by hand: the order continues after them."""
+        if jersey in self.order:
+            self.pos = (self.order.index(jersey) + 1) % len(self.order)
+
+
+def resolve_lineup(entries: list[str], players: dict[int, dict], interactive: bool = True,
+                   skipped: list | None = None) -> list[int]:
+    """
+    Turn jerseys/names into a batting order. Interactive mode asks when a
+    name is ambiguous; otherwise ambiguous or unknown entries are skipped.
+    Skipped entries are appended to `skipped` (if given) instead of printed.
+    """
+    order = []
+    for entry in entries:
+        entry = entry.strip()
+        if not entry:
+            continue
+        if interactive:
+            found: list[str] = []
+            jersey = pick_player(entry, players, found)
+            why = "; ".join(found) or "no match"
+        else:
+            with player_store.lock:
+                hits = [j for j in player_index.search(entry) if j in players]
+            jersey = hits[0] if len(hits) == 1 else None
+            why = "no match" if not hits else "matches several players"
+        if jersey is None:
+            if skipped is not None:
+                skipped.append(f"'{entry}' ({why})")
+            elif not interactive:
+                print(f"[!] Lineup: '{entry}' {why}, skipped.")
+        if jersey is not None and jersey not in order:
+            order.append(jersey)
+    return order
+
+
+def load_lineup_csv(path: str, players: dict[int, dict], skipped: list | None = None) -> list[int]:
+    """Batting order from the first column of a CSV (jersey or name per row)."""
+    entries = []
+    try:
+        with open(path, newline="", encoding="utf-8-sig") as f:
+            for row in csv.reader(f):
+                if row and row[0].strip():
+                    entries.append(row[0].strip())
+    except OSError as e:
+        print("[x] Could not read lineup CSV:", e)
+        return []
+    if entries and entries[0].lower() in ("jersey", "name", "player", "batter"):
+        entries = entries[1:]  # header row
+    return resolve_lineup(entries, players, interactive=False, skipped=skipped)
 
-    players[jersey] = {
-        "jersey": jersey,
-        "name": name,
-        "file": filename,
-        "start": int(start) if start is not None else 0,
-    }
-    save_players(players)
-    print(f"[✓] Player {name} (# {jersey}) saved.")
-    return players
 
+def setup_lineup(lineup: Lineup, players: dict[int, dict]) -> tuple[Lineup, str]:
+    """
+    Lineup submenu: type the order once, load it from CSV, or turn it off.
+    Returns the lineup and a one-line result for the menu's notice.
+    """
+    if lineup.active:
+        names = [f"#{j} {players[j].get('name', '?')}" for j in lineup.order if j in players]
+        print("\nCurrent batting order:")
+        for i, text in enumerate(names, 1):
+            print(f"  {i}. {text}")
+    print("\nEnter the batting order as jerseys/names separated by commas,")
+    print(f"'f' to load {os.path.relpath(LINEUP_CSV, BASE)}, 'x' to leave lineup mode,")
+    text = ask("or Enter to keep the current order: ").strip()
+    if not text:
+        return lineup, ""
+    if text.lower() == "x":
+        return Lineup(), "[✓] Lineup mode off."
+    skipped: list[str] = []
+    if text.lower() == "f":
+        order = load_lineup_csv(LINEUP_CSV, players, skipped)
+    else:
+        order = resolve_lineup(text.split(","), players, skipped=skipped)
+    left_out = f" Skipped: {', '.join(skipped)}." if skipped else ""
+    if not order:
+        return lineup, f"[x] No batters in that order; lineup unchanged.{left_out}"
+    return Lineup(order), f"[✓] Lineup set: {len(order)} batters. Press Enter (or 'n') to play each one.{left_out}"
 
-def print_players(players: dict[int, dict]):
-    if not players:
-        print("(No players configured yet. Use 'd' or 'c' to add players.)")
-        return
-    print("Jersey | Player Name           | File                     | Start")
-    print("-------+------------------------+--------------------------+------")
-    for jersey in sorted(players.keys()):
-        p = players[jersey]
-        name = p.get("name", "?")
-        fname = p.get("file", "?")
-        start = p.get("start", 0)
-        print(f"{jersey:>6} | {name:<22} | {fname:<24} | {start:>4}s")
 
+def pick_team() -> str | None:
+    """Team submenu: pick an existing team by number or type a new name."""
+    teams = player_store.teams()
+    print("\nTeams:")
+    for i, (name, count) in enumerate(teams, 1):
+        mark = "*" if name.lower() == player_store.team.lower() else " "
+        print(f" {mark}{i}) {name} ({count} players)")
+    text = ask("Team number, or a new team name (Enter to cancel): ").strip()
+    if not text:
+        return None
+    if text.isdigit():
+        idx = int(text)
+        if 1 <= idx <= len(teams):
+            return teams[idx - 1][0]
+        print("No team with that number.")
+        return None
+    return text
 
-def edit_player(players: dict[int, dict]) -> dict[int, dict]:
-    """Edit an existing player via submenu: name, jersey, start time, file, delete."""
-    if not players:
-        print("No players to edit.")
-        return players
 
-    print_players(players)
-    jersey = prompt_int("\nEnter jersey number to edit (or 0 to cancel): ")
-    if jersey in (None, 0):
-        return players
-    if jersey not in players:
-        print("No player with that jersey.")
-        return players
+def edit_player(players: dict[int, dict]) -> str:
+    """
+    Edit an existing player via submenu: name, jersey, start time, file, delete.
+    The submenu works on a copy of the player; player_store.lock is only
+    taken at the end to write the result back, so a background import
+    keeps registering rows while the questions wait.
+    Returns a one-line result for the menu's notice.
+    """
+    with player_store.lock:
+        roster = dict(players)
+    if not roster:
+        return "No players to edit."
 
-    p = players[jersey]
+    query = ask("\nJersey or name to edit (Enter to list all, 0 to cancel): ").strip()
+    if not query:
+        print_players(roster)
+        query = ask("\nJersey or name to edit (or 0 to cancel): ").strip()
+    if query in ("", "0"):
+        return ""
+    elsewhere: list[str] = []
+    jersey = pick_player(query, roster, elsewhere)
+    if jersey is None:
+        return no_pick_notice(query, elsewhere)
+
+    original = jersey
+    p = dict(roster[jersey])
+    deleted = False
     while True:
         print(f"\nEditing #{jersey} - {p.get('name','?')}")
         print("1) Change player name")
@@ -378,22 +2858,20 @@ def edit_player(players: dict[int, dict]) -> dict[int, dict]:
         print("4) Change audio file")
         print("5) Delete player")
         print("0) Back")
-        choice = input("Choice: ").strip()
+        choice = ask("Choice: ").strip()
         if choice == "1":
-            new_name = input("New name: ").strip()
+            new_name = ask("New name: ").strip()
             if new_name:
                 p["name"] = new_name
                 print("[✓] Name updated.")
         elif choice == "2":
             new_j = prompt_int("New jersey number: ")
             if new_j is not None:
-                if new_j in players and new_j != jersey:
+                if new_j in roster and new_j != original:
                     print("Another player already has that jersey.")
                 else:
-                    players.pop(jersey)
                     jersey = new_j
                     p["jersey"] = new_j
-                    players[jersey] = p
                     print("[✓] Jersey updated.")
         elif choice == "3":
             new_s = prompt_int("New start time (seconds): ")
@@ -413,9 +2891,9 @@ def edit_player(players: dict[int, dict]) -> dict[int, dict]:
                     p["file"] = files[idx - 1]
                     print("[✓] File updated.")
         elif choice == "5":
-            confirm = input("Delete this player? (y/n): ").strip().lower()
+            confirm = ask("Delete this player? (y/n): ").strip().lower()
             if confirm == "y":
-                players.pop(jersey, None)
+                deleted = True
                 print("[✓] Player deleted.")
                 break
         elif choice == "0":
@@ -423,114 +2901,717 @@ def edit_player(players: dict[int, dict]) -> dict[int, dict]:
         else:
             print("Unknown option.")
 
-    save_players(players)
-    return players
+    if not deleted and jersey == original and p == roster[original]:
+        return ""
+    result = (f"[✓] Player #{original} {p.get('name', '?')} deleted." if deleted
+              else f"[✓] Player #{jersey} {p.get('name', '?')} updated.")
+    with player_store.lock:
+        if jersey != original and jersey in players:
+            # an import registered that jersey while the submenu was open
+            result = f"[!] Jersey {jersey} was taken in the meantime; #{original} kept its number."
+            jersey = original
+            p["jersey"] = original
+        players.pop(original, None)
+        if not deleted:
+            players[jersey] = p
+        save_players(players)
+    return result
+
+
+def _download_job(job: dict, checkpoint: "ImportCheckpoint",
+                  session: DownloadSession | None = None) -> str | None:
+    """Worker for the batch importer: download one row quietly (its planned match, if any)."""
+    with _print_lock:
+        print(f"[Batch] Downloading for {job['label']}")
+    checkpoint.mark(job["row"], "downloading")
+    path = download_song(job["query"], quiet=True, job_id=checkpoint.job_id(job["row"]),
+                         progress_key=job["progress"], section=job.get("section"), session=session,
+                         target=job.get("url"))
+    if path:
+        checkpoint.mark(job["row"], "converted", file=path, section=job.get("section"))
+    else:
+        checkpoint.mark(job["row"], "failed", reason="download failed")
+    return path
+
+
+# --- CSV import pipeline ---
+# parse -> validate -> dedupe -> download -> register, each stage a generator
+# pulling one row at a time from the one before, so memory stays flat no
+# matter how long the CSV is.
+#
+# import_mode "review"/"auto" splits it in two: plan_import runs parse ->
+# validate -> dedupe -> resolve (a metadata-only search per row) and keeps
+# the rows in an ImportPlan; only the matches that are accepted then go on
+# to download -> register. A wrong song is caught before any audio moves.
+
+# config.json "import_mode": "review" (show the plan, 'c' again downloads
+# it), "auto" (plan, then download straight away) or "direct" (search and
+# download in one step, the old way)
+IMPORT_MODES = ("review", "auto", "direct")
+import_mode = "review"
+
+# search results ranked per row (config.json "search_results")
+search_results = DEFAULT_SEARCH_RESULTS
+
+
+def csv_signature(csv_path: str) -> str:
+    """Size + mtime of the CSV; resume info is only trusted for the same file."""
+    st = os.stat(csv_path)
+    return f"{st.st_size}:{st.st_mtime_ns}"
 
 
-def import_players_from_csv(players: dict[int, dict]) -> dict[int, dict]:
+class ImportCheckpoint:
     """
-    Batch import from data/batters.csv.
+    Per-row state of a batch import in data/.import_checkpoint.jsonl.
 
-    Expected CSV columns (in order):
-      First, Last, Song, Artist, StartSeconds, Jersey(optional)
+    Every state change (resolved + match, queued, downloading, converted,
+    registered, failed/rejected + reason) is appended as one JSON line, so
+    a run killed at any point (Ctrl-C, network drop, laptop sleep) leaves
+    an exact record. The next run replays it: registered rows are skipped,
+    converted rows go straight to register, and the rest download again
+    under the same output name so yt-dlp continues their .part files (a
+    planned row keeps its match, so it isn't searched again). The
+    checkpoint only applies to the same CSV (size + mtime); it is deleted
+    once every row is registered or rejected. "rejected" is for rows the
+    CSV itself gets wrong (missing name/song/jersey): running the same file
+    again can't fix them, so they are reported but never retried.
+    """
 
-    - First/Last/Song/Artist are required.
-    - StartSeconds defaults to 0 if blank/invalid.
-    - Jersey read from column 6 if present; otherwise you’ll be prompted.
+    def __init__(self, path: str, csv_path: str):
+        self.path = path
+        self.csv_path = os.path.abspath(csv_path)
+        self.signature = csv_signature(csv_path)
+        self.rows: dict[int, dict] = {}
+        self._lock = threading.Lock()
+        self.resumed = self._replay()
+        if not self.resumed:
+            with open(self.path, "w", encoding="utf-8") as f:
+                f.write(json.dumps({"csv": self.csv_path, "signature": self.signature}) + "\n")
+
+    def _replay(self) -> bool:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                header = json.loads(f.readline() or "{}")
+                if header.get("csv") != self.csv_path or header.get("signature") != self.signature:
+                    return False
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        break  # torn last line
+                    row = int(entry.pop("row"))
+                    self.rows.setdefault(row, {}).update(entry)
+        except (OSError, ValueError):
+            return False
+        return True
+
+    def mark(self, row: int, state: str, **extra):
+        entry = {"row": row, "state": state, **extra}
+        with self._lock:
+            self.rows.setdefault(row, {}).update(entry)
+            self.rows[row].pop("row", None)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry) + "\n")
+
+    def state(self, row: int) -> str | None:
+        return self.rows.get(row, {}).get("state")
+
+    def converted_file(self, row: int) -> str | None:
+        """The finished download of a row that was converted but not registered."""
+        rec = self.rows.get(row, {})
+        path = rec.get("file")
+        if rec.get("state") == "converted" and path and os.path.exists(path):
+            return path
+        return None
+
+    def job_id(self, row: int) -> str:
+        """Stable per-row id, so a retried download reuses its .part file."""
+        return hashlib.sha1(f"{self.csv_path}|{row}".encode("utf-8")).hexdigest()[:8]
+
+    def failures(self) -> list[tuple[int, str]]:
+        return [(row, rec.get("reason", "?")) for row, rec in sorted(self.rows.items())
+                if rec.get("state") == "failed"]
+
+    def rejects(self) -> list[tuple[int, str]]:
+        return [(row, rec.get("reason", "?")) for row, rec in sorted(self.rows.items())
+                if rec.get("state") == "rejected"]
+
+    def finish(self):
+        """Remove the checkpoint when nothing is left to retry (rejects don't count)."""
+        if not self.failures():
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+
+
+def iter_csv_rows(csv_path: str, checkpoint: ImportCheckpoint | None = None):
+    """Parse stage: yield (row_number, cells), skipping rows already registered."""
+    with open(csv_path, newline="", encoding="utf-8-sig") as f:
+        for row_num, row in enumerate(csv.reader(f), start=1):
+            if checkpoint and checkpoint.state(row_num) == "registered":
+                continue
+            yield row_num, row
+
+
+def validate_rows(rows, checkpoint: ImportCheckpoint | None = None, interactive: bool = True):
+    """
+    Validate stage: turn CSV rows into import jobs, prompting for missing
+    jerseys (interactive=False skips those rows instead, for background runs).
+    """
+    for row_num, row in rows:
+        if not row or all(not cell.strip() for cell in row):
+            continue
+
+        # optional header skip
+        first_cell = row[0].strip().lower()
+        if first_cell in ("first", "first name", "firstname"):
+            continue
+
+        first = row[0].strip() if len(row) > 0 else ""
+        last = row[1].strip() if len(row) > 1 else ""
+        song = row[2].strip() if len(row) > 2 else ""
+        artist = row[3].strip() if len(row) > 3 else ""
+        start_raw = row[4].strip() if len(row) > 4 else ""
+        jersey_raw = row[5].strip() if len(row) > 5 else ""
+
+        if not first or not last or not song or not artist:
+            print("[!] Skipping row (missing name or song):", row)
+            if checkpoint:
+                checkpoint.mark(row_num, "rejected", reason="missing name or song")
+            continue
+
+        name = f"{first} {last}"
+
+        try:
+            start_sec = int(start_raw) if start_raw else 0
+        except ValueError:
+            start_sec = 0
+
+        jersey: int | None = None
+        if jersey_raw:
+            try:
+                jersey = int(jersey_raw)
+            except ValueError:
+                jersey = None
+
+        if jersey is None and not interactive:
+            print(f"[!] Skipping {name}: no jersey in the CSV.")
+            if checkpoint:
+                checkpoint.mark(row_num, "rejected", reason="no jersey in CSV")
+            continue
+
+        if jersey is None:
+            print(f"\nRow for {name} — {song} ({artist})")
+            jersey = prompt_int(" Jersey number: ")
+            if jersey is None:
+                print("[!] Skipping row (no jersey).")
+                if checkpoint:
+                    checkpoint.mark(row_num, "failed", reason="no jersey")
+                continue
+
+        yield {
+            "row": row_num,
+            "name": name,
+            "song": song,
+            "artist": artist,
+            "query": f"{song} {artist}",
+            "label": f"{name} — {song} ({artist})",
+            "start": start_sec,
+            "jersey": jersey,
+        }
+
+
+def dedupe_jobs(jobs, players: dict[int, dict], checkpoint: ImportCheckpoint | None = None):
+    """Dedupe stage: drop rows whose jersey is already on the roster."""
+    for job in jobs:
+        if job["jersey"] in players:
+            with _print_lock:
+                print(f"[!] Jersey {job['jersey']} already exists, skipping {job['name']}.")
+            if checkpoint:
+                checkpoint.mark(job["row"], "failed", reason=f"jersey {job['jersey']} already exists")
+            continue
+        yield job
+
+
+def _resolve_job(job: dict, session: DownloadSession) -> dict | None:
+    """
+    Worker for the planning phase: the best-ranked of the top
+    `search_results` hits for a row. Search results come from the search
+    cache when it has them, so only new queries touch the network.
+    """
+    results = search_cache.get(job["query"], search_results)
+    if results is None:
+        results = session.search(job["query"], search_results)
+        if results:
+            search_cache.put(job["query"], search_results, results)
+    ranked = rank_candidates(job["song"], job["artist"], results)
+    return ranked[0] if ranked else None
+
+
+def resolve_jobs(jobs, workers: int, checkpoint: ImportCheckpoint, session: DownloadSession):
+    """
+    Resolve stage (planning phase): look every row's song up with up to
+    `workers` metadata-only searches at once, rank the results, and yield
+    the jobs in CSV order with job["match"] set to the best one (None when
+    nothing was found). Rows the checkpoint already resolved or downloaded
+    are not searched again.
+    """
+    pending = deque()
+    pool = ThreadPoolExecutor(max_workers=workers)
+    try:
+        for job in jobs:
+            rec = checkpoint.rows.get(job["row"], {})
+            done = checkpoint.converted_file(job["row"])
+            if done or (rec.get("match") and rec.get("state") != "failed"):
+                job["match"] = rec.get("match") or {"id": "", "title": os.path.basename(done),
+                                                    "duration": None, "channel": "", "url": ""}
+                fut = None
+            else:
+                fut = pool.submit(_resolve_job, job, session)
+            pending.append((job, fut))
+            if len(pending) >= workers:
+                yield _resolved(*pending.popleft(), checkpoint)
+        while pending:
+            yield _resolved(*pending.popleft(), checkpoint)
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _resolved(job: dict, fut, checkpoint: ImportCheckpoint) -> dict:
+    if fut is None:
+        match = job["match"]
+    else:
+        try:
+            match = fut.result()
+        except Exception as e:
+            with _print_lock:
+                print(f"[x] Search error for {job['name']}: {e}")
+            match = None
+        if match:
+            checkpoint.mark(job["row"], "resolved", match=match)
+        else:
+            checkpoint.mark(job["row"], "failed", reason="no search result")
+    job["match"] = match
+    if match and match.get("url"):
+        job["url"] = match["url"]
+    return job
+
+
+class ImportPlan:
+    """
+    First phase of a two-phase import: the CSV rows (validated, deduped)
+    with the video each one will download, before anything is fetched.
+    lines() shows it, skip() drops rows, and import_players_from_csv(...,
+    plan=plan) downloads what is left.
     """
+
+    def __init__(self, checkpoint: ImportCheckpoint):
+        self.checkpoint = checkpoint
+        self.jobs: list[dict] = []        # rows with a match, CSV order
+        self.unmatched: list[dict] = []
+
+    def lines(self) -> list[str]:
+        out = [f"Import plan: {len(self.jobs)} song(s) to download"
+               + (f", {len(self.unmatched)} row(s) without a match" if self.unmatched else "")]
+        for job in self.jobs:
+            m = job["match"]
+            # "?" = weak match (see rank_candidates), worth a look before downloading
+            flag = "?" if m.get("score", LOW_MATCH_SCORE) < LOW_MATCH_SCORE else " "
+            line = (f" {flag}row {job['row']:>3}  #{job['jersey']:<3} {job['name'][:20]:<20} "
+                    f"{m['title'][:40]:<40} {fmt_eta(m.get('duration')):>6}  {m.get('channel', '')[:20]}")
+            if m.get("why"):
+                line += f"  ({'; '.join(m['why'])})"
+            out.append(line)
+        for job in self.unmatched:
+            out.append(f"  row {job['row']:>3}  #{job['jersey']:<3} {job['name'][:20]:<20} "
+                       f"(nothing found for \"{job['query']}\")")
+        return out
+
+    def skip(self, rows) -> int:
+        """Leave these CSV rows out (failed in the checkpoint, so a rerun retries them)."""
+        keep = []
+        for job in self.jobs:
+            if job["row"] in rows:
+                self.checkpoint.mark(job["row"], "failed", reason="skipped at review")
+            else:
+                keep.append(job)
+        skipped = len(self.jobs) - len(keep)
+        self.jobs = keep
+        return skipped
+
+
+def open_import_checkpoint() -> ImportCheckpoint | None:
+    """The checkpoint for data/batters.csv, or None (message printed) if there is no CSV."""
     if not os.path.exists(BATTERS_CSV):
         print(f"[x] CSV not found at: {BATTERS_CSV}")
         print("    Make sure data/batters.csv exists.")
-        return players
+        return None
+    try:
+        checkpoint = ImportCheckpoint(IMPORT_CHECKPOINT_FILE, BATTERS_CSV)
+    except OSError as e:
+        print("[x] Could not open import checkpoint:", e)
+        return None
+    if checkpoint.resumed:
+        done = sum(1 for rec in checkpoint.rows.values() if rec.get("state") == "registered")
+        print(f"[Batch] Resuming interrupted import ({done} row(s) already registered).")
+    return checkpoint
 
-    imported = 0
+
+def plan_import(
+    players: dict[int, dict],
+    workers: int = DEFAULT_IMPORT_WORKERS,
+    interactive: bool = True,
+    cancel: threading.Event | None = None,
+) -> ImportPlan | None:
+    """
+    Resolve every row of data/batters.csv to the video it would download
+    (ID, title, duration, channel), up to `workers` searches at once and
+    without downloading any audio. Returns the ImportPlan, or None if
+    there is no CSV, no downloader, or `cancel` was set.
+
+    The plan holds every row in memory (it has to be shown whole), but
+    only a small dict per row.
+    """
+    if not downloader.available():
+        return None
+    checkpoint = open_import_checkpoint()
+    if checkpoint is None:
+        return None
+    plan = ImportPlan(checkpoint)
+    with downloader.session() as session:
+        rows = iter_csv_rows(BATTERS_CSV, checkpoint)
+        jobs = dedupe_jobs(validate_rows(rows, checkpoint, interactive), players, checkpoint)
+        resolved = resolve_jobs(jobs, max(1, int(workers)), checkpoint, session)
+        try:
+            for job in resolved:
+                (plan.jobs if job["match"] else plan.unmatched).append(job)
+                if cancel is not None and cancel.is_set():
+                    print("\n[!] Import planning stopped. Run 'c' again to resume.")
+                    return None
+        finally:
+            resolved.close()
+    return plan
+
+
+def download_jobs(jobs, workers: int, checkpoint: ImportCheckpoint,
+                  session: DownloadSession | None = None):
+    """
+    Download stage: keep at most `workers` downloads in flight and yield
+    (job, path) in CSV order. A new row is only pulled once the oldest
+    result has been taken, so a slow register stage holds back parsing.
+    Rows the checkpoint already has converted skip the download. In
+    segment mode each job fetches only its walk-up window. All jobs go
+    through `session` when one is given.
+    """
+    pending = deque()
+    pool = ThreadPoolExecutor(max_workers=workers)
     try:
-        with open(BATTERS_CSV, newline="", encoding="utf-8-sig") as f:
-            reader = csv.reader(f)
-            for row in reader:
-                if not row or all(not cell.strip() for cell in row):
-                    continue
+        for job in jobs:
+            done = checkpoint.converted_file(job["row"])
+            if done:
+                # register it the way it was downloaded (whole song or cut)
+                job["section"] = checkpoint.rows[job["row"]].get("section")
+                fut = Future()
+                fut.set_result(done)
+            else:
+                job["section"] = download_section(job["start"])
+                checkpoint.mark(job["row"], "queued")
+                job["progress"] = download_progress.start(job["label"], job["query"], queued=True)
+                fut = pool.submit(_download_job, job, checkpoint, session)
+            pending.append((job, fut))
+            if len(pending) >= workers:
+                yield _job_result(*pending.popleft())
+        while pending:
+            yield _job_result(*pending.popleft())
+    finally:
+        # Stopped early: in-flight downloads finish and stay "converted" in
+        # the checkpoint for the next run; queued ones are dropped.
+        pool.shutdown(wait=True, cancel_futures=True)
+        for job, fut in pending:
+            if fut.cancelled():
+                download_progress.finish(job["progress"], "cancelled")
 
-                # optional header skip
-                first_cell = row[0].strip().lower()
-                if first_cell in ("first", "first name", "firstname"):
-                    continue
 
-                first = row[0].strip() if len(row) > 0 else ""
-                last = row[1].strip() if len(row) > 1 else ""
-                song = row[2].strip() if len(row) > 2 else ""
-                artist = row[3].strip() if len(row) > 3 else ""
-                start_raw = row[4].strip() if len(row) > 4 else ""
-                jersey_raw = row[5].strip() if len(row) > 5 else ""
+def _job_result(job: dict, fut) -> tuple[dict, str | None]:
+    try:
+        return job, fut.result()
+    except Exception as e:
+        if "progress" in job:
+            download_progress.finish(job["progress"], "failed")
+        with _print_lock:
+            print(f"[x] Download error for {job['name']}: {e}")
+        return job, None
 
-                if not first or not last or not song or not artist:
-                    print("[!] Skipping row (missing name or song):", row)
-                    continue
 
-                name = f"{first} {last}"
-                query = f"{song} {artist}"
+def register_job(
+    job: dict,
+    path: str | None,
+    players: dict[int, dict],
+    checkpoint: ImportCheckpoint,
+) -> bool:
+    """
+    Register stage: rename + add one downloaded row. True if it was added
+    (the caller marks it registered once the registry is committed).
+    """
+    with player_store.lock:
+        if not path:
+            print(f"[x] Download failed, skipping {job['name']}.")
+            return False
+        if job["jersey"] in players:
+            # an earlier row in this CSV already took the jersey
+            print(f"[!] Jersey {job['jersey']} already exists, skipping {job['name']}.")
+            checkpoint.mark(job["row"], "failed", reason=f"jersey {job['jersey']} already exists")
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            song_library.sync(path)
+            return False
+        add_player_auto_from_file(
+            path=path,
+            name=job["name"],
+            jersey=job["jersey"],
+            # a segment download already begins at the walk-up start
+            start=0 if job.get("section") else job["start"],
+            players=players,
+        )
+        if job["jersey"] not in players:
+            checkpoint.mark(job["row"], "failed", reason="file missing after download")
+            return False
+        return True
 
-                try:
-                    start_sec = int(start_raw) if start_raw else 0
-                except ValueError:
-                    start_sec = 0
 
-                jersey: int | None = None
-                if jersey_raw:
-                    try:
-                        jersey = int(jersey_raw)
-                    except ValueError:
-                        jersey = None
+def import_players_from_csv(
+    players: dict[int, dict],
+    workers: int = DEFAULT_IMPORT_WORKERS,
+    interactive: bool = True,
+    cancel: threading.Event | None = None,
+    plan: ImportPlan | None = None,
+) -> dict[int, dict]:
+    """
+    Batch import from data/batters.csv.
 
-                if jersey is None:
-                    print(f"\nRow for {name} — {song} ({artist})")
-                    jersey = prompt_int(" Jersey number: ")
-                    if jersey is None:
-                        print("[!] Skipping row (no jersey).")
-                        continue
-
-                if jersey in players:
-                    print(f"[!] Jersey {jersey} already exists, skipping {name}.")
-                    continue
+    Expected CSV columns (in order):
+      First, Last, Song, Artist, StartSeconds, Jersey(optional)
 
-                print(f"\n[Batch] Downloading for {name} — {song} ({artist})")
-                path = download_song(query)
-                if not path:
-                    print("[x] Download failed, skipping this player.")
-                    continue
+    - First/Last/Song/Artist are required.
+    - StartSeconds defaults to 0 if blank/invalid.
+    - Jersey read from column 6 if present; otherwise you’ll be prompted
+      (interactive=False: the row is skipped and listed as failed).
+
+    Rows stream through the pipeline above with up to `workers` downloads
+    running at once. Renames and registry writes still happen one row
+    at a time in CSV order, so the result matches a one-by-one import.
+    Registry commits go out every IMPORT_COMMIT_EVERY rows; each row's
+    progress is kept in an ImportCheckpoint so a rerun continues exactly
+    where an interrupted one stopped. Setting `cancel` stops the import
+    after the row in hand, the same as Ctrl-C (the menu runs it as a
+    background task). One download session serves the whole run.
 
-                players = add_player_auto_from_file(
-                    path=path,
-                    name=name,
-                    jersey=jersey,
-                    start=start_sec,
-                    players=players,
-                )
-                imported += 1
+    `plan` (from plan_import, possibly trimmed after review) downloads just
+    its matches. Without one, import_mode "direct" searches and downloads
+    each row in one go; otherwise the rows are planned first and the plan
+    is accepted as is.
+    """
+    if plan is None and import_mode != "direct":
+        plan = plan_import(players, workers, interactive, cancel)
+        if plan is None:
+            return players
+        for line in plan.lines():
+            print(line)
+    if plan is not None:
+        checkpoint = plan.checkpoint
+    else:
+        checkpoint = open_import_checkpoint()
+        if checkpoint is None:
+            return players
+
+    workers = max(1, int(workers))
+    imported = 0
+    interrupted = False
+    try:
+        with downloader.session() as session:
+            if plan is not None:
+                jobs = iter(plan.jobs)
+            else:
+                rows = iter_csv_rows(BATTERS_CSV, checkpoint)
+                jobs = dedupe_jobs(validate_rows(rows, checkpoint, interactive), players, checkpoint)
+            results = download_jobs(jobs, workers, checkpoint, session)
+            try:
+                with download_progress.reporting():
+                    while not interrupted:
+                        added = []
+                        seen_any = False
+                        with player_store.transaction():
+                            try:
+                                for job, path in itertools.islice(results, IMPORT_COMMIT_EVERY):
+                                    seen_any = True
+                                    if register_job(job, path, players, checkpoint):
+                                        added.append(job["row"])
+                                    if cancel is not None and cancel.is_set():
+                                        interrupted = True
+                                        break
+                            except KeyboardInterrupt:
+                                interrupted = True
+                        # only now is the chunk safely in the registry
+                        for row in added:
+                            checkpoint.mark(row, "registered")
+                        imported += len(added)
+                        if not seen_any:
+                            break
+            finally:
+                # workers are done before the session closes under them
+                results.close()
     except Exception as e:
         print("[x] Error reading CSV:", e)
         return players
 
+    if interrupted:
+        print(f"\n[!] Import interrupted after {imported} player(s). Run 'c' again to resume.")
+        return players
+
+    failures = checkpoint.failures()
+    rejects = checkpoint.rejects()
+    checkpoint.finish()
     print(f"\n[✓] Imported {imported} player(s) from CSV.")
+    print(f"    Download timings: {os.path.basename(DOWNLOAD_LOG)}")
+    if failures:
+        print(f"[!] {len(failures)} row(s) not imported (run 'c' again to retry):")
+        for row, reason in failures:
+            print(f"    row {row}: {reason}")
+    if rejects:
+        print(f"[!] {len(rejects)} row(s) skipped (fix them in the CSV):")
+        for row, reason in rejects:
+            print(f"    row {row}: {reason}")
     return players
 
 
 # --- VLC wrapper ---
 
 class SimplePlayer:
-    def __init__(self, volume: int = 80):
+    """
+    VLC wrapper. Besides the normal (cold) play path it can keep a few
+    "warm" MediaPlayers around: media parsed, buffered, seeked to the
+    player's start offset and paused, so play_file only has to unpause.
+    Every play's start latency is logged to play_latency.csv.
+
+    python-vlc is imported and libvlc started on a background thread, so
+    the menu comes up without waiting for it; the first command that needs
+    playback waits for that thread instead.
+    """
+
+    def __init__(self, volume: int = 80, preload_count: int = DEFAULT_PRELOAD):
         self._mp = None
-        self.available = vlc is not None
+        self._available = False
+        self._ready = threading.Event()
         self._volume = max(0, min(100, int(volume)))
-        if not self.available:
-            print("[!] python-vlc or VLC not available; playback disabled.")
-            return
+        self.preload_count = max(0, int(preload_count))
+        self._warm: dict[tuple[str, int], object] = {}
+        self._warm_lock = threading.Lock()
+        self._pending_preload: list[tuple[str, int]] | None = None
+        self.last_latency_ms: float | None = None
+        self._init_error: str | None = None
+        threading.Thread(target=self._init_vlc, daemon=True).start()
+
+    def _init_vlc(self):
         try:
-            self._mp = vlc.MediaPlayer()
-            self.set_volume(self._volume)
-        except Exception as e:
-            print("[!] Failed to create VLC player:", e)
-            self.available = False
+            if load_vlc() is None:
+                self._init_error = "[!] python-vlc or VLC not available; playback disabled."
+            else:
+                try:
+                    self._mp = vlc.MediaPlayer()
+                    self._mp.audio_set_volume(self._volume)
+                    self._available = True
+                except Exception as e:
+                    self._init_error = f"[!] Failed to create VLC player: {e}"
+        finally:
+            startup.mark("libvlc ready")
+            with self._warm_lock:
+                self._ready.set()
+                pending, self._pending_preload = self._pending_preload, None
+            if pending is not None:
+                self.preload(pending)
+
+    @property
+    def available(self) -> bool:
+        """True once VLC is up; waits for the background init if needed."""
+        if not self._ready.is_set():
+            self._ready.wait()
+        if self._init_error:
+            print(self._init_error)
+            self._init_error = None
+        return self._available
+
+    def _wait_for_state(self, mp, states, timeout: float, step: float = 0.02):
+        deadline = time.perf_counter() + timeout
+        while time.perf_counter() < deadline:
+            if mp.get_state() in states:
+                return True
+            time.sleep(step)
+        return False
+
+    def preload(self, items: list[tuple[str, int]]):
+        """
+        Warm up (path, start_sec) pairs in the background, keeping at most
+        preload_count of them. Warm players not in items are released.
+        """
+        if not self.preload_count:
+            return
+        with self._warm_lock:
+            if not self._ready.is_set():
+                # VLC still starting up: _init_vlc runs the latest request
+                self._pending_preload = list(items)
+                return
+        if not self._available:
+            return
+        wanted = [(path, int(start or 0)) for path, start in items if os.path.exists(path)]
+        wanted = wanted[:self.preload_count]
+        with self._warm_lock:
+            for key in [k for k in self._warm if k not in wanted]:
+                mp = self._warm.pop(key)
+                if mp is not None:
+                    threading.Thread(target=mp.release, daemon=True).start()
+            todo = [key for key in wanted if key not in self._warm]
+            for key in todo:
+                self._warm[key] = None  # placeholder: warming in progress
+        if todo:
+            threading.Thread(target=self._warm_up, args=(todo,), daemon=True).start()
+
+    def _warm_up(self, keys: list[tuple[str, int]]):
+        for path, start_sec in keys:
+            mp = None
+            try:
+                media = vlc.Media(path)
+                media.parse()
+                mp = vlc.MediaPlayer()
+                mp.set_media(media)
+                mp.audio_set_volume(0)
+                mp.play()
+                self._wait_for_state(mp, (vlc.State.Playing,), 1.0)
+                if start_sec > 0:
+                    mp.set_time(int(start_sec * 1000))
+                mp.set_pause(1)
+                self._wait_for_state(mp, (vlc.State.Paused,), 1.0)
+            except Exception:
+                if mp is not None:
+                    mp.release()
+                mp = None
+            with self._warm_lock:
+                if (path, start_sec) in self._warm and mp is not None:
+                    self._warm[(path, start_sec)] = mp
+                else:
+                    # dropped while warming (or failed)
+                    self._warm.pop((path, start_sec), None)
+                    if mp is not None:
+                        mp.release()
+
+    def _take_warm(self, path: str, start_sec: int):
+        with self._warm_lock:
+            key = (path, int(start_sec or 0))
+            if self._warm.get(key) is None:
+                return None
+            return self._warm.pop(key)
 
     def play_file(self, path: str, start_sec: int = 0):
         """Play file from given start time (in seconds) without blipping at 0s."""
@@ -540,7 +3621,21 @@ class SimplePlayer:
         if not os.path.exists(path):
             print("[x] File missing:", path)
             return
+        t0 = time.perf_counter()
+        warm = self._take_warm(path, start_sec)
         try:
+            if warm is not None:
+                # Already buffered and sitting at the start offset: just unpause
+                old = self._mp
+                old.stop()
+                self._mp = warm
+                warm.audio_set_volume(self._volume)
+                warm.set_pause(0)
+                self._wait_for_state(warm, (vlc.State.Playing,), 0.5, step=0.001)
+                self._record_latency(path, True, t0)
+                old.release()
+                return
+
             self._mp.stop()
             self._mp.set_media(vlc.Media(path))
 
@@ -566,10 +3661,26 @@ class SimplePlayer:
                     pass
                 # Restore real volume after seeking
                 self._mp.audio_set_volume(self._volume)
+            self._record_latency(path, False, t0)
 
         except Exception as e:
             print("[x] VLC playback error:", e)
 
+    def _record_latency(self, path: str, warm: bool, t0: float):
+        """Remember and log how long this play took to start audio."""
+        ms = (time.perf_counter() - t0) * 1000
+        self.last_latency_ms = ms
+        try:
+            new_file = not os.path.exists(LATENCY_LOG)
+            with open(LATENCY_LOG, "a", encoding="utf-8", newline="") as f:
+                w = csv.writer(f)
+                if new_file:
+                    w.writerow(["time", "file", "warm", "ms"])
+                w.writerow([time.strftime("%Y-%m-%d %H:%M:%S"),
+                            os.path.basename(path), int(warm), f"{ms:.1f}"])
+        except OSError:
+            pass
+
     def pause(self):
         if self.available:
             try:
@@ -595,93 +3706,392 @@ class SimplePlayer:
 
 # --- UI ---
 
-def print_status(now_playing: dict | None, status: str, volume: int):
-    print("===========================================")
-    print(" Walk-up Song Manager                      ")
-    print("-------------------------------------------")
+def status_lines(now_playing: dict | None, status: str, volume: int,
+                 latency_ms: float | None = None, up_next: str | None = None,
+                 working: list[str] | None = None, notice: str | None = None,
+                 team: str | None = None, activity: str | None = None) -> list[str]:
+    lines = [
+        "===========================================",
+        f" Walk-up Song Manager{' - ' + team if team else ''}",
+        "-------------------------------------------",
+    ]
     if now_playing:
-        print(f" Now Playing: #{now_playing.get('jersey','?')} "
-              f"{now_playing.get('name','?')} "
-              f"({now_playing.get('file','?')} @ {now_playing.get('start',0)}s)")
+        lines.append(f" Now Playing: #{now_playing.get('jersey','?')} "
+                     f"{now_playing.get('name','?')} "
+                     f"({now_playing.get('file','?')} @ {now_playing.get('start',0)}s)")
     else:
-        print(" Now Playing: (none)")
-    print(f" Status: {status:<10} | Volume: {volume}")
-    print("===========================================\n")
+        lines.append(" Now Playing: (none)")
+    line = f" Status: {status:<10} | Volume: {volume}"
+    if latency_ms is not None:
+        line += f" | Start: {latency_ms:.0f} ms"
+    lines.append(line)
+    if up_next:
+        lines.append(f" Up next: {up_next}")
+    if working:
+        lines.append(f" Working: {', '.join(working)}")
+        # kept even when empty, so activity updates never move the prompt row
+        lines.append(f"   {activity}" if activity else "")
+    if notice:
+        lines.append(f" >> {notice}")
+    lines += ["===========================================", ""]
+    return lines
 
 
-def main():
-    # splash
-    clear_screen()
-    print(BANNER)
-    time.sleep(2.5)
+COMMANDS = [
+    ("[jersey]", "play that player's song"),
+    ("[name]", "play by name (holden, hol)"),
+    ("n / Enter", "next batter in the lineup"),
+    ("o", "set batting order (lineup)"),
+    ("d", "download song (background)"),
+    ("a", "set up a finished download"),
+    ("c", "import data/batters.csv"),
+    ("x", "stop a running import"),
+    ("e", "edit existing player"),
+    ("t", "switch team / add a team"),
+    ("l", "list audio files in songs/"),
+    ("p", "pause/resume"),
+    ("s", "stop"),
+    ("v NN", "set volume 0–100 (v 80)"),
+    ("q", "quit"),
+]
+
+
+def command_lines() -> list[str]:
+    """The command help in two columns, so the whole menu fits on one screen."""
+    cells = [f"  {key:<9} -> {text}" for key, text in COMMANDS]
+    half = (len(cells) + 1) // 2
+    lines = ["", "Commands:"]
+    for left, right in itertools.zip_longest(cells[:half], cells[half:], fillvalue=""):
+        lines.append(f"{left:<42}{right}".rstrip())
+    return lines
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Walk-up Song Manager")
+    parser.add_argument("--no-splash", action="store_true",
+                        help="skip the splash banner (or set \"splash\": false in config.json)")
+    parser.add_argument("--startup-profile", action="store_true",
+                        help="print time-to-first-prompt with a per-step breakdown")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None):
+    global downloader, segment_seconds, import_mode, search_results
+    args = parse_args(argv)
+    startup.enabled = args.startup_profile
+    startup.mark("modules imported")
 
-    players = load_players()
     cfg = load_config()
+    # Start libvlc right away so it loads while everything else does
+    sp = SimplePlayer(volume=int(cfg.get("volume", 80)),
+                      preload_count=int(cfg.get("preload", DEFAULT_PRELOAD)))
+    splash = cfg.get("splash", True) and not args.no_splash
+    splash_t0 = time.perf_counter()
+    if splash:
+        clear_screen()
+        print(BANNER)
+
+    song_library.start_watching()
+    startup.mark("songs/ indexed")
+    player_store.team = cfg["team"]
+    players = load_players()
+    startup.mark("players loaded")
     volume = int(cfg.get("volume", 80))
-    sp = SimplePlayer(volume=volume)
+    download_cache.max_bytes = int(cfg.get("cache_max_mb", DEFAULT_CACHE_MB)) * 1024 * 1024
+    clip_cache.seconds = int(cfg.get("clip_seconds", DEFAULT_CLIP_SECONDS))
+    clip_cache.fade = float(cfg.get("clip_fade", DEFAULT_CLIP_FADE))
+    workers = int(cfg.get("import_workers", DEFAULT_IMPORT_WORKERS))
+    downloader = make_downloader(cfg)
+    if cfg.get("download_mode") == "segment":
+        segment_seconds = max(1, int(cfg.get("segment_seconds", clip_cache.seconds)))
+    if cfg.get("import_mode") in IMPORT_MODES:
+        import_mode = cfg["import_mode"]
+    search_results = max(1, int(cfg.get("search_results", DEFAULT_SEARCH_RESULTS)))
+    if "lineup" in cfg:
+        # lineups used to live in config.json; they are per team in players.db now
+        if not player_store.load_lineup()[0]:
+            player_store.save_lineup(Lineup(cfg["lineup"]).order, int(cfg.get("lineup_pos", 0)))
+        cfg.pop("lineup")
+        cfg.pop("lineup_pos", None)
+        save_config(cfg)
+    lineup = Lineup(*player_store.load_lineup())
+    tasks = BackgroundTasks(ui_events)
+    import_cancel = threading.Event()
+    ready_downloads: list[tuple[str, int | None]] = []   # (path, start if already cut)
+    pending_plan: list[ImportPlan] = []   # a finished plan waiting for review ('c')
+
+    def preload_next(after: int | None = None):
+        # batting order when a lineup is set, otherwise jersey order
+        with player_store.lock:
+            if lineup.active:
+                targets = [play_target(players[j]) for j in lineup.upcoming(players, sp.preload_count)]
+            else:
+                targets = upcoming_players(players, after, sp.preload_count)
+        sp.preload(targets)
+
+    def save_lineup():
+        player_store.save_lineup(lineup.order, lineup.pos)
+
+    def render_clips():
+        # until a clip exists play_target seeks in the source, so nothing waits on this
+        with player_store.lock:
+            roster = {j: dict(p) for j, p in players.items()}
+        tasks.start("clips", clip_cache.render_players, roster, workers, coalesce=True)
+
+    def fetch_song(query: str, section: tuple[int, int] | None):
+        # not quiet: its progress bar reaches the status line through ActivityLog
+        path = download_song(query, section=section)
+        return path and (path, 0 if section else None)
+
+    def run_import(plan: ImportPlan | None = None) -> int:
+        before = len(players)
+        import_players_from_csv(players, workers=workers, interactive=False,
+                                cancel=import_cancel, plan=plan)
+        return len(players) - before
+
+    def run_plan() -> ImportPlan | None:
+        return plan_import(players, workers=workers, interactive=False, cancel=import_cancel)
+
+    def importing() -> bool:
+        return bool({"import", "import plan"} & set(tasks.running()))
+
+    def review_plan(plan: ImportPlan) -> str:
+        """Show the plan, let the user drop rows, then download the rest in the background."""
+        print()
+        for line in plan.lines():
+            print(line)
+        answer = ask("\nEnter = download these, n = not now, or row numbers to skip: ").strip().lower()
+        if answer == "n":
+            pending_plan.append(plan)
+            return "Import plan kept - press 'c' to review it again."
+        if answer:
+            rows = {int(tok) for tok in answer.replace(",", " ").split() if tok.isdigit()}
+            plan.skip(rows)
+        if not plan.jobs:
+            return "Nothing left to download in the import plan."
+        tasks.start("import", run_import, plan)
+        return f"Downloading {len(plan.jobs)} planned song(s) in the background ('x' stops it)."
+
+    def finished(name: str, result, error) -> str:
+        """React to a background task ending; returns the notice to show."""
+        if name == "clips":
+            preload_next()
+            return f"[x] Clip render failed: {error}" if error else ""
+        if name == "import plan":
+            stopped = import_cancel.is_set()
+            import_cancel.clear()
+            if error:
+                return f"[x] Import planning failed: {error}"
+            if result is None:
+                return "Import planning stopped. Press 'c' to resume." if stopped else "[x] Could not plan the import."
+            if not result.jobs:
+                return f"Import plan: no song found for {len(result.unmatched)} row(s)."
+            pending_plan.append(result)
+            return (f"Import plan ready: {len(result.jobs)} song(s) matched"
+                    f"{f', {len(result.unmatched)} not found' if result.unmatched else ''}"
+                    " - press 'c' to review and download.")
+        if name == "import":
+            stopped = import_cancel.is_set()
+            import_cancel.clear()
+            render_clips()
+            preload_next()
+            if error:
+                return f"[x] Batch import failed: {error}"
+            text = f"Batch import {'stopped' if stopped else 'done'}: {result} player(s) added."
+            if stopped or os.path.exists(IMPORT_CHECKPOINT_FILE):
+                text += " Press 'c' to resume/retry the rest."
+            return text
+        if error or not result:
+            return f"[x] {name} failed{': ' + str(error) if error else '.'}"
+        ready_downloads.append(result)
+        return f"Downloaded {os.path.basename(result[0])} - press 'a' to set up the player."
+
+    def shutdown():
+        sp.stop()
+        if importing():
+            import_cancel.set()
+            print("\nStopping the batch import (in-flight downloads finish first)...")
+            tasks.wait("import", "import plan")
+        player_store.close()
+        print("Bye.")
+
+    # from here on background threads report on the status line, not over the menu
+    screen.track_stdout(ActivityLog(ACTIVITY_LOG, lambda line: ui_events.put(("activity", line))))
+    render_clips()
+    startup.mark("clip render started")
+    preload_next()
+    if splash:
+        # the banner stays up for SPLASH_SECONDS total, not on top of startup
+        time.sleep(max(0.0, SPLASH_SECONDS - (time.perf_counter() - splash_t0)))
 
     now_playing = None
     status = "Stopped"
+    notice = ""
+    activity = ""   # latest line a background task printed (all of it is in ACTIVITY_LOG)
+    redraw = True
+    keep_prompt = False   # the redraw is for background activity, not a command
+    console.start()
+
+    help_lines = command_lines()
 
     while True:
-        clear_screen()
-        print_status(now_playing, status, volume)
-        print("Current Players:")
-        print_players(players)
-        print("\nCommands:")
-        print("  [jersey]  -> play that player's song")
-        print("  d         -> download new song + add player (manual)")
-        print("  c         -> import batch from data/batters.csv")
-        print("  e         -> edit existing player")
-        print("  p         -> pause/resume")
-        print("  s         -> stop")
-        print("  v NN      -> set volume 0–100 (e.g., v 80)")
-        print("  l         -> list audio files in songs/")
-        print("  q         -> quit")
+        if redraw:
+            with player_store.lock:
+                up_next = None
+                if lineup.active:
+                    due = lineup.upcoming(players, 1)
+                    if due:
+                        spot = lineup.order.index(due[0]) + 1
+                        up_next = (f"#{due[0]} {players[due[0]].get('name', '?')} "
+                                   f"(batting {spot}/{len(lineup.order)}) - press Enter")
+                working = tasks.running()
+                if not working:
+                    activity = ""
+                if ready_downloads:
+                    working.append(f"{len(ready_downloads)} download(s) ready ('a')")
+                if pending_plan:
+                    working.append("import plan ready ('c')")
+                frame = status_lines(now_playing, status, volume, sp.last_latency_ms, up_next,
+                                     working, notice, player_store.team, activity)
+                frame.append("Current Players:")
+                frame += player_table.lines(players)
+            frame += help_lines
+            frame += startup.report_lines()
+            frame += ["", "Select: "]
+            screen.render(frame, keep_prompt)
+        redraw = True
+        keep_prompt = False
 
         try:
-            cmd = input("\nSelect: ").strip()
-        except (EOFError, KeyboardInterrupt):
-            print("\nBye.")
+            kind, payload = ui_events.get(timeout=0.5)
+        except queue.Empty:
+            redraw = False
+            continue
+        except KeyboardInterrupt:
+            if importing():
+                import_cancel.set()
+                notice = "Stopping the batch import after the current row..."
+                continue
+            kind, payload = "eof", None
+
+        if kind == "done":
+            notice = finished(*payload)
+            continue
+        if kind == "activity":
+            activity = payload
+            keep_prompt = True
+            continue
+        if kind == "eof":
+            shutdown()
             break
 
+        cmd = payload.strip()
+        notice = ""
         if not cmd:
-            continue
+            if not lineup.active:
+                continue
+            cmd = "n"
 
         low = cmd.lower()
 
-        if low == "q":
-            sp.stop()
-            print("Bye.")
-            break
+        try:
+            if low == "q":
+                shutdown()
+                break
 
-        if low == "l":
-            print("\nAudio files in songs/:")
-            for name in list_audio_files():
-                print(" -", name)
-            input("\nPress Enter to continue...")
-            continue
+            if low == "l":
+                print("\nAudio files in songs/:")
+                for name in list_audio_files():
+                    print(" -", name)
+                print("\nSelect: ", end="", flush=True)
+                redraw = False
+                continue
 
-        if low == "d":
-            query = input("Search YouTube (song + artist): ").strip()
-            if not query:
+            if low == "d":
+                query = ask("Search YouTube (song + artist): ").strip()
+                if not query:
+                    continue
+                section = None
+                if segment_seconds:
+                    # segment mode needs the walk-up start before downloading
+                    start = prompt_int("Start time in seconds (0 for start of song): ", allow_blank=True)
+                    section = download_section(start)
+                if not tasks.start(f"download '{query}'", fetch_song, query, section):
+                    notice = "That song is already downloading."
                 continue
-            path = download_song(query)
-            if path:
-                players = add_player_from_file(path, players)
-            input("Press Enter to continue...")
-            continue
 
-        if low == "c":
-            print(f"\n[Batch Import] Using CSV: {BATTERS_CSV}")
-            players = import_players_from_csv(players)
-            input("Press Enter to continue...")
-            continue
+            if low == "a":
+                if not ready_downloads:
+                    notice = "No finished downloads waiting (use 'd' first)."
+                    continue
+                path, start = ready_downloads.pop(0)
+                notice = add_player_from_file(path, players, start)
+                with player_store.lock:
+                    used = any(p.get("file") == os.path.basename(path) for p in players.values())
+                if os.path.exists(path) and not used:
+                    # setup was skipped: keep the download reachable instead of orphaning it
+                    ready_downloads.insert(0, (path, start))
+                    notice += " The download is still waiting ('a')."
+                render_clips()
+                preload_next()
+                continue
 
-        if low == "e":
-            players = edit_player(players)
-            input("Press Enter to continue...")
-            continue
+            if low == "c":
+                csv_name = os.path.relpath(BATTERS_CSV, BASE)
+                if importing():
+                    notice = "A batch import is already running."
+                elif pending_plan:
+                    notice = review_plan(pending_plan.pop())
+                elif import_mode == "review":
+                    tasks.start("import plan", run_plan)
+                    notice = f"Looking up the songs in {csv_name} ('x' stops it)..."
+                else:
+                    tasks.start("import", run_import)
+                    notice = f"Importing {csv_name} in the background ('x' stops it)."
+                continue
+
+            if low == "x":
+                if importing():
+                    import_cancel.set()
+                    notice = "Stopping the batch import after the current row..."
+                else:
+                    notice = "No batch import is running."
+                continue
+
+            if low == "e":
+                notice = edit_player(players)
+                render_clips()
+                preload_next()
+                continue
+
+            if low == "o":
+                # the submenu works on a snapshot; imports go on meanwhile
+                with player_store.lock:
+                    roster = dict(players)
+                lineup, notice = setup_lineup(lineup, roster)
+                save_lineup()
+                preload_next()
+                continue
+
+            if low == "t":
+                if importing():
+                    notice = "Wait for the batch import to finish before switching teams."
+                    continue
+                team = pick_team()
+                if team:
+                    pending_plan.clear()   # it was checked against the old roster
+                    with player_store.lock:
+                        players = player_store.use_team(team)
+                        lineup = Lineup(*player_store.load_lineup())
+                    cfg["team"] = player_store.team
+                    save_config(cfg)
+                    render_clips()
+                    preload_next()
+                    notice = f"Team: {player_store.team} ({len(players)} players)"
+                continue
+        except EOFError:
+            shutdown()
+            break
 
         if low == "p":
             sp.pause()
@@ -694,7 +4104,7 @@ def main():
             now_playing = None
             continue
 
-        if low.startswith("v"):
+        if low.split()[0] == "v":
             parts = low.split()
             if len(parts) == 2 and parts[1].isdigit():
                 volume = int(parts[1])
@@ -702,31 +4112,53 @@ def main():
                 sp.set_volume(volume)
                 cfg["volume"] = volume
                 save_config(cfg)
-                print(f"Volume set to {volume}")
-                time.sleep(0.7)
+                notice = f"Volume set to {volume}"
             else:
-                print("Usage: v 80")
-                time.sleep(1)
+                notice = "Usage: v 80"
             continue
 
-        # jersey selection
-        if cmd.isdigit():
-            jersey = int(cmd)
-            if jersey not in players:
-                print("No player with that jersey.")
-                time.sleep(1.2)
-                continue
-            p = players[jersey]
-            filename = p.get("file")
-            start = int(p.get("start", 0))
-            path = os.path.join(SONG_DIR, filename)
+        # next batter, jersey or name ("n", "12", "holden", "hol", "play clay hol")
+        query = cmd[5:].strip() if low.startswith("play ") else cmd
+        if low == "n" or cmd.isdigit() or normalize_name(query):
+            if low == "n":
+                with player_store.lock:
+                    jersey = lineup.next(players)
+                if jersey is None:
+                    notice = "No lineup set (use 'o')." if not lineup.active else "Nobody in the lineup is on the roster."
+                    continue
+            elif cmd.isdigit():
+                jersey = int(cmd)
+            else:
+                # "Pick one" may wait on the user, so it gets a snapshot, not the lock
+                with player_store.lock:
+                    roster = dict(players)
+                elsewhere: list[str] = []
+                try:
+                    jersey = pick_player(query, roster, elsewhere)
+                except EOFError:
+                    shutdown()
+                    break
+                if jersey is None:
+                    notice = no_pick_notice(query, elsewhere)
+                    continue
+            with player_store.lock:
+                p = players.get(jersey)
+                if p is None:
+                    notice = "No player with that jersey."
+                    continue
+                if low != "n":
+                    lineup.jump_past(jersey)
+                path, start = play_target(p)
             now_playing = p
             status = "Playing"
             sp.play_file(path, start_sec=start)
+            if lineup.active:
+                save_lineup()
+            # get the following batters buffered while this song plays
+            preload_next(jersey)
             continue
 
-        print("Unknown command.")
-        time.sleep(1.2)
+        notice = f"Unknown command: {cmd}"
 
 
 if __name__ == "__main__":
@@ -736,4 +4168,7 @@ if __name__ == "__main__":
         # If something unexpected happens, don't just insta-close.
         print("\n[CRASH] An unexpected error occurred:")
         print(repr(e))
-        input("Press Enter to exit...")
+        try:
+            ask("Press Enter to exit...")
+        except EOFError:
+            pass
@@ -0,0 +1,537 @@
+# benchmark.py — timing harness for FinalProjectv2Holden.py
+#
+# Builds synthetic players.json / songs/ / batters.csv fixtures at a few
+# sizes in a temp folder (your real songs and players are never touched)
+# and times the hot paths:
+#   - startup to first prompt (the real script with --no-splash, timed from
+#     the moment its process is launched)
+#   - load_players / save_players (one changed player, and a WAL checkpoint)
+#   - list_audio_files (in-memory index and a cold rescan)
+#   - menu redraw: the frame the main loop builds, rendered as plain text
+#   - ScreenRenderer: a full frame vs. one where only the volume changed
+#   - import_players_from_csv against LocalBackend (no network), whole songs
+#     and segment-only downloads
+#   - SimplePlayer.play_file cold and warm against a fake VLC
+#
+# Every run appends its results to bench_results.jsonl tagged with the git
+# commit, and each case is compared with the last run from a different
+# commit, so a slowdown shows up as "REGRESSION" in the table.
+#
+# Usage:
+#   python benchmark.py                 # all cases, all sizes
+#   python benchmark.py --quick         # smallest size, fewer rounds
+#   python benchmark.py --only import   # cases whose name contains "import"
+#   python benchmark.py --no-save       # don't append to bench_results.jsonl
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+SCRIPT = os.path.join(HERE, "FinalProjectv2Holden.py")
+RESULTS_FILE = os.path.join(HERE, "bench_results.jsonl")
+
+sys.path.insert(0, HERE)
+import FinalProjectv2Holden as app  # noqa: E402  (chdirs into HERE; harmless)
+
+# Roster / library sizes; --quick only runs the first
+SIZES = [10, 100, 1000]
+# Batters per import run (LocalBackend, 4 workers)
+IMPORT_SIZES = [10, 50]
+# Median this much slower than the previous commit's -> flagged
+DEFAULT_THRESHOLD = 1.25
+
+
+# --- Fixtures ---
+
+def make_fixture(root: str, players: int, songs: int):
+    """players.json + songs/ with `players` entries and `songs` audio files."""
+    song_dir = os.path.join(root, "songs")
+    data_dir = os.path.join(root, "data")
+    os.makedirs(song_dir, exist_ok=True)
+    os.makedirs(data_dir, exist_ok=True)
+    for i in range(songs):
+        with open(os.path.join(song_dir, f"player_{i:05d}.mp3"), "wb") as f:
+            f.write(os.urandom(4096))
+    roster = {
+        str(j): {"jersey": j, "name": f"Player {j:05d}", "file": f"player_{j % max(songs, 1):05d}.mp3",
+                 "start": j % 40}
+        for j in range(1, players + 1)
+    }
+    with open(os.path.join(root, "players.json"), "w", encoding="utf-8") as f:
+        json.dump(roster, f, indent=2)
+
+
+def make_import_fixture(root: str, batters: int):
+    """batters.csv with `batters` rows + a LocalBackend library that matches them."""
+    lib = os.path.join(root, "library")
+    os.makedirs(lib, exist_ok=True)
+    with open(os.path.join(root, "data", "batters.csv"), "w", encoding="utf-8", newline="") as f:
+        f.write("First,Last,Song,Artist,StartSeconds,Jersey\n")
+        for i in range(batters):
+            f.write(f"Bat{i},Ter{i},Song{i},Band{i},{i % 30},{5000 + i}\n")
+            with open(os.path.join(lib, f"Song{i}_Band{i}.mp3"), "wb") as out:
+                out.write(os.urandom(256 * 1024))
+
+
+@contextlib.contextmanager
+def sandbox(root: str):
+    """Point the app's paths and module-level singletons at `root`."""
+    names = ["SONG_DIR", "REGISTRY_DB", "PLAYERS_FILE", "JOURNAL_FILE", "DATA_DIR", "BATTERS_CSV",
+             "CACHE_DIR", "CLIPS_DIR", "LATENCY_LOG", "DOWNLOAD_LOG", "IMPORT_CHECKPOINT_FILE",
+             "SEARCH_CACHE_FILE", "song_library", "player_store", "player_index", "player_table",
+             "download_cache", "search_cache", "download_progress", "clip_cache", "downloader"]
+    saved = {n: getattr(app, n) for n in names}
+    song_dir = os.path.join(root, "songs")
+    app.SONG_DIR = song_dir
+    app.REGISTRY_DB = os.path.join(root, "players.db")
+    app.PLAYERS_FILE = os.path.join(root, "players.json")
+    app.JOURNAL_FILE = os.path.join(root, "players.journal")
+    app.DATA_DIR = os.path.join(root, "data")
+    app.BATTERS_CSV = os.path.join(root, "data", "batters.csv")
+    app.CACHE_DIR = os.path.join(song_dir, ".cache")
+    app.CLIPS_DIR = os.path.join(song_dir, ".clips")
+    app.LATENCY_LOG = os.path.join(root, "play_latency.csv")
+    app.DOWNLOAD_LOG = os.path.join(root, "download_timings.csv")
+    app.IMPORT_CHECKPOINT_FILE = os.path.join(root, "data", ".import_checkpoint.jsonl")
+    app.SEARCH_CACHE_FILE = os.path.join(app.CACHE_DIR, "search.json")
+    app.song_library = app.SongLibrary(song_dir, app.AUDIO_EXTS)
+    app.player_store = app.PlayerStore(app.REGISTRY_DB, app.PLAYERS_FILE, app.JOURNAL_FILE)
+    # the index and table follow commits of the store they subscribed to
+    app.player_index = app.PlayerIndex()
+    app.player_store.subscribe(app.player_index)
+    app.player_table = app.PlayerTable()
+    app.player_store.subscribe(app.player_table)
+    app.download_cache = app.DownloadCache(app.CACHE_DIR, app.DEFAULT_CACHE_MB * 1024 * 1024)
+    app.search_cache = app.SearchCache(app.SEARCH_CACHE_FILE, app.SEARCH_CACHE_DAYS * 86400)
+    app.download_progress = app.DownloadProgress(app.DOWNLOAD_LOG)
+    app.clip_cache = app.ClipCache(app.CLIPS_DIR, app.DEFAULT_CLIP_SECONDS, app.DEFAULT_CLIP_FADE)
+    try:
+        yield
+    finally:
+        app.player_store.close()
+        for n, v in saved.items():
+            setattr(app, n, v)
+
+
+# --- Fake VLC ---
+
+class FakeVlc:
+    """
+    Just enough of python-vlc for SimplePlayer. A MediaPlayer reports
+    Playing `startup` seconds after play(), standing in for libvlc opening
+    and buffering the file; parse() costs `parse` seconds.
+    """
+
+    class State:
+        NothingSpecial, Opening, Playing, Paused, Stopped = range(5)
+
+    def __init__(self, startup: float = 0.03, parse: float = 0.01):
+        fake = self
+
+        class Media:
+            def __init__(self, path):
+                self.path = path
+
+            def parse(self):
+                time.sleep(fake.parse)
+
+        class MediaPlayer:
+            def __init__(self):
+                self._state = fake.State.NothingSpecial
+                self._play_at = 0.0
+
+            def set_media(self, media):
+                self._state = fake.State.NothingSpecial
+
+            def play(self):
+                self._state = fake.State.Opening
+                self._play_at = time.perf_counter() + fake.startup
+
+            def get_state(self):
+                if self._state == fake.State.Opening and time.perf_counter() >= self._play_at:
+                    self._state = fake.State.Playing
+                return self._state
+
+            def set_pause(self, on):
+                self.get_state()
+                self._state = fake.State.Paused if on else fake.State.Playing
+
+            def pause(self):
+                self.set_pause(self._state != fake.State.Paused)
+
+            def stop(self):
+                self._state = fake.State.Stopped
+
+            def set_time(self, ms):
+                pass
+
+            def audio_set_volume(self, vol):
+                pass
+
+            def release(self):
+                pass
+
+        self.startup = startup
+        self.parse = parse
+        self.Media = Media
+        self.MediaPlayer = MediaPlayer
+
+
+# --- Timing ---
+
+def measure(fn, rounds: int, setup=None) -> list[float]:
+    """Run fn `rounds` times (setup untimed before each); seconds per round."""
+    times = []
+    for _ in range(rounds):
+        arg = setup() if setup else None
+        t0 = time.perf_counter()
+        if setup:
+            fn(arg)
+        else:
+            fn()
+        times.append(time.perf_counter() - t0)
+    return times
+
+
+def quiet(fn):
+    """Wrap fn so its prints don't end up in the timing output."""
+    def run(*args):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return fn(*args)
+    return run
+
+
+# --- Cases ---
+# Each case returns {size_label: [seconds per round]}.
+
+def time_to_prompt(cmd: list[str], env: dict, timeout: float = 120) -> float | None:
+    """
+    Seconds from launching `cmd` until it prints the menu's "Select: "
+    prompt, so interpreter start-up and imports count too. None if the
+    prompt never shows.
+    """
+    t0 = time.perf_counter()
+    proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                            stderr=subprocess.DEVNULL, env=env)
+    elapsed = None
+    tail = b""
+    try:
+        while True:
+            chunk = os.read(proc.stdout.fileno(), 65536)
+            if not chunk:
+                break
+            if b"Select: " in tail + chunk:
+                elapsed = time.perf_counter() - t0
+                break
+            tail = (tail + chunk)[-16:]
+        proc.communicate(b"q\n", timeout=timeout)
+    finally:
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+    return elapsed
+
+
+def case_startup(sizes, rounds):
+    """Real script in a subprocess: launch to first prompt."""
+    # No ffmpeg on PATH, so startup doesn't try to render clips of fake songs
+    path = os.pathsep.join(p for p in os.environ.get("PATH", "").split(os.pathsep)
+                           if not os.path.exists(os.path.join(p, "ffmpeg")))
+    env = dict(os.environ, PATH=path)
+    out = {}
+    for n in sizes:
+        with tempfile.TemporaryDirectory() as root:
+            make_fixture(root, n, n)
+            shutil.copy(SCRIPT, root)
+            script = os.path.join(root, os.path.basename(SCRIPT))
+            times = []
+            for _ in range(rounds):
+                elapsed = time_to_prompt([sys.executable, script, "--no-splash"], env)
+                if elapsed is not None:
+                    times.append(elapsed)
+            if times:
+                out[f"{n} players"] = times
+    return out
+
+
+def case_load_players(sizes, rounds):
+    out = {}
+    for n in sizes:
+        with tempfile.TemporaryDirectory() as root:
+            make_fixture(root, n, n)
+            with sandbox(root):
+                quiet(app.load_players)()  # one-time players.json migration, untimed
+                out[f"{n} players"] = measure(app.load_players, rounds)
+    return out
+
+
+def case_save_one(sizes, rounds):
+    """save_players after changing one player's start (the everyday edit)."""
+    out = {}
+    for n in sizes:
+        with tempfile.TemporaryDirectory() as root:
+            make_fixture(root, n, n)
+            with sandbox(root):
+                players = quiet(app.load_players)()
+
+                def edit():
+                    players[1]["start"] = (players[1]["start"] + 1) % 60
+                    return players
+
+                out[f"{n} players"] = measure(app.save_players, rounds, setup=edit)
+    return out
+
+
+def case_save_compact(sizes, rounds):
+    """WAL checkpoint into players.db (what quitting costs)."""
+    out = {}
+    for n in sizes:
+        with tempfile.TemporaryDirectory() as root:
+            make_fixture(root, n, n)
+            with sandbox(root):
+                quiet(app.load_players)()
+                out[f"{n} players"] = measure(app.player_store.compact, rounds)
+    return out
+
+
+def case_list_audio(sizes, rounds):
+    out = {}
+    for n in sizes:
+        with tempfile.TemporaryDirectory() as root:
+            make_fixture(root, 0, n)
+            with sandbox(root):
+                app.song_library.rescan()
+                out[f"{n} songs"] = measure(app.list_audio_files, rounds)
+                out[f"{n} songs, rescan"] = measure(app.song_library.rescan, rounds)
+    return out
+
+
+def case_menu_redraw(sizes, rounds):
+    """What the main loop does per redraw: build the frame and render it (no ANSI)."""
+    out = {}
+    for n in sizes:
+        with tempfile.TemporaryDirectory() as root:
+            make_fixture(root, n, n)
+            with sandbox(root):
+                players = quiet(app.load_players)()
+                screen = app.ScreenRenderer(io.StringIO())
+                screen.ansi = False
+                help_lines = app.command_lines()
+
+                def redraw():
+                    frame = app.status_lines(players[1], "Playing", 80, 12.0, working=["import"],
+                                             activity="[Progress] 3/10 done")
+                    frame.append("Current Players:")
+                    frame += app.player_table.lines(players)
+                    screen.render(frame + help_lines + ["", "Select: "])
+
+                out[f"{n} players"] = measure(redraw, rounds)
+    return out
+
+
+def case_menu_render(sizes, rounds):
+    """ScreenRenderer into a fake ANSI terminal: full frame vs. volume-only change."""
+    out = {}
+    for n in sizes:
+        with tempfile.TemporaryDirectory() as root:
+            make_fixture(root, n, n)
+            with sandbox(root):
+                players = quiet(app.load_players)()
+                screen = app.ScreenRenderer(io.StringIO())
+                screen.ansi = True
+                screen.size = os.terminal_size((120, n + 60))
+                volume = [80]
+
+                def frame():
+                    volume[0] = 81 - volume[0] % 2
+                    return (app.status_lines(players[1], "Playing", volume[0], 12.0)
+                            + app.player_lines(players) + app.command_lines() + ["", "Select: "])
+
+                def full(lines):
+                    screen.invalidate()
+                    screen.render(lines)
+
+                out[f"{n} players, full"] = measure(full, rounds, setup=frame)
+                out[f"{n} players, volume"] = measure(screen.render, rounds, setup=frame)
+    return out
+
+
+def case_import(sizes, rounds, segment: int = 0, mode: str = "auto"):
+    """import_players_from_csv with LocalBackend: 5 ms latency, 8 MB/s per job (plan, then download)."""
+    out = {}
+    saved = app.segment_seconds, app.import_mode
+    app.segment_seconds = segment
+    app.import_mode = mode
+    try:
+        for n in sizes:
+            times = []
+            for _ in range(rounds):
+                with tempfile.TemporaryDirectory() as root:
+                    make_fixture(root, 0, 0)
+                    make_import_fixture(root, n)
+                    with sandbox(root):
+                        app.downloader = app.LocalBackend(os.path.join(root, "library"),
+                                                          latency=0.005, bandwidth=8 * 1024 * 1024)
+                        players = quiet(app.load_players)()
+                        times += measure(quiet(lambda: app.import_players_from_csv(players, workers=4)), 1)
+            out[f"{n} batters"] = times
+    finally:
+        app.segment_seconds, app.import_mode = saved
+    return out
+
+
+def case_import_segment(sizes, rounds):
+    """Same import, but each row fetches only a 30 s walk-up window of a 210 s track."""
+    return case_import(sizes, rounds, segment=30)
+
+
+def case_import_direct(sizes, rounds):
+    """Same import with search + download in one step per row (import_mode "direct")."""
+    return case_import(sizes, rounds, mode="direct")
+
+
+def case_play(sizes, rounds):
+    """SimplePlayer.play_file cold (load + seek) vs warm (preloaded) with fake VLC."""
+    out = {}
+    saved = app.vlc, app._vlc_loaded
+    app.vlc, app._vlc_loaded = FakeVlc(), True
+    try:
+        with tempfile.TemporaryDirectory() as root:
+            make_fixture(root, 1, 1)
+            with sandbox(root):
+                path = os.path.join(app.SONG_DIR, "player_00000.mp3")
+                sp = quiet(app.SimplePlayer)(80, 0)
+                out["cold, start 20s"] = measure(quiet(lambda: sp.play_file(path, 20)), rounds)
+
+                warm = quiet(app.SimplePlayer)(80, 1)
+
+                def preload():
+                    warm.preload([(path, 20)])
+                    deadline = time.perf_counter() + 2
+                    while warm._warm.get((path, 20)) is None and time.perf_counter() < deadline:
+                        time.sleep(0.001)
+
+                out["warm, start 20s"] = measure(lambda _: warm.play_file(path, 20), rounds, setup=preload)
+    finally:
+        app.vlc, app._vlc_loaded = saved
+    return out
+
+
+CASES = {
+    "startup": (case_startup, SIZES),
+    "load_players": (case_load_players, SIZES),
+    "save_players": (case_save_one, SIZES),
+    "save_players_compact": (case_save_compact, SIZES),
+    "list_audio_files": (case_list_audio, SIZES),
+    "menu_redraw": (case_menu_redraw, SIZES),
+    "menu_render": (case_menu_render, SIZES),
+    "import_players_from_csv": (case_import, IMPORT_SIZES),
+    "import_segments": (case_import_segment, IMPORT_SIZES),
+    "import_direct": (case_import_direct, IMPORT_SIZES),
+    "play_file": (case_play, [None]),
+}
+
+
+# --- Results ---
+
+def git_commit() -> str:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=HERE,
+                             capture_output=True, text=True, timeout=10)
+        commit = out.stdout.strip() or "unknown"
+        dirty = subprocess.run(["git", "status", "--porcelain", "--", SCRIPT], cwd=HERE,
+                               capture_output=True, text=True, timeout=10).stdout.strip()
+        return commit + ("+dirty" if dirty else "")
+    except (OSError, subprocess.SubprocessError):
+        return "unknown"
+
+
+def load_history() -> list[dict]:
+    rows = []
+    try:
+        with open(RESULTS_FILE, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    rows.append(json.loads(line))
+                except ValueError:
+                    continue
+    except FileNotFoundError:
+        pass
+    return rows
+
+
+def previous(history: list[dict], case: str, size: str, commit: str) -> dict | None:
+    """Latest stored result for case/size from a different commit."""
+    for row in reversed(history):
+        if row["case"] == case and row["size"] == size and row["commit"] != commit:
+            return row
+    return None
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="Benchmark the walk-up song manager")
+    parser.add_argument("--quick", action="store_true", help="smallest size only, 3 rounds")
+    parser.add_argument("--rounds", type=int, default=None, help="rounds per case (default 10)")
+    parser.add_argument("--only", default="", help="run cases whose name contains this")
+    parser.add_argument("--no-save", action="store_true", help="don't append to bench_results.jsonl")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="flag a median this many times slower than last commit's")
+    args = parser.parse_args(argv)
+
+    rounds = args.rounds or (3 if args.quick else 10)
+    commit = git_commit()
+    history = load_history()
+    stamp = time.strftime("%Y-%m-%d %H:%M:%S")
+    print(f"Benchmark @ {commit}  (python {platform.python_version()}, {rounds} rounds)\n")
+    print(f"{'case':<24} {'size':<18} {'min ms':>9} {'median ms':>10} {'prev ms':>9}")
+    print("-" * 76)
+
+    regressions = 0
+    new_rows = []
+    for name, (fn, sizes) in CASES.items():
+        if args.only and args.only not in name:
+            continue
+        if args.quick:
+            sizes = sizes[:1]
+        case_rounds = min(rounds, 3) if name.startswith(("startup", "import")) else rounds
+        for size, times in fn(sizes, case_rounds).items():
+            med = statistics.median(times) * 1000
+            row = {
+                "time": stamp, "commit": commit, "python": platform.python_version(),
+                "case": name, "size": size, "rounds": len(times),
+                "min_ms": round(min(times) * 1000, 3), "median_ms": round(med, 3),
+                "mean_ms": round(statistics.mean(times) * 1000, 3),
+            }
+            new_rows.append(row)
+            prev = previous(history, name, size, commit)
+            note = ""
+            prev_text = "-"
+            if prev:
+                prev_text = f"{prev['median_ms']:.2f}"
+                if med > prev["median_ms"] * args.threshold:
+                    note = "  REGRESSION"
+                    regressions += 1
+            print(f"{name:<24} {size:<18} {row['min_ms']:>9.2f} {med:>10.2f} {prev_text:>9}{note}")
+
+    if not args.no_save and new_rows:
+        with open(RESULTS_FILE, "a", encoding="utf-8") as f:
+            for row in new_rows:
+                f.write(json.dumps(row) + "\n")
+        print(f"\nSaved {len(new_rows)} result(s) to {os.path.basename(RESULTS_FILE)}")
+    if regressions:
+        print(f"[!] {regressions} case(s) slower than the previous commit by >{args.threshold:.2f}x")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
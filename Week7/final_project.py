@@ -17,13 +17,19 @@
 #       • Set/change per-file start time (seek on playback)
 # - Basic error handling for missing files, bad input, missing tools
 # - Splash screen with hawk ASCII art, then clears into main app
-# - Simple ASCII loading bar for downloads (yt-dlp output silenced)
+# - Live download bar (percent, speed, ETA, conversion step, stall warning);
+#   per-download timings are appended to download_timings.csv
+# - Download cache in ./songs/.cache so repeat searches skip YouTube
+# - ./songs is indexed once and kept current by a file watcher (no rescans)
+# - Walk-up clips pre-cut at the start time, normalized + faded (./songs/.clips)
+# - Downloads keep YouTube's own audio format (m4a as is, opus remuxed);
+#   set AUDIO_CODEC = "mp3" to convert everything to mp3 instead
 #
 # How to run
 # ----------
 # 1. Install Python packages (inside your venv if you use one):
 #       pip install yt-dlp python-vlc
-# 2. Install FFmpeg (needed for mp3 conversion with yt-dlp):
+# 2. Install FFmpeg (needed by yt-dlp to extract/convert the audio):
 #       Linux (Debian/Ubuntu): sudo apt install ffmpeg
 #       Fedora: sudo dnf install ffmpeg
 #       macOS (Homebrew): brew install ffmpeg
@@ -36,6 +42,8 @@
 #         └── batters.csv   (optional, for batch download)
 # 5. Run:
 #       python final_project.py
+#       python final_project.py --no-splash        (skip the banner)
+#       python final_project.py --startup-profile  (time to first prompt)
 #
 # Menu commands
 # -------------
@@ -51,8 +59,20 @@
 
 import os
 import re
+import sys
 import time
 import csv
+import json
+import uuid
+import shutil
+import hashlib
+import threading
+import subprocess
+import struct
+import argparse
+
+# Reference point for --startup-profile
+_T0 = time.perf_counter()
 
 BANNER = r"""
                                                                                                     
@@ -102,22 +122,145 @@ DATA_DIR = os.path.join(BASE_DIR, "data")
 os.makedirs(SONG_DIR, exist_ok=True)
 os.makedirs(DATA_DIR, exist_ok=True)
 
-AUDIO_EXTS = {".mp3", ".m4a", ".wav", ".flac", ".ogg"}
+AUDIO_EXTS = {".mp3", ".m4a", ".opus", ".wav", ".flac", ".ogg"}
+
+# yt-dlp audio codec: "best" keeps the stream YouTube serves (an m4a is used
+# as is, webm/opus is remuxed to .opus) so nothing is re-encoded; "mp3"
+# converts every download to a 192k mp3.
+AUDIO_CODEC = "best"
+
+# Per-row state of a batch import, so an interrupted one can resume
+IMPORT_CHECKPOINT_FILE = os.path.join(DATA_DIR, ".import_checkpoint.jsonl")
+
+# Query -> audio download cache (see DownloadCache)
+CACHE_DIR = os.path.join(SONG_DIR, ".cache")
+CACHE_MAX_MB = 512
+
+# Pre-trimmed walk-up clips (see ClipCache): max length + fade-in, in seconds
+CLIPS_DIR = os.path.join(SONG_DIR, ".clips")
+CLIP_SECONDS = 30
+CLIP_FADE = 1.0
+
+# One row per finished download (timings for later analysis)
+DOWNLOAD_LOG = os.path.join(BASE_DIR, "download_timings.csv")
+STALL_SECONDS = 10
 
 
 # ---------- External libraries (yt-dlp + VLC) ----------
+# Both are slow to import (yt-dlp loads hundreds of site extractors, VLC
+# scans its plugins), so they are loaded on first use instead of at startup.
+
+YoutubeDL = None
+vlc = None
+_import_lock = threading.Lock()
+_loaded = set()
+
+
+def load_yt_dlp():
+    """
+    Import yt-dlp the first time a download needs it (warns on every call
+    while it is missing).
+
+    Returns:
+        type | None: The YoutubeDL class, or None if yt-dlp is missing.
+    """
+    global YoutubeDL
+    with _import_lock:
+        if "yt_dlp" not in _loaded:
+            _loaded.add("yt_dlp")
+            try:
+                from yt_dlp import YoutubeDL
+            except Exception:
+                YoutubeDL = None
+    if YoutubeDL is None:
+        # every download that needs it says why it can't run
+        print("[!] yt-dlp is not installed. Run:  pip install yt-dlp")
+    return YoutubeDL
+
+
+def load_vlc():
+    """
+    Import python-vlc the first time playback needs it.
+
+    Returns:
+        module | None: The vlc module, or None if python-vlc is missing.
+    """
+    global vlc
+    with _import_lock:
+        if "vlc" not in _loaded:
+            _loaded.add("vlc")
+            try:
+                import vlc
+            except Exception:
+                vlc = None
+    return vlc
+
+
+def start_vlc_player():
+    """
+    Import VLC and create the MediaPlayer on a background thread, so libvlc
+    starts up while the menu is already on screen.
+
+    Returns:
+        callable: get_player() -> MediaPlayer | None. Waits for the
+        background thread the first time and prints any setup error once.
+    """
+    result = {"player": None, "error": None}
+    ready = threading.Event()
+
+    def work():
+        try:
+            if load_vlc() is None:
+                result["error"] = "[!] VLC Python bindings not available. Playback will be disabled."
+            else:
+                try:
+                    result["player"] = vlc.MediaPlayer()
+                except Exception as e:
+                    result["error"] = f"[x] Could not initialize VLC MediaPlayer: {e}"
+        finally:
+            startup_mark("libvlc ready")
+            ready.set()
+
+    threading.Thread(target=work, daemon=True).start()
+
+    def get_player():
+        ready.wait()
+        if result["error"]:
+            print(result["error"])
+            result["error"] = None
+        return result["player"]
+
+    return get_player
 
-try:
-    from yt_dlp import YoutubeDL
-except Exception:
-    print("[!] yt-dlp is not installed. Run:  pip install yt-dlp")
-    YoutubeDL = None
 
-try:
-    import vlc
-except Exception:
-    print("[!] python-vlc is not installed. Run:  pip install python-vlc")
-    vlc = None
+# ---------- Startup profile (--startup-profile) ----------
+
+_startup_marks = []
+_startup_enabled = False
+
+
+def startup_mark(label):
+    """
+    Record a named point in startup (only when --startup-profile is on).
+    """
+    if _startup_enabled:
+        _startup_marks.append((label, time.perf_counter()))
+
+
+def startup_report():
+    """
+    Print time-to-first-prompt and the steps that led up to it (once).
+    """
+    global _startup_enabled
+    if not _startup_enabled:
+        return
+    _startup_enabled = False
+    now = time.perf_counter()
+    print(f"\n[Startup] time to first prompt: {(now - _T0) * 1000:.1f} ms")
+    prev = _T0
+    for label, t in sorted(_startup_marks, key=lambda m: m[1]):
+        print(f"    {label:<20} +{(t - prev) * 1000:7.1f} ms")
+        prev = t
 
 
 class QuietLogger:
@@ -142,37 +285,208 @@ class QuietLogger:
 
 # ---------- Helper functions ----------
 
-def list_songs():
+# SongLibrary, DownloadCache and ClipCache are cut-down copies of the
+# classes in FinalProjectv2Holden.py, keeping only what this script calls.
+# This is the earlier version of the app and still has to run on its own,
+# so it doesn't import the newer one.
+
+class SongLibrary:
     """
-    List all audio files in SONG_DIR with allowed extensions.
+    In-memory index of the audio files in songs/.
 
-    Returns:
-        list[str]: Sorted list of filenames (not full paths).
+    The folder is scanned once; after that the song list and free names
+    are answered from memory. It stays current via inotify on Linux (or by
+    polling the folder's mtime elsewhere), and code that renames/creates
+    files calls sync() so the index is right at once.
     """
-    files = []
-    try:
-        for name in os.listdir(SONG_DIR):
-            ext = os.path.splitext(name)[1].lower()
-            if ext in AUDIO_EXTS:
-                files.append(name)
-        files.sort(key=str.lower)
-    except FileNotFoundError:
-        os.makedirs(SONG_DIR, exist_ok=True)
-    return files
 
+    # inotify event bits (see <sys/inotify.h>)
+    _IN_CLOSE_WRITE = 0x008
+    _IN_MOVED_FROM = 0x040
+    _IN_MOVED_TO = 0x080
+    _IN_CREATE = 0x100
+    _IN_DELETE = 0x200
+
+    def __init__(self, folder, exts, poll_interval=1.0):
+        self.folder = folder
+        self.exts = exts
+        self.poll_interval = poll_interval
+        self._files = {}   # name -> mtime
+        self._lower = set()
+        self._sorted = None
+        self._next = {}      # name -> next _N suffix to try
+        self._scanned = False
+        self._watching = False
+        self._lock = threading.Lock()
+
+    def _wanted(self, name):
+        return not name.startswith(".") and os.path.splitext(name)[1].lower() in self.exts
+
+    def _ensure_scanned(self):
+        if not self._scanned:
+            self.rescan()
+
+    def rescan(self):
+        files = {}
+        with os.scandir(self.folder) as it:
+            for entry in it:
+                if self._wanted(entry.name) and entry.is_file():
+                    files[entry.name] = entry.stat().st_mtime
+        with self._lock:
+            self._files = files
+            self._lower = {n.lower() for n in files}
+            self._sorted = None
+            self._scanned = True
+
+    def sync(self, *paths):
+        """Re-check specific files (after we renamed/created/deleted them)."""
+        self._ensure_scanned()
+        for path in paths:
+            if path and os.path.dirname(os.path.abspath(path)) == self.folder:
+                self._update(os.path.basename(path))
+
+    def _update(self, name):
+        if not self._wanted(name):
+            return
+        try:
+            mtime = os.stat(os.path.join(self.folder, name)).st_mtime
+        except OSError:
+            mtime = None
+        with self._lock:
+            if mtime is None:
+                if self._files.pop(name, None) is not None:
+                    self._lower.discard(name.lower())
+                    self._sorted = None
+            else:
+                if name not in self._files:
+                    self._lower.add(name.lower())
+                    self._sorted = None
+                self._files[name] = mtime
+
+    def list(self):
+        """
+        List all audio files in the folder (served from memory).
+
+        Returns:
+            list[str]: Sorted list of filenames (not full paths).
+        """
+        self._ensure_scanned()
+        with self._lock:
+            if self._sorted is None:
+                self._sorted = sorted(self._files, key=str.lower)
+            return list(self._sorted)
+
+    def claim(self, name):
+        """
+        Reserve a free file name in the folder and return its full path.
+
+        Tries name, name_1, name_2, ... starting from a per-name counter, so
+        repeated names don't re-probe from _1, and creates an empty
+        placeholder with O_EXCL so nobody else can take the same name.
+        Move the real file over it with os.replace(), or release() it.
+        """
+        self._ensure_scanned()
+        root, ext = os.path.splitext(name)
+        key = name.lower()
+        with self._lock:
+            i = self._next.get(key, 0)
+            while True:
+                candidate = name if i == 0 else f"{root}_{i}{ext}"
+                i += 1
+                if candidate.lower() in self._lower:
+                    continue
+                path = os.path.join(self.folder, candidate)
+                try:
+                    fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                except FileExistsError:
+                    continue
+                os.close(fd)
+                self._next[key] = i
+                self._files[candidate] = time.time()
+                self._lower.add(candidate.lower())
+                self._sorted = None
+                return path
+
+    def release(self, path):
+        """Give back a claimed name that was never filled in."""
+        try:
+            if os.path.getsize(path) == 0:
+                os.remove(path)
+        except OSError:
+            pass
+        self.sync(path)
+
+    def start_watching(self):
+        """Keep the index current in a background thread (inotify or polling)."""
+        if self._watching:
+            return
+        self._ensure_scanned()
+        self._watching = True
+        fd = self._inotify_fd()
+        if fd is not None:
+            threading.Thread(target=self._inotify_loop, args=(fd,), daemon=True).start()
+        else:
+            threading.Thread(target=self._poll_loop, daemon=True).start()
 
-def newest_mp3(dirpath):
+    def _inotify_fd(self):
+        if not sys.platform.startswith("linux"):
+            return None
+        try:
+            import ctypes
+            libc = ctypes.CDLL(None, use_errno=True)
+            fd = libc.inotify_init1(0)
+            if fd < 0:
+                return None
+            mask = (self._IN_CLOSE_WRITE | self._IN_MOVED_FROM | self._IN_MOVED_TO
+                    | self._IN_CREATE | self._IN_DELETE)
+            if libc.inotify_add_watch(fd, self.folder.encode(), mask) < 0:
+                os.close(fd)
+                return None
+            return fd
+        except (OSError, AttributeError):
+            return None
+
+    def _inotify_loop(self, fd):
+        header = struct.Struct("iIII")
+        while True:
+            try:
+                buf = os.read(fd, 64 * 1024)
+            except OSError:
+                self._poll_loop()
+                return
+            pos = 0
+            while pos + header.size <= len(buf):
+                _wd, _mask, _cookie, length = header.unpack_from(buf, pos)
+                raw = buf[pos + header.size:pos + header.size + length]
+                pos += header.size + length
+                name = raw.split(b"\0", 1)[0].decode(errors="surrogateescape")
+                if name:
+                    self._update(name)
+
+    def _poll_loop(self):
+        last = None
+        while True:
+            try:
+                mtime = os.stat(self.folder).st_mtime_ns
+            except OSError:
+                mtime = None
+            if last is not None and mtime != last:
+                self.rescan()
+            last = mtime
+            time.sleep(self.poll_interval)
+
+
+song_library = SongLibrary(SONG_DIR, AUDIO_EXTS)
+
+
+def list_songs():
     """
-    Return the newest .mp3 file in a directory, or None if there aren't any.
+    List all audio files in SONG_DIR with allowed extensions.
+
+    Returns:
+        list[str]: Sorted list of filenames (not full paths).
     """
-    mp3s = [
-        os.path.join(dirpath, f)
-        for f in os.listdir(dirpath)
-        if f.lower().endswith(".mp3")
-    ]
-    if not mp3s:
-        return None
-    return max(mp3s, key=lambda p: os.path.getmtime(p))
+    return song_library.list()
 
 
 def sanitize_player_name(name):
@@ -189,89 +503,504 @@ def sanitize_player_name(name):
     return name or "player"
 
 
-def unique_path(path):
+# ---------- Download cache ----------
+
+def normalize_query(query):
     """
-    Make a unique filepath if 'path' already exists by appending _1, _2, etc.
+    Normalize search text into a cache key.
+
+    Example:
+        "Hotel California  - Eagles" -> "hotel california eagles"
     """
-    if not os.path.exists(path):
-        return path
-    root, ext = os.path.splitext(path)
-    i = 1
-    while True:
-        candidate = f"{root}_{i}{ext}"
-        if not os.path.exists(candidate):
-            return candidate
-        i += 1
+    text = re.sub(r"[\W_]+", " ", query.lower())
+    return " ".join(text.split())
+
+
+def file_sha256(path):
+    """
+    Return the SHA-256 hex digest of a file's contents.
+    """
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
 
 
-def download_song(query):
+def link_or_copy(src, dst):
     """
-    Search YouTube and download audio as an mp3 into SONG_DIR.
+    Hardlink src to dst (no extra disk space), or copy if links aren't supported.
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+class DownloadCache:
+    """
+    Remembers what a search query already downloaded.
+
+    songs/.cache/index.json maps a normalized query to the YouTube video ID
+    and a content-hashed copy of the audio in songs/.cache/. A hit is
+    hardlinked back into songs/ instead of searching/downloading again, so
+    batch imports and "change song" edits reuse audio we already have.
+    The cache stays under max_bytes by dropping least recently used files.
+    """
+
+    def __init__(self, cache_dir, max_bytes):
+        self.cache_dir = cache_dir
+        self.index_path = os.path.join(cache_dir, "index.json")
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        data = {}
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception:
+            # missing or corrupt index: start empty
+            pass
+        if not isinstance(data, dict):
+            data = {}
+        self.queries = data.get("queries", {})
+        self.files = data.get("files", {})
+
+    def checkout(self, query, dest_dir):
+        """
+        Link the cached audio for a query into dest_dir.
+
+        Returns:
+            str | None: Path of the new link, or None on a cache miss.
+        """
+        key = normalize_query(query)
+        with self._lock:
+            entry = self.queries.get(key)
+            if not entry:
+                return None
+            cached = os.path.join(self.cache_dir, entry["file"])
+            if not os.path.exists(cached):
+                # somebody cleaned the folder by hand
+                self.queries.pop(key, None)
+                self.files.pop(entry["file"], None)
+                self._save()
+                return None
+            ext = os.path.splitext(cached)[1]
+            title = sanitize_player_name(entry.get("title", "")) or "song"
+            target = os.path.join(dest_dir, f"{title}.{uuid.uuid4().hex[:8]}{ext}")
+            try:
+                link_or_copy(cached, target)
+            except OSError as e:
+                print("[!] Cache read failed, downloading instead:", e)
+                return None
+            meta = self.files.setdefault(entry["file"], {"size": os.path.getsize(cached)})
+            meta["used"] = time.time()
+            self._save()
+            return target
+
+    def store(self, query, path, info):
+        """
+        Add a finished download to the cache (content-hashed, deduplicated).
+        """
+        try:
+            digest = file_sha256(path)
+        except OSError:
+            return
+        fname = digest[:24] + os.path.splitext(path)[1].lower()
+        cached = os.path.join(self.cache_dir, fname)
+        with self._lock:
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                if not os.path.exists(cached):
+                    link_or_copy(path, cached)
+            except OSError as e:
+                print("[!] Could not add download to cache:", e)
+                return
+            info = info or {}
+            self.queries[normalize_query(query)] = {
+                "id": info.get("id"),
+                "title": info.get("title", ""),
+                "file": fname,
+            }
+            self.files[fname] = {"size": os.path.getsize(cached), "used": time.time()}
+            self._evict()
+            self._save()
+
+    def _evict(self):
+        total = sum(f.get("size", 0) for f in self.files.values())
+        for fname in sorted(self.files, key=lambda n: self.files[n].get("used", 0)):
+            if total <= self.max_bytes:
+                break
+            total -= self.files.pop(fname).get("size", 0)
+            try:
+                os.remove(os.path.join(self.cache_dir, fname))
+            except OSError:
+                pass
+            for key in [k for k, e in self.queries.items() if e.get("file") == fname]:
+                del self.queries[key]
+
+    def _save(self):
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(self.index_path, "w", encoding="utf-8") as f:
+                json.dump({"queries": self.queries, "files": self.files}, f, indent=2)
+        except Exception as e:
+            print("[x] Failed to save download cache index:", e)
+
+
+download_cache = DownloadCache(CACHE_DIR, CACHE_MAX_MB * 1024 * 1024)
+
+
+# ---------- Downloading ----------
+
+def job_outtmpl(dest_dir, job_id=None):
+    """
+    Build a yt-dlp output template that is unique to one download, so two
+    downloads (even of the same video) never share a file name.
+
+    A fixed job_id (from ImportCheckpoint) gives a retried download the same
+    name, so yt-dlp picks up its leftover .part file instead of starting over.
+    """
+    token = job_id or uuid.uuid4().hex[:8]
+    return os.path.join(dest_dir, f"%(title)s.{token}.%(ext)s")
+
+
+def first_entry(info):
+    """
+    ytsearch results come back as a playlist; return the single video's info.
+    """
+    if info and info.get("entries") is not None:
+        return next((e for e in info["entries"] if e), None)
+    return info
+
+
+def downloaded_path(info, hooked):
+    """
+    Find the final audio file of a download from what yt-dlp reported.
 
     Args:
-        query (str): Search text like "Hotel California Eagles".
+        info (dict | None): Info dict returned by extract_info().
+        hooked (list[str]): Paths seen by the post-processor hook.
 
     Returns:
-        str | None: Full path to the downloaded mp3, or None on failure.
+        str | None: Full path to the finished file, or None.
     """
-    if YoutubeDL is None:
-        print("[x] yt-dlp missing. Install with: pip install yt-dlp")
+    for path in reversed(hooked):
+        if path and os.path.exists(path):
+            return path
+    info = first_entry(info)
+    if not info:
         return None
+    candidates = [d.get("filepath") for d in info.get("requested_downloads") or []]
+    candidates.append(info.get("filepath"))
+    for path in candidates:
+        if path and os.path.exists(path):
+            return path
+    return None
+
+
+def fmt_bytes(n):
+    """
+    Format a byte count like "3.2 MB".
+    """
+    n = float(n or 0)
+    for unit in ("B", "KB", "MB"):
+        if n < 1024:
+            return f"{n:.0f} {unit}" if unit == "B" else f"{n:.1f} {unit}"
+        n /= 1024
+    return f"{n:.1f} GB"
+
+
+class DownloadProgress:
+    """
+    Live progress line for one download, driven by yt-dlp's progress_hooks
+    (bytes, speed, ETA) and postprocessor_hooks (audio extraction).
+
+    Replaces the old static bar: the line shows percent, speed and ETA, then
+    the conversion step, and says "stalled" if no data arrived for
+    STALL_SECONDS. finish() appends the job's timings to download_timings.csv.
+    """
 
-    before_files = set(os.listdir(SONG_DIR))
+    def __init__(self, query):
+        self.query = query
+        self.started = time.time()
+        self.last_data = self.started
+        self.dl_start = self.dl_end = None
+        self.pp_start = self.pp_end = None
+        self.bytes = 0
+        self.total = None
+        self._last_draw = 0.0
+
+    def draw(self, text, force=False):
+        now = time.time()
+        if force or now - self._last_draw >= 0.1:
+            self._last_draw = now
+            print("\r" + text.ljust(70), end="", flush=True)
+
+    def on_progress(self, d):
+        """
+        yt-dlp progress hook: redraw the bar with percent, speed and ETA.
+        """
+        now = time.time()
+        status = d.get("status")
+        got = d.get("downloaded_bytes") or 0
+        if status == "downloading":
+            if self.dl_start is None:
+                self.dl_start = now
+            if got > self.bytes:
+                self.last_data = now
+            self.bytes = got
+            self.total = d.get("total_bytes") or d.get("total_bytes_estimate") or self.total
+            frac = min(1.0, self.bytes / self.total) if self.total else 0.0
+            speed = d.get("speed")
+            eta = d.get("eta")
+            text = f"[{'#' * int(frac * 10):.<10}] {frac * 100:3.0f}%  {fmt_bytes(self.bytes)}"
+            if speed:
+                text += f"  {fmt_bytes(speed)}/s"
+            if eta is not None:
+                text += f"  ETA {int(eta) // 60}:{int(eta) % 60:02d}"
+            self.draw(text)
+        elif status == "finished":
+            self.dl_end = now
+            self.bytes = d.get("total_bytes") or got or self.bytes
+            self.draw(f"[##########] 100%  {fmt_bytes(self.bytes)}", force=True)
+
+    def on_postprocess(self, d):
+        """
+        yt-dlp post-processor hook: show the conversion step.
+        """
+        now = time.time()
+        self.last_data = now
+        if d.get("status") == "started":
+            if self.pp_start is None:
+                self.pp_start = now
+            self.draw(f"[##########] Converting ({d.get('postprocessor', 'ffmpeg')})...", force=True)
+        elif d.get("status") == "finished":
+            self.pp_end = now
+
+    def stalled(self):
+        return time.time() - self.last_data > STALL_SECONDS
+
+    def finish(self, status, path=None):
+        """
+        Append this job's timings to DOWNLOAD_LOG.
+
+        Args:
+            status (str): "ok", "cache" or "failed".
+            path (str | None): Finished file, if any.
+        """
+        def span(a, b):
+            return f"{b - a:.2f}" if a and b else ""
+
+        end = time.time()
+        try:
+            new_file = not os.path.exists(DOWNLOAD_LOG)
+            with open(DOWNLOAD_LOG, "a", encoding="utf-8", newline="") as f:
+                w = csv.writer(f)
+                if new_file:
+                    w.writerow(["time", "query", "status", "search_s", "download_s",
+                                "convert_s", "total_s", "bytes", "file"])
+                w.writerow([
+                    time.strftime("%Y-%m-%d %H:%M:%S"), self.query, status,
+                    span(self.started, self.dl_start), span(self.dl_start, self.dl_end),
+                    span(self.pp_start, self.pp_end), span(self.started, end),
+                    self.bytes, os.path.basename(path) if path else "",
+                ])
+        except OSError:
+            pass
+
+
+def ydl_options(outtmpl, progress_hooks, postprocessor_hooks):
+    """
+    yt-dlp options for a download into `outtmpl`.
 
-    opts = {
-        "format": "bestaudio/best",
+    Args:
+        outtmpl (str): Output template (see job_outtmpl).
+        progress_hooks (list): Called with yt-dlp's download progress.
+        postprocessor_hooks (list): Called around the audio extraction.
+    """
+    return {
+        "format": "bestaudio/best" if AUDIO_CODEC == "mp3" else "bestaudio[ext=m4a]/bestaudio/best",
         "noplaylist": True,
         "default_search": "ytsearch1",
-        "outtmpl": os.path.join(SONG_DIR, "%(title)s.%(ext)s"),
+        "outtmpl": outtmpl,
+        "continuedl": True,
         "postprocessors": [{
             "key": "FFmpegExtractAudio",
-            "preferredcodec": "mp3",
+            "preferredcodec": AUDIO_CODEC,
             "preferredquality": "192",
         }],
+        "progress_hooks": progress_hooks,
+        "postprocessor_hooks": postprocessor_hooks,
         "quiet": True,
         "no_warnings": True,
         "noprogress": True,
         "logger": QuietLogger(),
     }
 
+
+class DownloadSession:
+    """
+    One YoutubeDL kept open for a whole batch download.
+
+    Building a YoutubeDL per song redoes option processing, extractor setup
+    and the HTTP connection pool every row; a session builds it once, on
+    the first fetch, and only swaps the per-job parts (output path and
+    hooks) before each download. Use it as a context manager so the
+    instance is closed when the batch ends.
+    """
+
+    def __init__(self):
+        self._ydl = None
+        self._hooks = {"progress": [], "post": []}
+
+    def fetch(self, query, outtmpl, progress_hooks, postprocessor_hooks):
+        """
+        Download `query` to `outtmpl` with this job's hooks.
+
+        Returns:
+            dict: yt-dlp's info dict (raises on failure, like extract_info).
+        """
+        if self._ydl is None:
+            # the instance's hooks forward to whichever job is running
+            def on_progress(d):
+                for hook in self._hooks["progress"]:
+                    hook(d)
+
+            def on_post(d):
+                for hook in self._hooks["post"]:
+                    hook(d)
+
+            self._ydl = YoutubeDL(ydl_options(outtmpl, [on_progress], [on_post]))
+        # yt-dlp keeps the parsed template as a dict (outtmpl_dict before 2022.11)
+        templates = getattr(self._ydl, "outtmpl_dict", None) or self._ydl.params["outtmpl"]
+        templates["default"] = outtmpl
+        self._hooks["progress"], self._hooks["post"] = progress_hooks, postprocessor_hooks
+        try:
+            return self._ydl.extract_info(query, download=True)
+        finally:
+            self._hooks["progress"], self._hooks["post"] = [], []
+
+    def close(self):
+        if self._ydl is not None:
+            self._ydl.__exit__(None, None, None)   # same as leaving `with YoutubeDL(...)`
+            self._ydl = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def download_song(query, job_id=None, session=None):
+    """
+    Search YouTube and download audio into SONG_DIR, in its native format
+    unless AUDIO_CODEC asks for a conversion.
+
+    The saved path is taken from yt-dlp itself (no folder scanning).
+    A query that was downloaded before is served from the download cache.
+
+    Args:
+        query (str): Search text like "Hotel California Eagles".
+        job_id (str | None): Stable output name for resumable batch rows.
+        session (DownloadSession | None): Batch session to download through
+            instead of a fresh YoutubeDL.
+
+    Returns:
+        str | None: Full path to the downloaded audio file, or None on failure.
+    """
+    progress = DownloadProgress(query)
+    cached = download_cache.checkout(query, SONG_DIR)
+    if cached:
+        song_library.sync(cached)
+        progress.finish("cache", cached)
+        print(f"\n[Cache] {query} -> {os.path.basename(cached)}")
+        return cached
+
+    if load_yt_dlp() is None:
+        return None
+
+    hooked = []
+
+    def on_postprocess(d):
+        if d.get("status") == "finished":
+            hooked.append(d.get("info_dict", {}).get("filepath"))
+
+    outtmpl = job_outtmpl(SONG_DIR, job_id)
+    progress_hooks = [progress.on_progress]
+    postprocessor_hooks = [on_postprocess, progress.on_postprocess]
+
     print(f"\n[Download] Searching + downloading: {query}")
-    print("[..........] Downloading...", end="", flush=True)
+    progress.draw("[..........] Searching...", force=True)
 
+    # Redraw once a second so a dead connection shows up as "stalled"
+    done = threading.Event()
+
+    def watch():
+        while not done.wait(1.0):
+            if progress.stalled():
+                progress.draw(f"[!] Stalled: no data for {STALL_SECONDS}+ s "
+                              f"({fmt_bytes(progress.bytes)} so far)", force=True)
+
+    threading.Thread(target=watch, daemon=True).start()
     try:
-        with YoutubeDL(opts) as ydl:
-            ydl.download([query])
+        if session:
+            info = session.fetch(query, outtmpl, progress_hooks, postprocessor_hooks)
+        else:
+            with YoutubeDL(ydl_options(outtmpl, progress_hooks, postprocessor_hooks)) as ydl:
+                info = ydl.extract_info(query, download=True)
     except Exception as e:
-        print("\r[xxxxxxxxxx] Download failed.         ")
+        done.set()
+        progress.finish("failed")
+        print("\r" + "[xxxxxxxxxx] Download failed.".ljust(70))
         print("[x] yt-dlp error:", e)
         return None
+    done.set()
+
+    print("\r" + "[##########] Download complete!".ljust(70))
 
-    print("\r[##########] Download complete!       ")
-
-    after_files = set(os.listdir(SONG_DIR))
-    new_candidates = [
-        f for f in after_files
-        if f.lower().endswith(".mp3") and f not in before_files
-    ]
-    if new_candidates:
-        full_paths = [os.path.join(SONG_DIR, f) for f in new_candidates]
-        newest = max(full_paths, key=lambda p: os.path.getmtime(p))
-        print(f"[✓] Saved: {newest}")
-        return newest
-
-    newest = newest_mp3(SONG_DIR)
-    if newest:
-        print(f"[✓] Saved (newest mp3 in folder): {newest}")
-        return newest
-
-    print("[x] Download finished but no mp3 found in 'songs' folder.")
+    path = downloaded_path(info, hooked)
+    if path:
+        download_cache.store(query, path, first_entry(info))
+        song_library.sync(path)
+        progress.finish("ok", path)
+        print(f"[✓] Saved: {path}")
+        return path
+
+    progress.finish("failed")
+    print("[x] Download finished but yt-dlp reported no audio file.")
     return None
 
 
+def strip_job_token(downloaded_path):
+    """
+    Rename "title.<token>.ext" (from job_outtmpl or DownloadCache.checkout)
+    back to "title.ext", claiming a free name if that one is taken.
+
+    Returns:
+        str | None: The final path, or None if the rename failed.
+    """
+    root, ext = os.path.splitext(os.path.basename(downloaded_path))
+    title = re.sub(r"\.[0-9a-f]{8}$", "", root)
+    if title == root:
+        return downloaded_path
+    target = song_library.claim((title or "song") + ext)
+    try:
+        os.replace(downloaded_path, target)
+        song_library.sync(downloaded_path, target)
+        print(f"[✓] Kept as: {os.path.basename(target)}")
+        return target
+    except Exception as e:
+        song_library.release(target)
+        print("[x] Rename failed:", e)
+        return None
+
+
 def rename_downloaded_file(downloaded_path):
     """
-    Ask user for player name and rename mp3 file to first_last.mp3.
+    Ask user for player name and rename the file to first_last.ext
+    (keeping the download's own extension). Enter keeps the video title,
+    minus the token that kept parallel downloads apart.
     """
     if not downloaded_path or not os.path.exists(downloaded_path):
         return
@@ -280,17 +1009,240 @@ def rename_downloaded_file(downloaded_path):
         "or press Enter to keep original name: "
     ).strip()
     if not player_name:
+        strip_job_token(downloaded_path)
         return
     base = sanitize_player_name(player_name)
-    target = os.path.join(SONG_DIR, base + ".mp3")
-    target = unique_path(target)
+    ext = os.path.splitext(downloaded_path)[1].lower() or ".mp3"
+    target = song_library.claim(base + ext)
     try:
-        os.rename(downloaded_path, target)
+        os.replace(downloaded_path, target)
+        song_library.sync(downloaded_path, target)
         print(f"[✓] Renamed to: {os.path.basename(target)}")
     except Exception as e:
+        song_library.release(target)
         print("[x] Rename failed:", e)
 
 
+# ---------- CSV import pipeline ----------
+#
+# parse -> validate -> dedupe -> download -> register. Each stage is a
+# generator that pulls one row at a time from the stage before it, so even
+# a league-wide CSV with thousands of rows is never held in memory, and a
+# row is only parsed once the previous one has been registered.
+
+def csv_signature(csv_path):
+    """
+    Return size + mtime of the CSV (resume info only applies to the same file).
+    """
+    st = os.stat(csv_path)
+    return f"{st.st_size}:{st.st_mtime_ns}"
+
+
+class ImportCheckpoint:
+    """
+    Per-row state of a batch import, kept in data/.import_checkpoint.jsonl.
+
+    Each state change (queued, downloading, converted, registered, or
+    failed with a reason) is appended as one JSON line, so an import that
+    is cut off anywhere leaves an exact record. The next run of the same
+    CSV skips registered rows, registers converted ones without
+    downloading again, and retries the rest under the same file name so
+    yt-dlp resumes their .part downloads.
+    """
+
+    def __init__(self, path, csv_path):
+        self.path = path
+        self.csv_path = os.path.abspath(csv_path)
+        self.signature = csv_signature(csv_path)
+        self.rows = {}
+        self.resumed = self._replay()
+        if not self.resumed:
+            with open(self.path, "w", encoding="utf-8") as f:
+                f.write(json.dumps({"csv": self.csv_path, "signature": self.signature}) + "\n")
+
+    def _replay(self):
+        """
+        Load an earlier checkpoint of this same CSV. Returns True if found.
+        """
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                header = json.loads(f.readline() or "{}")
+                if header.get("csv") != self.csv_path or header.get("signature") != self.signature:
+                    return False
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        break  # half-written last line
+                    row = int(entry.pop("row"))
+                    self.rows.setdefault(row, {}).update(entry)
+        except (OSError, ValueError):
+            return False
+        return True
+
+    def mark(self, row, state, **extra):
+        """
+        Record a new state for a row (extra keys: file, reason).
+        """
+        entry = {"row": row, "state": state}
+        entry.update(extra)
+        rec = self.rows.setdefault(row, {})
+        rec.update(extra)
+        rec["state"] = state
+        try:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry) + "\n")
+        except OSError as e:
+            print("[x] Could not update import checkpoint:", e)
+
+    def state(self, row):
+        return self.rows.get(row, {}).get("state")
+
+    def converted_file(self, row):
+        """
+        Return the finished download of a row that never got registered.
+        """
+        rec = self.rows.get(row, {})
+        path = rec.get("file")
+        if rec.get("state") == "converted" and path and os.path.exists(path):
+            return path
+        return None
+
+    def job_id(self, row):
+        """
+        Stable id per CSV row, so a retried download reuses its .part file.
+        """
+        return hashlib.sha1(f"{self.csv_path}|{row}".encode("utf-8")).hexdigest()[:8]
+
+    def failures(self):
+        return [(row, rec.get("reason", "?")) for row, rec in sorted(self.rows.items())
+                if rec.get("state") == "failed"]
+
+    def finish(self):
+        """
+        Delete the checkpoint once no row is left to retry.
+        """
+        if not self.failures():
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+
+
+def iter_csv_rows(csv_path, checkpoint=None):
+    """
+    Parse stage: yield (row_number, cells), skipping rows already registered.
+    """
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        for row_num, row in enumerate(csv.reader(f), start=1):
+            if checkpoint and checkpoint.state(row_num) == "registered":
+                continue
+            yield row_num, row
+
+
+def validate_rows(rows, checkpoint=None):
+    """
+    Validate stage: yield a job dict for every usable row.
+    """
+    for row_num, row in rows:
+        if not row or all(not field.strip() for field in row):
+            continue
+
+        if len(row) < 4:
+            print(f"  [Row {row_num}] Skipping – not enough columns: {row}")
+            if checkpoint:
+                checkpoint.mark(row_num, "failed", reason="not enough columns")
+            continue
+
+        first = row[0].strip()
+        last = row[1].strip()
+        song = row[2].strip()
+        artist = row[3].strip()
+        start_sec = 0
+        if len(row) >= 5:
+            try:
+                start_sec = int(row[4])
+            except ValueError:
+                start_sec = 0
+
+        if not (first and last and song and artist):
+            print(f"  [Row {row_num}] Skipping – missing data: {row}")
+            if checkpoint:
+                checkpoint.mark(row_num, "failed", reason="missing data")
+            continue
+
+        yield {
+            "row": row_num,
+            "name": f"{first} {last}",
+            "song": song,
+            "artist": artist,
+            "query": f"{song} {artist}",
+            "start": start_sec,
+        }
+
+
+def dedupe_rows(jobs):
+    """
+    Dedupe stage: skip rows that repeat an earlier player + song exactly.
+    Only a short hash per row is remembered.
+    """
+    seen = set()
+    for job in jobs:
+        key = normalize_query(f"{job['name']} {job['query']}")
+        digest = hashlib.sha1(key.encode("utf-8")).digest()[:8]
+        if digest in seen:
+            print(f"  [Row {job['row']}] Skipping – duplicate of an earlier row.")
+            continue
+        seen.add(digest)
+        yield job
+
+
+def download_rows(jobs, checkpoint, session=None):
+    """
+    Download stage: yield (job, audio_path or None) one row at a time.
+    Rows the checkpoint already has converted are not downloaded again;
+    the rest go through `session` (one YoutubeDL for the batch) if given.
+    """
+    for job in jobs:
+        print(f"\n  [Row {job['row']}] {job['name']} → {job['song']} / {job['artist']}")
+        audio_path = checkpoint.converted_file(job["row"])
+        if audio_path:
+            print(f"  [Resume] Using finished download {os.path.basename(audio_path)}")
+            yield job, audio_path
+            continue
+        checkpoint.mark(job["row"], "downloading")
+        audio_path = download_song(job["query"], job_id=checkpoint.job_id(job["row"]), session=session)
+        if audio_path:
+            checkpoint.mark(job["row"], "converted", file=audio_path)
+        else:
+            checkpoint.mark(job["row"], "failed", reason="download failed")
+        yield job, audio_path
+
+
+def register_row(job, audio_path, start_times, checkpoint):
+    """
+    Register stage: rename to first_last.ext and remember the start time.
+    """
+    if not audio_path:
+        print("  [x] Download failed for that row.")
+        return
+    base = sanitize_player_name(job["name"])
+    ext = os.path.splitext(audio_path)[1].lower() or ".mp3"
+    target = song_library.claim(base + ext)
+    try:
+        os.replace(audio_path, target)
+        song_library.sync(audio_path, target)
+        filename = os.path.basename(target)
+        print(f"  [✓] Saved as: {filename}")
+        if job["start"] > 0:
+            start_times[filename] = job["start"]
+        checkpoint.mark(job["row"], "registered")
+    except Exception as e:
+        song_library.release(target)
+        print(f"  [x] Rename failed: {e}")
+        checkpoint.mark(job["row"], "failed", reason=f"rename failed: {e}")
+
+
 def batch_download_from_csv(start_times):
     """
     Batch-download walk-up songs using a CSV file in ./data/batters.csv.
@@ -298,11 +1250,16 @@ def batch_download_from_csv(start_times):
     Expected CSV format (no header needed):
         FirstName,LastName,SongTitle,Artist,StartSeconds
 
-    For each row:
+    For each row (streamed through the pipeline above):
       - Builds a YouTube search query using song + artist.
-      - Downloads the audio as mp3 via download_song().
-      - Renames the mp3 to first_last.mp3 (safe format).
+      - Downloads the audio via download_song() (native format, see AUDIO_CODEC).
+      - Renames it to first_last.ext (safe format, same extension).
       - Stores start time in the start_times dict keyed by filename.
+
+    Every row's progress is recorded in an ImportCheckpoint, so an
+    interrupted run (Ctrl-C, crash, dropped network) picks up exactly where
+    it stopped next time, including half-finished downloads. All rows are
+    downloaded through one DownloadSession.
     """
     csv_path = os.path.join(DATA_DIR, "batters.csv")
     if not os.path.isfile(csv_path):
@@ -313,53 +1270,36 @@ def batch_download_from_csv(start_times):
 
     print(f"\n[Batch] Reading CSV: {csv_path}")
     try:
-        with open(csv_path, newline="", encoding="utf-8") as f:
-            reader = csv.reader(f)
-            for row_num, row in enumerate(reader, start=1):
-                if not row or all(not field.strip() for field in row):
-                    continue
-
-                if len(row) < 4:
-                    print(f"  [Row {row_num}] Skipping – not enough columns: {row}")
-                    continue
-
-                first = row[0].strip()
-                last = row[1].strip()
-                song = row[2].strip()
-                artist = row[3].strip()
-                start_sec = 0
-                if len(row) >= 5:
-                    try:
-                        start_sec = int(row[4])
-                    except ValueError:
-                        start_sec = 0
-
-                if not (first and last and song and artist):
-                    print(f"  [Row {row_num}] Skipping – missing data: {row}")
-                    continue
+        checkpoint = ImportCheckpoint(IMPORT_CHECKPOINT_FILE, csv_path)
+    except OSError as e:
+        print("[x] Could not open import checkpoint:", e)
+        return
+    if checkpoint.resumed:
+        done = sum(1 for rec in checkpoint.rows.values() if rec.get("state") == "registered")
+        print(f"[Batch] Resuming interrupted import ({done} row(s) already done).")
 
-                full_name = f"{first} {last}"
-                query = f"{song} {artist}"
-                print(f"\n  [Row {row_num}] {full_name} → {song} / {artist}")
-                mp3_path = download_song(query)
-                if mp3_path:
-                    base = sanitize_player_name(full_name)
-                    target = os.path.join(SONG_DIR, base + ".mp3")
-                    target = unique_path(target)
-                    try:
-                        os.rename(mp3_path, target)
-                        filename = os.path.basename(target)
-                        print(f"  [✓] Saved as: {filename}")
-                        if start_sec > 0:
-                            start_times[filename] = start_sec
-                    except Exception as e:
-                        print(f"  [x] Rename failed: {e}")
-                else:
-                    print("  [x] Download failed for that row.")
+    try:
+        rows = iter_csv_rows(csv_path, checkpoint)
+        jobs = dedupe_rows(validate_rows(rows, checkpoint))
+        with DownloadSession() as session:
+            for job, audio_path in download_rows(jobs, checkpoint, session):
+                register_row(job, audio_path, start_times, checkpoint)
+    except KeyboardInterrupt:
+        print("\n[!] Batch interrupted. Run 'b' again to resume.")
+        return
     except FileNotFoundError:
         print(f"[x] Could not open {csv_path}")
+        return
     except Exception as e:
         print("[x] Unexpected error while reading CSV:", e)
+        return
+
+    failures = checkpoint.failures()
+    checkpoint.finish()
+    if failures:
+        print(f"\n[!] {len(failures)} row(s) failed (run 'b' again to retry):")
+        for row, reason in failures:
+            print(f"    Row {row}: {reason}")
 
 
 def edit_song_menu(files, start_times):
@@ -417,13 +1357,11 @@ def edit_song_menu(files, start_times):
                 continue
             base = sanitize_player_name(new_player)
             root, ext = os.path.splitext(filename)
-            new_filename = base + ext
-            new_filename = os.path.basename(
-                unique_path(os.path.join(SONG_DIR, new_filename))
-            )
-            new_path = os.path.join(SONG_DIR, new_filename)
+            new_path = song_library.claim(base + ext)
+            new_filename = os.path.basename(new_path)
             try:
-                os.rename(full_path, new_path)
+                os.replace(full_path, new_path)
+                song_library.sync(full_path, new_path)
                 # Update references
                 old_filename = filename
                 filename = new_filename
@@ -433,6 +1371,7 @@ def edit_song_menu(files, start_times):
                     start_times[filename] = start_times.pop(old_filename)
                 print(f"[✓] Renamed to: {filename}")
             except Exception as e:
+                song_library.release(new_path)
                 print("[x] Rename failed:", e)
 
         elif sub_cmd == "2":
@@ -441,15 +1380,29 @@ def edit_song_menu(files, start_times):
             if not query:
                 print("No search text entered. Cancelled.")
                 continue
-            new_mp3 = download_song(query)
-            if not new_mp3:
+            new_audio = download_song(query)
+            if not new_audio:
                 print("Download failed; original file untouched.")
                 continue
+            root, ext = os.path.splitext(filename)
+            new_ext = os.path.splitext(new_audio)[1].lower() or ext
+            # same format: overwrite in place; otherwise the file takes the
+            # new extension and the old one is removed
+            target = full_path if new_ext == ext.lower() else song_library.claim(root + new_ext)
             try:
-                # overwrite existing path with new file
-                os.replace(new_mp3, full_path)
+                os.replace(new_audio, target)
+                if target != full_path:
+                    os.remove(full_path)
+                song_library.sync(new_audio, full_path, target)
+                old_filename = filename
+                filename = os.path.basename(target)
+                full_path = target
+                if old_filename != filename and old_filename in start_times:
+                    start_times[filename] = start_times.pop(old_filename)
                 print(f"[✓] Updated song for: {filename}")
             except Exception as e:
+                if target != full_path:
+                    song_library.release(target)
                 print("[x] Failed to overwrite with new audio:", e)
 
         elif sub_cmd == "3":
@@ -478,6 +1431,146 @@ def edit_song_menu(files, start_times):
             print("Unknown option.")
 
 
+# ---------- Pre-trimmed walk-up clips ----------
+
+class ClipCache:
+    """
+    Rendered walk-up clips in songs/.clips/.
+
+    Each clip is the song cut at its start time, capped at `seconds`,
+    loudness-normalized and faded in with FFmpeg, so playback always starts
+    at 0 with no seek. The clip name hashes the source file's size/mtime, the
+    start time and the settings, so changing the song or the start time
+    automatically points at a fresh clip; prune() deletes the old ones.
+    """
+
+    def __init__(self, clips_dir, seconds, fade):
+        self.clips_dir = clips_dir
+        self.seconds = seconds
+        self.fade = fade
+
+    def path_for(self, src, start):
+        """
+        Return where the clip for (src, start) lives, or None if src is missing.
+        """
+        try:
+            st = os.stat(src)
+        except OSError:
+            return None
+        key = f"{os.path.abspath(src)}|{st.st_size}|{st.st_mtime_ns}|{int(start)}|{self.seconds}|{self.fade}"
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+        base = os.path.splitext(os.path.basename(src))[0]
+        return os.path.join(self.clips_dir, f"{base}.{digest}.mp3")
+
+    def lookup(self, src, start):
+        """
+        Return the rendered clip for (src, start), or None if not made yet.
+        """
+        clip = self.path_for(src, start)
+        return clip if clip and os.path.exists(clip) else None
+
+    def remaining(self, src, start):
+        """
+        How long the clip for (src, start) runs.
+
+        Returns:
+            float: `seconds`, or less when the song ends sooner (duration
+            from ffprobe; `seconds` if it can't tell).
+        """
+        try:
+            result = subprocess.run(
+                ["ffprobe", "-v", "error", "-show_entries", "format=duration",
+                 "-of", "default=noprint_wrappers=1:nokey=1", src],
+                capture_output=True, text=True, timeout=30)
+            left = float(result.stdout.strip()) - int(start)
+        except (OSError, subprocess.SubprocessError, ValueError):
+            return float(self.seconds)
+        return min(float(self.seconds), left) if left > 0 else float(self.seconds)
+
+    def render(self, src, start):
+        """
+        Cut, normalize and fade one clip with FFmpeg.
+
+        Returns:
+            str | None: Path to the clip, or None if FFmpeg failed.
+        """
+        clip = self.path_for(src, start)
+        if clip is None:
+            return None
+        if os.path.exists(clip):
+            return clip
+        os.makedirs(self.clips_dir, exist_ok=True)
+        # near the end of a song the clip is shorter; the fade-out has to end with it
+        length = self.remaining(src, start)
+        fade_out = min(2.0, length / 4)
+        filters = ",".join([
+            "loudnorm=I=-14:TP=-1.5:LRA=11",
+            f"afade=t=in:st=0:d={self.fade}",
+            f"afade=t=out:st={length - fade_out:.2f}:d={fade_out:.2f}",
+        ])
+        tmp = clip + ".part.mp3"
+        cmd = [
+            "ffmpeg", "-hide_banner", "-loglevel", "error", "-y",
+            "-ss", str(int(start)), "-i", src, "-t", str(self.seconds),
+            "-af", filters, "-ar", "44100", "-c:a", "libmp3lame", "-q:a", "2",
+            tmp,
+        ]
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+        except (OSError, subprocess.SubprocessError) as e:
+            print(f"[x] Clip render failed for {os.path.basename(src)}: {e}")
+            return None
+        if result.returncode != 0 or not os.path.exists(tmp):
+            print(f"[x] Clip render failed for {os.path.basename(src)}: {result.stderr.strip()}")
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            return None
+        os.replace(tmp, clip)
+        return clip
+
+    def render_songs(self, files, start_times):
+        """
+        Render any missing clips for the songs in ./songs and prune stale ones.
+        """
+        self.prune(files, start_times)
+        todo = []
+        for name in files:
+            src = os.path.join(SONG_DIR, name)
+            if not self.lookup(src, start_times.get(name, 0)):
+                todo.append((src, start_times.get(name, 0)))
+        if not todo:
+            return
+        if shutil.which("ffmpeg") is None:
+            print("[!] FFmpeg not found; songs will seek to their start time instead.")
+            return
+        print(f"[Clips] Rendering {len(todo)} walk-up clip(s)...")
+        for src, start in todo:
+            self.render(src, start)
+
+    def prune(self, files, start_times):
+        """
+        Delete clips that no longer match any song + start time.
+        """
+        if not os.path.isdir(self.clips_dir):
+            return
+        keep = set()
+        for name in files:
+            clip = self.path_for(os.path.join(SONG_DIR, name), start_times.get(name, 0))
+            if clip:
+                keep.add(os.path.basename(clip))
+        for name in os.listdir(self.clips_dir):
+            if name not in keep:
+                try:
+                    os.remove(os.path.join(self.clips_dir, name))
+                except OSError:
+                    pass
+
+
+clip_cache = ClipCache(CLIPS_DIR, CLIP_SECONDS, CLIP_FADE)
+
+
 # ---------- UI helpers ----------
 
 def print_menu(files, start_times):
@@ -519,32 +1612,51 @@ def splash_screen():
     os.system("cls" if os.name == "nt" else "clear")
 
 
+def parse_args(argv=None):
+    """
+    Read command-line options.
+
+    Args:
+        argv (list[str] | None): Arguments to parse (default: sys.argv).
+
+    Returns:
+        argparse.Namespace: no_splash and startup_profile flags.
+    """
+    parser = argparse.ArgumentParser(description="Baseball Walk-Up Song Manager")
+    parser.add_argument("--no-splash", action="store_true",
+                        help="skip the hawk splash screen")
+    parser.add_argument("--startup-profile", action="store_true",
+                        help="print time-to-first-prompt with a per-step breakdown")
+    return parser.parse_args(argv)
+
+
 # ---------- Main ----------
 
-def main():
+def main(argv=None):
     """
     Main entry point for the walk-up song manager.
 
     Handles the input loop, playback controls, and download options.
     """
-    splash_screen()
+    global _startup_enabled
+    args = parse_args(argv)
+    _startup_enabled = args.startup_profile
+    startup_mark("modules imported")
+
+    # VLC loads in the background, during the splash / first menu draw
+    get_player = start_vlc_player()
+    if not args.no_splash:
+        splash_screen()
+    song_library.start_watching()
+    startup_mark("songs indexed")
 
     # In-memory mapping: filename -> start time in seconds
     start_times = {}
 
-    if vlc is None:
-        player = None
-        print("[!] VLC Python bindings not available. Playback will be disabled.")
-    else:
-        try:
-            player = vlc.MediaPlayer()
-        except Exception as e:
-            print("[x] Could not initialize VLC MediaPlayer:", e)
-            player = None
-
     while True:
         files = list_songs()
         print_menu(files, start_times)
+        startup_report()
 
         try:
             cmd = input("\nSelect: ").strip()
@@ -552,6 +1664,9 @@ def main():
             print("\nBye.")
             break
 
+        # By the time a command is typed VLC is normally up already
+        player = get_player()
+
         if not cmd:
             continue
 
@@ -622,11 +1737,13 @@ def main():
         # Batch from CSV
         if low == "b":
             batch_download_from_csv(start_times)
+            clip_cache.render_songs(list_songs(), start_times)
             continue
 
         # Edit / rename / change song / start time
         if low == "e":
             edit_song_menu(files, start_times)
+            clip_cache.render_songs(list_songs(), start_times)
             continue
 
         # Play by number
@@ -648,10 +1765,16 @@ def main():
 
             start_sec = start_times.get(filename, 0)
 
+            # A rendered clip already starts at the right spot: no seek needed
+            clip = clip_cache.lookup(path, start_sec)
+
             try:
                 player.stop()
-                player.set_media(vlc.Media(path))
+                player.set_media(vlc.Media(clip or path))
                 player.play()
+                if clip:
+                    print(f"▶ Playing: {filename} (clip)")
+                    continue
                 time.sleep(0.4)  # brief delay so VLC actually starts
                 if start_sec > 0:
                     try: